@@ -0,0 +1,241 @@
+import gc
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import contextlib
+import statistics
+import subprocess
+import tracemalloc
+
+import src.sim as sim
+import src.engine.game_state as game_state
+import src.engine.logic as logic
+from src.player.upgrades import UpgradePool, get_upgrade_pool
+from src.player.pickups import update_heart_effects, draw_heart_effects
+from benchmarks.world import SyntheticWorld, scaling_exponent
+
+# Base scene at scale 1; every size in the sweep multiplies all three.
+BASE_ENEMIES_PER_TYPE = 5
+BASE_BULLETS = 100
+BASE_HEARTS = 2
+
+
+def bench_enemy_pool_update(world):
+    world.build()
+    return world.enemy_pool.update, 1
+
+
+def bench_bullet_pool_update(world):
+    world.build()
+    return game_state.bullet_pool.update, 1
+
+
+def bench_collision_grid(world):
+    """The narrow phase as BulletPool.update runs it: each player bullet against its grid candidates."""
+    world.build()
+    bullets = world.player_bullets()
+    grid = game_state.enemy_grid
+
+    def run():
+        for bullet in bullets:
+            size = bullet.size
+            for enemy in grid.query(bullet.x - size, bullet.y - size, bullet.x + size, bullet.y + size):
+                bullet.check_and_apply_collision(enemy)
+    return run, len(bullets)
+
+
+def bench_collision_brute(world):
+    """Every player bullet against every enemy: the O(bullets x enemies) path the grid avoids."""
+    world.build()
+    bullets = world.player_bullets()
+    enemies = list(game_state.enemies)
+
+    def run():
+        for bullet in bullets:
+            for enemy in enemies:
+                bullet.check_and_apply_collision(enemy)
+    return run, len(bullets)
+
+
+def bench_spawn_enemy(world):
+    """Spawn as many enemies as the scene holds into an empty pool with warm free lists."""
+    world.build()
+    world.enemy_pool.clear()
+    count = world.enemy_count
+
+    def run():
+        for _ in range(count):
+            world.enemy_pool.spawn_enemy()
+    return run, count
+
+
+def bench_update_hearts(world):
+    world.build()
+    return logic.update_hearts, 1
+
+
+def bench_heart_particles(world):
+    """One frame of heart sparkles: age and refill them, then build their batched blits."""
+    world.build()
+    render_queue = game_state.render_queue
+
+    def run():
+        update_heart_effects()
+        draw_heart_effects(game_state.screen)
+        render_queue.entries.clear()
+    return run, len(game_state.particles)
+
+
+def bench_get_random_upgrades(world):
+    world.build()
+    upgrade_pool = get_upgrade_pool()
+    player = game_state.player
+    return lambda: upgrade_pool.get_random_upgrades(3, player), 1
+
+
+def bench_upgrade_pool_init(world):
+    """Building the pool from scratch; the game only does it once, on the first level-up."""
+    world.build()
+    return UpgradePool, 1
+
+
+BENCHMARKS = {
+    "enemy_pool_update": bench_enemy_pool_update,
+    "bullet_pool_update": bench_bullet_pool_update,
+    "collision_grid": bench_collision_grid,
+    "collision_brute": bench_collision_brute,
+    "spawn_enemy": bench_spawn_enemy,
+    "update_hearts": bench_update_hearts,
+    "heart_particles": bench_heart_particles,
+    "get_random_upgrades": bench_get_random_upgrades,
+    "upgrade_pool_init": bench_upgrade_pool_init,
+}
+
+
+def measure(benchmark, world, repeat):
+    """
+    Time `repeat` runs of one benchmark, each on a freshly built scene, with the GC off.
+    Returns timing in ms per run and per operation, plus the allocations of one extra traced run.
+    """
+    samples = []
+    operations = 1
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            func, operations = benchmark(world)
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+            gc.enable()
+
+        # tracemalloc slows everything down, so allocations come from a separate run.
+        func, operations = benchmark(world)
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        snapshot_before = tracemalloc.take_snapshot()
+        func()
+        snapshot_after = tracemalloc.take_snapshot()
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    allocated_blocks = sum(max(0, stat.count_diff) for stat in snapshot_after.compare_to(snapshot_before, "lineno"))
+    best = min(samples)
+    return {
+        "operations": operations,
+        "ms_min": round(best, 4),
+        "ms_median": round(statistics.median(samples), 4),
+        "us_per_op": round(best * 1000 / operations, 3) if operations else None,
+        "alloc_net_bytes": after - before,
+        "alloc_peak_bytes": peak - before,
+        "alloc_blocks": allocated_blocks,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales, names, repeat=15, seed=0, width=1920, height=1080, bullet_backend="objects"):
+    """Run every named benchmark at every scale; returns the JSON-ready results dict."""
+    enemy_pool = sim.setup(width, height, seed, bullet_backend)
+    results = {
+        "meta": {
+            "git_revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "bullet_backend": bullet_backend,
+            "repeat": repeat,
+            "seed": seed,
+            "screen": [width, height],
+        },
+        "benchmarks": {},
+    }
+    for name in names:
+        points = []
+        for scale in scales:
+            world = SyntheticWorld(enemy_pool, BASE_ENEMIES_PER_TYPE * scale, BASE_BULLETS * scale,
+                                   BASE_HEARTS * scale, seed=seed)
+            point = {"scale": scale, "enemies": world.enemy_count, "bullets": world.bullets, "hearts": world.hearts}
+            point.update(measure(BENCHMARKS[name], world, repeat))
+            points.append(point)
+            print(f"{name:22s} x{scale:<4d} {point['ms_min']:9.3f} ms  {point['us_per_op']:9.3f} us/op  "
+                  f"{point['alloc_blocks']:7d} blocks", file=sys.stderr)
+        results["benchmarks"][name] = {
+            "points": points,
+            "scaling_exponents": scaling_exponent(scales, [point["ms_min"] for point in points]),
+        }
+        world.clear()
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_entities",
+        description="Time the hot entity paths on synthetic scenes of increasing size and write the results as JSON."
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help=f"scene sizes; scale s has {BASE_ENEMIES_PER_TYPE}*s enemies of each type, "
+                             f"{BASE_BULLETS}*s bullets and {BASE_HEARTS}*s hearts")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS),
+                        help="benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=15, help="timed runs per point; the fastest is reported")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic scenes")
+    parser.add_argument("--bullets", choices=("objects", "numpy"), default="objects", help="bullet backend")
+    parser.add_argument("--out", metavar="PATH", help="write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # The game prints as it loads and levels up; keep stdout clean for the JSON.
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run(args.scales, args.only, repeat=args.repeat, seed=args.seed, bullet_backend=args.bullets)
+    text = json.dumps(results, indent=2)
+    if args.out:
+        directory = os.path.dirname(args.out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
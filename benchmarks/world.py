@@ -0,0 +1,106 @@
+import math
+
+import src.engine.game_state as game_state
+import src.engine.rng as rng
+from src.engine.projectiles import PlayerBasicBullet, BasicEnemyBullet
+from src.player.pickups import HeartEffect
+import src.engine.constants as constants
+
+
+class SyntheticWorld:
+    """
+    Fills game_state with a fixed, seeded scene for benchmarking: `enemies_per_type` enemies of
+    every EnemyPool type scattered around the player, `bullets` bullets (half the player's, half
+    enemy shots) and `hearts` heart pickups. build() can be called again to restore the scene
+    after a benchmark has moved or killed things.
+    """
+    def __init__(self, enemy_pool, enemies_per_type, bullets, hearts, seed=0):
+        self.enemy_pool = enemy_pool
+        self.enemies_per_type = enemies_per_type
+        self.bullets = bullets
+        self.hearts = hearts
+        self.seed = seed
+
+    @property
+    def enemy_count(self):
+        return self.enemies_per_type * len(self.enemy_pool.enemy_classes)
+
+    def clear(self):
+        self.enemy_pool.clear()
+        game_state.bullet_pool.clear()
+        game_state.pattern_emitter.clear()
+        game_state.hearts.clear()
+        game_state.particles.clear()
+        game_state.damage_numbers.clear()
+        game_state.experience_updates.clear()
+
+    def build(self):
+        self.clear()
+        rng.seed_all(self.seed)
+        # A fresh player every build, and one that can't die halfway through a benchmark.
+        player = game_state.player
+        player.reset()
+        player.x = game_state.screen_width / 2
+        player.y = game_state.screen_height / 2
+        player.max_health = player.health = 1e12
+        game_state.game_over = False
+        game_state.in_game_ticks_elapsed = constants.FPS * 60
+        scatter = rng.stream("spawns")
+        width, height = game_state.screen_width, game_state.screen_height
+
+        for enemy_class in self.enemy_pool.enemy_classes:
+            free_list = self.enemy_pool.free_lists[enemy_class]
+            for _ in range(self.enemies_per_type):
+                x = scatter.uniform(0, width)
+                y = scatter.uniform(0, height)
+                if free_list:
+                    enemy = free_list.pop()
+                    enemy.reset(x, y, game_state.enemy_scaling)
+                else:
+                    enemy = enemy_class(x, y, game_state.enemy_scaling)
+                enemy.active = True
+                # Enough health that bullets never finish anyone off mid-benchmark.
+                enemy.health = 1e12
+                game_state.enemies.append(enemy)
+
+        bullet_pool = game_state.bullet_pool
+        player_bullets = self.bullets // 2
+        for i in range(self.bullets):
+            x = scatter.uniform(0, width)
+            y = scatter.uniform(0, height)
+            angle = scatter.uniform(0, 360)
+            if i < player_bullets:
+                bullet_pool.get_bullet(PlayerBasicBullet, x, y, angle, 1.0, 1.0, 1.0, 1)
+            else:
+                bullet_pool.get_bullet(BasicEnemyBullet, x, y, angle)
+
+        for _ in range(self.hearts):
+            pos = (scatter.randint(25, width - 25), scatter.randint(25, height - 25))
+            game_state.hearts.append(HeartEffect(pos, constants.PINK, particle_count=20))
+
+        game_state.enemy_grid.rebuild(game_state.enemies)
+
+    def player_bullets(self):
+        """
+        Standalone player bullets at the same kind of seeded positions as the scene's, for
+        timing PlayerBaseBullet collision checks directly (the NumPy pool has no bullet objects).
+        """
+        scatter = rng.stream("patterns")
+        width, height = game_state.screen_width, game_state.screen_height
+        return [PlayerBasicBullet(scatter.uniform(0, width), scatter.uniform(0, height), scatter.uniform(0, 360),
+                                  1.0, 1.0, 1.0, 1)
+                for _ in range(self.bullets // 2)]
+
+
+def scaling_exponent(sizes, times):
+    """
+    Slope of log(time) against log(size) between each pair of neighbouring points:
+    ~1 means linear, ~2 quadratic. None where either point is too small to measure.
+    """
+    exponents = []
+    for (size_a, time_a), (size_b, time_b) in zip(zip(sizes, times), zip(sizes[1:], times[1:])):
+        if size_a <= 0 or size_b <= 0 or size_a == size_b or time_a <= 0 or time_b <= 0:
+            exponents.append(None)
+        else:
+            exponents.append(round(math.log(time_b / time_a) / math.log(size_b / size_a), 3))
+    return exponents
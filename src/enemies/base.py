@@ -2,8 +2,10 @@ import math
 from abc import ABC, abstractmethod
 # from src.projectiles import BasicEnemyHomingBullet, BaseBullet, Alignment, TankEnemyBullet, BasicEnemyBullet, SniperEnemyBullet
 import src.engine.constants as constants
-# import src.game_state as game_state
+import src.engine.game_state as game_state
 from src.engine.helpers import get_ui_scaling_factor
+from src.ui.drawing import render_health_bar
+from src.enemies.sprites import get_enemy_sprites
 
 ui_scaling_factor = get_ui_scaling_factor()
 class BaseEnemy(ABC):
@@ -26,7 +28,10 @@ class BaseEnemy(ABC):
         self.death_animation_start_tick = 0
         self.active = True
         
+        self._max_health = math.floor(self.base_health * self.scaling)
         self._health = self.max_health
+        self.health_bar = None  # Cached bar surface, rebuilt when health_bar_health goes stale
+        self.health_bar_health = None
 
     @property
     @abstractmethod
@@ -40,7 +45,8 @@ class BaseEnemy(ABC):
         
     @property
     def max_health(self):
-        return math.floor(self.base_health * self.scaling)
+        # Only changes with scaling, which is set in __init__/reset.
+        return self._max_health
         
     @property
     def health(self):
@@ -63,13 +69,7 @@ class BaseEnemy(ABC):
         self._health -= damage
 
         # Add damage number (existing code)
-        game_state.damage_numbers.append({
-            "x": self.x,
-            "y": self.y,
-            "value": damage,
-            "timer": 20,
-            "color": constants.PURPLE   
-        })
+        game_state.damage_numbers.add(self.x, self.y, damage, constants.PURPLE, 20, target=self)
 
         if self._health <= 0:
             if not self.dying:
@@ -105,65 +105,37 @@ class BaseEnemy(ABC):
         self.y = max(20, min(self.y, game_state.screen_height - self.inner_size // 2 - constants.experience_bar_height))
     
     def draw(self):
-        import pygame
-        import src.engine.game_state as game_state
-        import src.engine.constants as constants
-        from src.ui.drawing import draw_health_bar
-        
-        screen = game_state.screen
+        """Queue this enemy's blits on game_state.render_queue; EnemyPool.draw flushes them."""
+        render_queue = game_state.render_queue
+        sprites = get_enemy_sprites(self)
 
-        # Determine alpha and death progress if dying
-        alpha = 255
+        # Pick the alive sprite, or the baked death frame for how far the animation has got.
         if self.dying:
             death_duration_ticks = self.death_animation_duration * constants.FPS
             death_progress = (self.current_tick - self.death_animation_start_tick) / death_duration_ticks
-            alpha = int(255 * (1 - death_progress))
-            alpha = max(0, min(255, alpha))
-            # Compute a scale factor that decreases from 1 to 0
-            scale_factor = max(0, 1 - death_progress)
-            # Compute new sizes for the enemy surfaces
-            new_outline_size = max(1, int(self.outline_size * scale_factor))
-            new_inner_size = max(1, int(self.inner_size * scale_factor))
+            sprite = sprites.death_frame(death_progress)
+            if sprite is None:
+                return
         else:
-            new_outline_size = self.outline_size
-            new_inner_size = self.inner_size
-
-        # Create surfaces with current sizes
-        outline_surface = pygame.Surface((new_outline_size, new_outline_size), pygame.SRCALPHA)
-        inner_surface = pygame.Surface((new_inner_size, new_inner_size), pygame.SRCALPHA)
-
-        # Prepare colors with current alpha
-        outline_color = self.outline_color
-        if isinstance(outline_color, (list, tuple)) and len(outline_color) == 3:
-            outline_color = (*outline_color, alpha)
-        outline_surface.fill(outline_color)
-
-        inner_color = self.inner_color
-        if isinstance(inner_color, (list, tuple)) and len(inner_color) == 3:
-            inner_color = (*inner_color, alpha)
-        inner_surface.fill(inner_color)
-
-        # Calculate positions
-        outline_pos = (self.x - new_outline_size // 2, self.y - new_outline_size // 2)
-        inner_pos = (self.x - new_inner_size // 2, self.y - new_inner_size // 2)
+            sprite = sprites.alive
 
-        # Blit the surfaces to the main screen.
-        screen.blit(outline_surface, outline_pos)
-        screen.blit(inner_surface, inner_pos)
+        surface, offset = sprite
+        render_queue.push(surface, (self.x - offset, self.y - offset))
 
         # Draw the health bar only if the enemy is still alive.
         if not self.dying:
             health_bar_x = self.x - self.inner_size // 2
             health_bar_y = self.y - self.inner_size // 2 - 12
-            draw_health_bar(
-                health_bar_x,
-                health_bar_y,
-                self.health,
-                self.max_health,
-                constants.TRANSLUCENT_RED,
-                bar_width=self.inner_size,
-                bar_height=5
-            )
+            if self.health_bar_health != self._health:
+                self.health_bar = render_health_bar(
+                    self._health,
+                    self._max_health,
+                    constants.TRANSLUCENT_RED,
+                    bar_width=self.inner_size,
+                    bar_height=5
+                )
+                self.health_bar_health = self._health
+            render_queue.push(self.health_bar, (health_bar_x, health_bar_y))
             
     def reset(self, x, y, scaling):
         """
@@ -177,5 +149,7 @@ class BaseEnemy(ABC):
         self.current_tick = 0
         self.dying = False
         self.death_animation_start_tick = 0
+        self._max_health = math.floor(self.base_health * self.scaling)
         self._health = self.max_health
+        self.health_bar_health = None
         self.active = True  # Mark enemy as active again
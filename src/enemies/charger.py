@@ -184,8 +184,8 @@ class ChargerEnemy(BaseEnemy):
         self.vy = 0.0
         self.acceleration = constants.CHARGER_ACCELERATION * ui_scaling_factor
         self.max_speed = constants.CHARGER_MAX_SPEED * ui_scaling_factor
-        self.outline_size = constants.CHARGER_ENEMY_OUTLINE_SIZE
-        self.inner_size = constants.CHARGER_ENEMY_INNER_SIZE
+        self.outline_size = constants.CHARGER_ENEMY_OUTLINE_SIZE * ui_scaling_factor
+        self.inner_size = constants.CHARGER_ENEMY_INNER_SIZE * ui_scaling_factor
         self.outline_color = constants.CHARGER_ENEMY_OUTLINE_COLOR
         self.inner_color = constants.CHARGER_ENEMY_INNER_COLOR
         self.charge_cooldown = 0
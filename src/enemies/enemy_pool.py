@@ -1,4 +1,5 @@
-import random
+from src.engine.rng import stream
+from itertools import accumulate
 import src.engine.game_state as game_state
 import src.engine.constants as constants
 from src.enemies.basic import BasicEnemy
@@ -8,9 +9,17 @@ from src.enemies.sniper import SniperEnemy
 from src.engine.helpers import get_ui_scaling_factor
 
 ui_scaling_factor = get_ui_scaling_factor()
+spawn_rng = stream("spawns")
 
 class EnemyPool:
-    def __init__(self, max_enemies=50):
+    """
+    Pool of enemy instances.
+    Spawning picks a class from precomputed cumulative weights, then reuses a free enemy of
+    that class or builds a new one. Enemies that finish dying go back to their class's free
+    list. game_state.enemies is the dense list of live enemies; finished enemies are
+    swap-removed from it in O(1).
+    """
+    def __init__(self):
         # Define enemy types along with their spawn weights.
         self.enemy_types = [
             (BasicEnemy, 0.6),
@@ -18,71 +27,69 @@ class EnemyPool:
             (ChargerEnemy, 0.2),
             (SniperEnemy, 0.2)
         ]
-        self.pool = []
-        for _ in range(max_enemies):
-            enemy_class = random.choices(
-                population=[enemy_type for enemy_type, _ in self.enemy_types],
-                weights=[weight for _, weight in self.enemy_types],
-                k=1
-            )[0]
-            self.pool.append(enemy_class(0, 0, 1))  # Default off-screen, inactive
+        self.enemy_classes = [enemy_type for enemy_type, _ in self.enemy_types]
+        self.cum_weights = list(accumulate(weight for _, weight in self.enemy_types))
+        self.free_lists = {enemy_class: [] for enemy_class in self.enemy_classes}
+
+    def choose_enemy_class(self):
+        return spawn_rng.choices(self.enemy_classes, cum_weights=self.cum_weights, k=1)[0]
     
     def spawn_enemy(self):
         # Determine spawn position based on a random side.
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = spawn_rng.choice(["top", "bottom", "left", "right"])
         if side == "top":
-            x = random.randint(0, game_state.screen_width)
+            x = spawn_rng.randint(0, game_state.screen_width)
             y = -40 * ui_scaling_factor
         elif side == "bottom":
-            x = random.randint(0, game_state.screen_width)
+            x = spawn_rng.randint(0, game_state.screen_width)
             y = game_state.screen_height + 40 * ui_scaling_factor
         elif side == "left":
             x = -40 * ui_scaling_factor
-            y = random.randint(0, game_state.screen_height)
+            y = spawn_rng.randint(0, game_state.screen_height)
         else:  # "right"
             x = game_state.screen_width + 40 * ui_scaling_factor
-            y = random.randint(0, game_state.screen_height)
-        
-        # First, filter the pool for inactive enemies.
-        inactive_enemies = [enemy for enemy in self.pool if not getattr(enemy, 'active', False)]
-        if inactive_enemies:
-            # Determine weights for each inactive enemy based on its type.
-            weights = []
-            for enemy in inactive_enemies:
-                # Find the weight for this enemy's type from self.enemy_types.
-                for enemy_class, weight in self.enemy_types:
-                    if isinstance(enemy, enemy_class):
-                        weights.append(weight)
-                        break
-                else:
-                    weights.append(1)  # Default weight if not found.
-            chosen_enemy = random.choices(inactive_enemies, weights=weights, k=1)[0]
-            chosen_enemy.reset(x, y, game_state.enemy_scaling)
-            chosen_enemy.active = True  # Mark it as in use.
-            game_state.enemies.append(chosen_enemy)
-            return
-
-        # If no inactive enemy is available, create a new one using weighted selection.
-        EnemyClass = random.choices(
-            population=[enemy_type for enemy_type, _ in self.enemy_types],
-            weights=[weight for _, weight in self.enemy_types],
-            k=1
-        )[0]
+            y = spawn_rng.randint(0, game_state.screen_height)
         
-        enemy = EnemyClass(x, y, game_state.enemy_scaling)
-        enemy.active = True  # Mark new enemy as active.
+        enemy_class = self.choose_enemy_class()
+        free_list = self.free_lists[enemy_class]
+        if free_list:
+            enemy = free_list.pop()
+            enemy.reset(x, y, game_state.enemy_scaling)
+        else:
+            enemy = enemy_class(x, y, game_state.enemy_scaling)
+        enemy.active = True  # Mark it as in use.
         game_state.enemies.append(enemy)
-        self.pool.append(enemy)  # Add new enemy to the pool for reuse.
+
+    def _release(self, enemy):
+        enemy.active = False
+        self.free_lists[type(enemy)].append(enemy)
     
     def update(self):
         # Update each enemy and remove those that have finished dying.
-        for enemy in game_state.enemies[:]:
-            enemy.update(game_state.player.x, game_state.player.y, game_state)
+        enemies = game_state.enemies
+        player = game_state.player
+        i = 0
+        while i < len(enemies):
+            enemy = enemies[i]
+            enemy.update(player.x, player.y, game_state)
             # Check if the enemy is dying and its death animation is complete.
             if enemy.dying and (enemy.current_tick - enemy.death_animation_start_tick) > enemy.death_animation_duration * constants.FPS:
-                game_state.enemies.remove(enemy)
+                # Swap-remove: the last enemy (not yet updated this tick) takes this slot.
+                last = enemies.pop()
+                if last is not enemy:
+                    enemies[i] = last
+                self._release(enemy)
+                continue
+            i += 1
+
+    def clear(self):
+        """Return every live enemy to the free lists (used when a run ends or restarts)."""
+        for enemy in game_state.enemies:
+            self._release(enemy)
+        game_state.enemies.clear()
     
     def draw(self, screen):
         # Draw each enemy.
         for enemy in game_state.enemies:
             enemy.draw()
+        game_state.render_queue.flush(screen)
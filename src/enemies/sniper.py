@@ -2,11 +2,16 @@ import math
 from src.enemies.base import BaseEnemy
 import src.engine.constants as constants
 from src.engine.projectiles import SniperEnemyBullet
-import random
+from src.engine.rng import stream
 # import src.game_state as game_state
 from src.engine.helpers import get_ui_scaling_factor
+from src.engine.bullet_patterns import volley
 
 ui_scaling_factor = get_ui_scaling_factor()
+enemy_rng = stream("enemies")
+
+VOLLEY_PATTERN = volley(SniperEnemyBullet, shots=3, delay_seconds=constants.sniper_shot_delay,
+                        jitter=constants.sniper_bullet_spread, speed=constants.sniper_bullet_speed)
 
 class SniperEnemy(BaseEnemy):
     def __init__(self, x, y, scaling):
@@ -16,10 +21,8 @@ class SniperEnemy(BaseEnemy):
         self.score_reward = math.floor(constants.base_sniper_xp_reward * self.scaling)
         
         # Apply randomized initial delay for the volley shot
-        self.initial_delay_ticks = random.uniform(2.0, constants.sniper_volley_interval) * constants.FPS
+        self.initial_delay_ticks = enemy_rng.uniform(2.0, constants.sniper_volley_interval) * constants.FPS
         self.last_shot_tick = self.current_tick - constants.sniper_volley_interval * constants.FPS + self.initial_delay_ticks
-        self.last_volley_shot_tick = self.last_shot_tick
-        self.shots_fired_in_volley = 69
         
         self.speed = constants.sniper_move_speed * ui_scaling_factor
         self.outline_size = constants.SNIPER_ENEMY_OUTLINE_SIZE * ui_scaling_factor
@@ -28,7 +31,7 @@ class SniperEnemy(BaseEnemy):
         self.inner_color = constants.SNIPER_ENEMY_INNER_COLOR
         
         self.strafe_timer = 0
-        self.current_strafe_angle = random.uniform(0, 2 * math.pi)
+        self.current_strafe_angle = enemy_rng.uniform(0, 2 * math.pi)
 
     @property
     def type(self):
@@ -72,7 +75,7 @@ class SniperEnemy(BaseEnemy):
         # 3. Otherwise (player is within the ideal range), strafe:
         else:
             if self.strafe_timer <= 0:
-                self.current_strafe_angle = random.uniform(0, 2 * math.pi)
+                self.current_strafe_angle = enemy_rng.uniform(0, 2 * math.pi)
                 self.strafe_timer = constants.sniper_strafe_duration
             move_x = math.cos(self.current_strafe_angle) * base_speed
             move_y = math.sin(self.current_strafe_angle) * base_speed
@@ -140,45 +143,21 @@ class SniperEnemy(BaseEnemy):
         # Convert ticks to seconds
         current_time = self.current_tick / constants.FPS
         last_shot_time = self.last_shot_tick / constants.FPS
-        last_volley_shot_time = self.last_volley_shot_tick / constants.FPS
 
         if current_time - last_shot_time >= constants.sniper_volley_interval:
-            self.shots_fired_in_volley = 0
-            self.last_volley_shot_tick = self.current_tick
+            # The emitter fires the rest of the volley on later ticks.
+            game_state.pattern_emitter.fire(VOLLEY_PATTERN, self, target_x, target_y)
             self.last_shot_tick = self.current_tick
-
-        if (self.shots_fired_in_volley < 3 and 
-            current_time - last_volley_shot_time >= constants.sniper_shot_delay):
-            from src.engine.helpers import calculate_angle
-            aim_angle = calculate_angle(self.x, self.y, target_x, target_y)
-            # Add random spread to the aim angle.
-            spread = constants.sniper_bullet_spread  
-            angle_offset = random.uniform(-spread, spread)
-            aim_angle += angle_offset
-
-            # Use the bullet pool to get (or create) a sniper bullet:
-            game_state.bullet_pool.get_bullet(
-                SniperEnemyBullet,
-                x=self.x,
-                y=self.y,
-                angle=aim_angle,
-                speed=constants.sniper_bullet_speed * ui_scaling_factor,
-            )
-
-            self.shots_fired_in_volley += 1
-            self.last_volley_shot_tick = self.current_tick
             
     def reset(self, x, y, scaling):
         super().reset(x, y, scaling)
         self.score_reward = math.floor(constants.base_sniper_xp_reward * self.scaling)
-        self.initial_delay_ticks = random.uniform(2.0, constants.sniper_volley_interval) * constants.FPS
+        self.initial_delay_ticks = enemy_rng.uniform(2.0, constants.sniper_volley_interval) * constants.FPS
         self.last_shot_tick = self.current_tick - constants.sniper_volley_interval * constants.FPS + self.initial_delay_ticks
-        self.last_volley_shot_tick = self.last_shot_tick
-        self.shots_fired_in_volley = 69
         self.speed = constants.sniper_move_speed * ui_scaling_factor
-        self.outline_size = constants.SNIPER_ENEMY_OUTLINE_SIZE
-        self.inner_size = constants.SNIPER_ENEMY_INNER_SIZE
+        self.outline_size = constants.SNIPER_ENEMY_OUTLINE_SIZE * ui_scaling_factor
+        self.inner_size = constants.SNIPER_ENEMY_INNER_SIZE * ui_scaling_factor
         self.outline_color = constants.SNIPER_ENEMY_OUTLINE_COLOR
         self.inner_color = constants.SNIPER_ENEMY_INNER_COLOR
         self.strafe_timer = 0
-        self.current_strafe_angle = random.uniform(0, 2 * math.pi)
+        self.current_strafe_angle = enemy_rng.uniform(0, 2 * math.pi)
@@ -0,0 +1,77 @@
+import pygame
+
+import src.engine.constants as constants
+import src.engine.rng as rng
+from src.engine.helpers import get_ui_scaling_factor
+
+ui_scaling_factor = get_ui_scaling_factor()
+
+_sprite_cache = {}  # (enemy type, UI scale) -> EnemySprites
+
+
+def _bake(outline_size, inner_size, outline_color, inner_color, alpha):
+    """Render an outlined square once; returns (surface, offset from the enemy's centre to its top-left)."""
+    # Fully opaque sprites skip per-pixel alpha, which makes them much cheaper to blit.
+    surface = pygame.Surface((outline_size, outline_size), pygame.SRCALPHA if alpha < 255 else 0)
+    surface.fill((*outline_color[:3], alpha))
+
+    # Enemies used to blit a translucent inner square over a translucent outline. Bake the
+    # colour that leaves on screen (inner over outline) so fading frames look the same.
+    a = alpha / 255
+    combined_alpha = 1 - (1 - a) ** 2
+    if combined_alpha > 0:
+        inner = tuple(round((a * i + a * (1 - a) * o) / combined_alpha)
+                      for i, o in zip(inner_color[:3], outline_color[:3]))
+    else:
+        inner = tuple(inner_color[:3])
+    inner_offset = int(outline_size // 2 - inner_size // 2)
+    surface.fill((*inner, round(combined_alpha * 255)), (inner_offset, inner_offset, inner_size, inner_size))
+    return surface, outline_size // 2
+
+
+class EnemySprites:
+    """
+    The alive sprite of one enemy type plus a fixed number of death-animation frames
+    that fade and shrink it to nothing, all rendered up front.
+    """
+    def __init__(self, outline_size, inner_size, outline_color, inner_color,
+                 death_frame_count=constants.ENEMY_DEATH_ANIMATION_FRAMES):
+        self.alive = _bake(outline_size, inner_size, outline_color, inner_color, 255)
+        self.death_frames = []
+        for frame in range(death_frame_count):
+            death_progress = frame / death_frame_count
+            alpha = max(0, min(255, int(255 * (1 - death_progress))))
+            scale_factor = 1 - death_progress
+            self.death_frames.append(_bake(
+                max(1, int(outline_size * scale_factor)),
+                max(1, int(inner_size * scale_factor)),
+                outline_color, inner_color, alpha
+            ))
+
+    def death_frame(self, death_progress):
+        """The frame for a death animation `death_progress` (0..1) of the way through, or None once it has faded out."""
+        frame = int(death_progress * len(self.death_frames))
+        if frame >= len(self.death_frames):
+            return None
+        return self.death_frames[max(0, frame)]
+
+
+def get_enemy_sprites(enemy):
+    key = (enemy.type, ui_scaling_factor)
+    sprites = _sprite_cache.get(key)
+    if sprites is None:
+        sprites = _sprite_cache[key] = EnemySprites(enemy.outline_size, enemy.inner_size,
+                                                    enemy.outline_color, enemy.inner_color)
+    return sprites
+
+
+def prebake_enemy_sprites(enemy_classes):
+    """Bake every enemy type's sprites at startup so the first enemy of each type doesn't hitch."""
+    # Building a sample enemy rolls its random initial delays; don't let that shift the seeded enemy stream.
+    enemy_rng = rng.stream("enemies")
+    random_state = enemy_rng.getstate()
+    try:
+        for enemy_class in enemy_classes:
+            get_enemy_sprites(enemy_class(0, 0, 1))
+    finally:
+        enemy_rng.setstate(random_state)
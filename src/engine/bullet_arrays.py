@@ -0,0 +1,365 @@
+import math
+import numpy as np
+
+import src.engine.game_state as game_state
+import src.engine.constants as constants
+from src.engine.projectiles import (
+    Alignment, BasicEnemyHomingBullet, PlayerBasicBullet, PlayerSpecialBullet,
+    swept_box_overlap, swept_box_overlaps
+)
+from src.ui.render_queue import get_disc
+
+# Distance-scaling modes, mirroring PlayerBaseBullet.compute_scaled_damage.
+DISTANCE_SCALING_NONE = 0
+DISTANCE_SCALING_BASIC = 1
+DISTANCE_SCALING_SPECIAL = 2
+
+
+class NumpyBulletPool:
+    """
+    Structure-of-arrays bullet backend: every bullet is a slot in a set of contiguous
+    NumPy arrays, and movement, out-of-bounds culling, homing and enemy-bullet vs player
+    tests run as single vectorised operations over all live bullets.
+
+    It is a drop-in replacement for BulletPool (get_bullet/update/draw/clear), selected
+    with constants.bullet_backend = "numpy". Bullet classes from projectiles.py are still
+    used to describe each kind: get_bullet() runs the class's constructor once on a
+    per-class scratch instance and copies the resulting fields into the arrays, so
+    damage/speed/size formulas live in one place.
+    """
+    FLOAT_FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy", "angle", "speed", "damage",
+                    "size", "scaling", "initial_x", "initial_y")
+
+    def __init__(self, capacity=256):
+        self.capacity = 0
+        self.high_water = 0  # One past the highest slot ever used; arrays are only scanned up to here.
+        self.free_slots = []
+        self._templates = {}
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.float64))
+        self.pierce = np.zeros(0, dtype=np.int64)
+        self.spawn_tick = np.zeros(0, dtype=np.int64)
+        self.distance_scaling = np.zeros(0, dtype=np.int8)
+        self.active = np.zeros(0, dtype=bool)
+        self.is_player = np.zeros(0, dtype=bool)
+        self.homing = np.zeros(0, dtype=bool)
+        self.can_repierce = np.zeros(0, dtype=bool)
+        # Per-slot Python objects that have no array representation.
+        self.colours = []
+        self.skins = []
+        self.hit_targets = []
+        self.slot_classes = []
+        self.stats = {}  # bullet class -> {"live", "high_water"} counters
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.high_water
+
+    def _grow(self, new_capacity):
+        old_capacity = self.capacity
+        for name in ("pierce", "spawn_tick", "distance_scaling", "active", "is_player", "homing",
+                     "can_repierce") + self.FLOAT_FIELDS:
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:old_capacity] = old
+            setattr(self, name, grown)
+        extra = new_capacity - old_capacity
+        self.colours.extend([None] * extra)
+        self.skins.extend([None] * extra)
+        self.hit_targets.extend([None] * extra)
+        self.slot_classes.extend([None] * extra)
+        # Pop from the end, so push higher slots first to fill the arrays from the front.
+        self.free_slots.extend(range(new_capacity - 1, old_capacity - 1, -1))
+        self.capacity = new_capacity
+
+    def _template(self, bullet_class, args, kwargs):
+        template = self._templates.get(bullet_class)
+        if template is None:
+            template = bullet_class(*args, **kwargs)
+            self._templates[bullet_class] = template
+        else:
+            template.reset(*args, **kwargs)
+        return template
+
+    def _take_slots(self, count):
+        """Pop `count` free slots, in the same order `count` single pops would return them."""
+        while len(self.free_slots) < count:
+            self._grow(self.capacity * 2)
+        slots = self.free_slots[-count:]
+        del self.free_slots[-count:]
+        slots.reverse()
+        highest = max(slots)
+        if highest >= self.high_water:
+            self.high_water = highest + 1
+        return slots
+
+    def _fill_slots(self, slots, bullet_class, bullet):
+        """
+        Copy the fields shared by every bullet built from `bullet` into `slots`, which may be
+        a single slot or an index array. Position, angle and velocity are set by the caller.
+        """
+        self.prev_x[slots] = bullet.x
+        self.prev_y[slots] = bullet.y
+        self.damage[slots] = bullet.damage
+        self.size[slots] = bullet.size
+        self.scaling[slots] = bullet.scaling
+        self.initial_x[slots] = bullet.initial_x
+        self.initial_y[slots] = bullet.initial_y
+        self.pierce[slots] = bullet.pierce
+        self.can_repierce[slots] = bullet.can_repierce
+        self.is_player[slots] = bullet.alignment == Alignment.PLAYER
+        self.homing[slots] = isinstance(bullet, BasicEnemyHomingBullet)
+        self.spawn_tick[slots] = getattr(bullet, "spawn_tick", 0)
+
+        if getattr(bullet, "scales_with_distance_travelled", False):
+            if isinstance(bullet, PlayerBasicBullet):
+                self.distance_scaling[slots] = DISTANCE_SCALING_BASIC
+            elif isinstance(bullet, PlayerSpecialBullet):
+                self.distance_scaling[slots] = DISTANCE_SCALING_SPECIAL
+            else:
+                self.distance_scaling[slots] = DISTANCE_SCALING_NONE
+        else:
+            self.distance_scaling[slots] = DISTANCE_SCALING_NONE
+        self.active[slots] = True
+
+    def _count_live(self, bullet_class, count):
+        stats = self.stats.get(bullet_class)
+        if stats is None:
+            stats = self.stats[bullet_class] = {"live": 0, "high_water": 0}
+        stats["live"] += count
+        if stats["live"] > stats["high_water"]:
+            stats["high_water"] = stats["live"]
+
+    def get_bullet(self, bullet_class, *args, **kwargs):
+        """Allocate a slot for a bullet of `bullet_class` built from the given constructor args."""
+        bullet = self._template(bullet_class, args, kwargs)
+        slot = self._take_slots(1)[0]
+
+        angle_rad = math.radians(bullet.angle)
+        self.x[slot] = bullet.x
+        self.y[slot] = bullet.y
+        self.angle[slot] = bullet.angle
+        self.speed[slot] = bullet.speed
+        self.vx[slot] = bullet.speed * math.cos(angle_rad)
+        self.vy[slot] = bullet.speed * math.sin(angle_rad)
+        self._fill_slots(slot, bullet_class, bullet)
+
+        self.colours[slot] = bullet.colour
+        self.skins[slot] = getattr(bullet, "projectile_skin", None)
+        self.hit_targets[slot] = None
+        self.slot_classes[slot] = bullet_class
+        self._count_live(bullet_class, 1)
+        return slot
+
+    def get_bullets(self, bullet_class, x, y, angles, speeds=None, directions=None, **kwargs):
+        """
+        Allocate one slot per angle for bullets of `bullet_class` fired from (x, y), writing
+        the whole batch with array assignments. The constructor runs once.
+        `speeds` are constructor speed arguments per bullet (bullet classes scale speed
+        linearly); `directions` are optional precomputed (cos, sin) unit vectors for `angles`.
+        """
+        if speeds is not None:
+            kwargs["speed"] = 1.0
+        bullet = self._template(bullet_class, (), dict(kwargs, x=x, y=y, angle=angles[0]))
+        count = len(angles)
+        slots = np.array(self._take_slots(count), dtype=np.int64)
+
+        angles = np.asarray(angles, dtype=np.float64)
+        if speeds is None:
+            speeds = np.full(count, bullet.speed)
+        else:
+            speeds = bullet.speed * np.asarray(speeds, dtype=np.float64)
+        if directions is None:
+            angle_rad = np.radians(angles)
+            directions = (np.cos(angle_rad), np.sin(angle_rad))
+        self.x[slots] = x
+        self.y[slots] = y
+        self.angle[slots] = angles
+        self.speed[slots] = speeds
+        self.vx[slots] = speeds * np.asarray(directions[0])
+        self.vy[slots] = speeds * np.asarray(directions[1])
+        self._fill_slots(slots, bullet_class, bullet)
+
+        skin = getattr(bullet, "projectile_skin", None)
+        for slot in slots.tolist():
+            self.colours[slot] = bullet.colour
+            self.skins[slot] = skin
+            self.hit_targets[slot] = None
+            self.slot_classes[slot] = bullet_class
+        self._count_live(bullet_class, count)
+        return slots
+
+    def deactivate(self, slot):
+        if self.active[slot]:
+            self.active[slot] = False
+            self.skins[slot] = None
+            self.hit_targets[slot] = None
+            self.free_slots.append(slot)
+            self.stats[self.slot_classes[slot]]["live"] -= 1
+
+    def clear(self):
+        """Deactivate every bullet (used when a run is reset)."""
+        for slot in np.flatnonzero(self.active[:self.high_water]):
+            self.deactivate(int(slot))
+
+    def interpolated_entities(self):
+        """Bullets here are interpolated inside draw() from prev_x/prev_y, not by the PositionInterpolator."""
+        return ()
+
+    def count_active(self):
+        return self.capacity - len(self.free_slots)
+
+    def get_stats(self):
+        """
+        Live and high-water bullet counts keyed by bullet class name. Free slots are shared
+        by every class here, so they are reported once by get_free_slot_count() instead.
+        """
+        return {bullet_class.__name__: dict(stats) for bullet_class, stats in self.stats.items()}
+
+    def get_free_slot_count(self):
+        """Number of unused slots, shared by every bullet class."""
+        return len(self.free_slots)
+
+    # --- Per-tick update ---
+
+    def update(self):
+        n = self.high_water
+        if n == 0:
+            return
+        active = self.active[:n]
+        live = np.flatnonzero(active)
+        if live.size == 0:
+            return
+
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        game_state.enemy_grid.rebuild(game_state.enemies)
+
+        # Move everything at once.
+        self.x[live] += self.vx[live]
+        self.y[live] += self.vy[live]
+
+        # Collisions are swept along each bullet's whole move, so they run before culling:
+        # a bullet still hits a target it crossed on its way off screen.
+        # Enemy bullets vs the player, as one vectorised test.
+        enemy_live = live[~self.is_player[live]]
+        if enemy_live.size:
+            self._collide_with_player(enemy_live)
+
+        # Player bullets vs enemies. These run in slot order because each hit changes enemy
+        # health and the bullet's pierce, which later bullets depend on.
+        player_live = live[self.is_player[live]]
+        if player_live.size and game_state.enemies:
+            self._collide_with_enemies(player_live)
+
+        # Cull bullets that left the screen.
+        live = live[self.active[live]]
+        x = self.x[live]
+        y = self.y[live]
+        out = (x < 0) | (x > game_state.screen_width) | (y < 0) | (y > game_state.screen_height)
+        for slot in live[out]:
+            self.deactivate(int(slot))
+        live = live[~out]
+
+        enemy_live = live[~self.is_player[live]]
+        if enemy_live.size:
+            self._steer_homing(enemy_live)
+
+    def _collide_with_player(self, slots):
+        player = game_state.player
+        half_size = player.size / 2
+        hits = swept_box_overlaps(self.prev_x[slots], self.prev_y[slots], self.x[slots], self.y[slots],
+                                  self.size[slots], player.x - half_size, player.y - half_size,
+                                  player.x + half_size, player.y + half_size)
+        for slot in slots[hits]:
+            slot = int(slot)
+            player.take_damage(math.floor(self.damage[slot] * self.scaling[slot]))
+            self.deactivate(slot)
+
+    def _steer_homing(self, slots):
+        # Homing bullets turn towards the player for their first second, after moving (as BasicEnemyHomingBullet does).
+        homing = slots[self.homing[slots] & ((game_state.in_game_ticks_elapsed - self.spawn_tick[slots]) < constants.FPS)]
+        if homing.size == 0:
+            return
+        player = game_state.player
+        angle_to_player = np.degrees(np.arctan2(player.y - self.y[homing], player.x - self.x[homing]))
+        angle_diff = angle_to_player - self.angle[homing]
+        angle_diff = np.where(angle_diff > 180, angle_diff - 360, angle_diff)
+        angle_diff = np.where(angle_diff < -180, angle_diff + 360, angle_diff)
+        max_turn = constants.basic_enemy_bullet_max_turn_angle
+        angle_diff = np.clip(angle_diff, -max_turn, max_turn)
+        self.angle[homing] += angle_diff
+        angle_rad = np.radians(self.angle[homing])
+        self.vx[homing] = self.speed[homing] * np.cos(angle_rad)
+        self.vy[homing] = self.speed[homing] * np.sin(angle_rad)
+
+    def _scaled_damage(self, slot):
+        damage = self.damage[slot]
+        mode = self.distance_scaling[slot]
+        if mode == DISTANCE_SCALING_NONE:
+            return damage
+        travel_distance = math.hypot(self.x[slot] - self.initial_x[slot], self.y[slot] - self.initial_y[slot])
+        if mode == DISTANCE_SCALING_BASIC:
+            bonus_multiplier = (min(travel_distance, 800) / 800) * 2
+        elif travel_distance >= 500:
+            bonus_multiplier = 0
+        elif travel_distance <= 50:
+            bonus_multiplier = 2
+        else:
+            bonus_multiplier = ((500 - travel_distance) / 450 * 2)
+        return damage * (1 + bonus_multiplier)
+
+    def _collide_with_enemies(self, slots):
+        half_size = constants.enemy_collision_half_size
+        player = game_state.player
+        grid = game_state.enemy_grid
+        for slot in slots.tolist():
+            x0, y0 = float(self.prev_x[slot]), float(self.prev_y[slot])
+            x1, y1 = float(self.x[slot]), float(self.y[slot])
+            size = float(self.size[slot])
+            for enemy in grid.query(min(x0, x1) - size, min(y0, y1) - size, max(x0, x1) + size, max(y0, y1) + size):
+                if enemy.health <= 0:
+                    continue
+                if not swept_box_overlap(x0, y0, x1, y1, size, enemy.x - half_size, enemy.y - half_size,
+                                         enemy.x + half_size, enemy.y + half_size):
+                    continue
+                hit_targets = self.hit_targets[slot]
+                if hit_targets is None:
+                    hit_targets = self.hit_targets[slot] = set()
+                elif not self.can_repierce[slot] and enemy in hit_targets:
+                    continue
+
+                self.pierce[slot] -= 1
+                actual_damage = self._scaled_damage(slot)
+                enemy.apply_damage(actual_damage, game_state)
+                player.heal(actual_damage * player.hp_steal)
+                hit_targets.add(enemy)
+                if self.pierce[slot] <= 0:
+                    self.deactivate(slot)
+                break
+
+    # --- Drawing ---
+
+    def draw(self, screen, alpha=1.0):
+        n = self.high_water
+        live = np.flatnonzero(self.active[:n])
+        if live.size == 0:
+            return
+        if alpha < 1.0:
+            xs = self.prev_x[live] + (self.x[live] - self.prev_x[live]) * alpha
+            ys = self.prev_y[live] + (self.y[live] - self.prev_y[live]) * alpha
+        else:
+            xs = self.x[live]
+            ys = self.y[live]
+        xs = xs.astype(np.int64).tolist()
+        ys = ys.astype(np.int64).tolist()
+        sizes = self.size[live].astype(np.int64).tolist()
+        render_queue = game_state.render_queue
+        tick = game_state.in_game_ticks_elapsed
+        for slot, x, y, size in zip(live.tolist(), xs, ys, sizes):
+            skin = self.skins[slot]
+            if skin:
+                render_queue.push(*skin.get_sprite(x, y, size, float(self.angle[slot]), tick - int(self.spawn_tick[slot])))
+            elif size > 0:
+                render_queue.push(get_disc(self.colours[slot], size), (x - size, y - size))
+        render_queue.flush(screen)
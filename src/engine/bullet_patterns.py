@@ -0,0 +1,140 @@
+import math
+from src.engine.rng import stream
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import src.engine.game_state as game_state
+import src.engine.constants as constants
+from src.engine.helpers import calculate_angle, get_ui_scaling_factor
+
+ui_scaling_factor = get_ui_scaling_factor()
+pattern_rng = stream("patterns")
+
+
+@dataclass(frozen=True)
+class BulletPattern:
+    """
+    Describes one enemy attack as data: which bullet class it fires, how many bullets per
+    shot, how they are fanned out and how many shots a volley has.
+    Build these with spread(), ring(), burst() and volley() and fire them through
+    game_state.pattern_emitter.
+
+    Speeds are bullet constructor `speed` arguments before UI scaling, like the ones the
+    enemies used to pass by hand; leave both unset for bullet classes with a fixed speed.
+    """
+    bullet_class: type
+    count: int = 1
+    arc: float = 0.0  # Degrees the bullets are evenly fanned across (360 for a full ring)
+    jitter: float = 0.0  # Random +/- degrees added to each bullet
+    speed: Optional[float] = None
+    speed_range: Optional[Tuple[float, float]] = None  # Random speed per bullet
+    aimed: bool = True  # False fires relative to angle 0 instead of at the target
+    shots: int = 1
+    shot_delay_ticks: int = 0
+    offsets: Tuple[float, ...] = field(init=False, repr=False)
+    directions: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.arc >= 360:
+            offsets = tuple(i * 360 / self.count for i in range(self.count))
+        elif self.count > 1 and self.arc:
+            step = self.arc / (self.count - 1)
+            offsets = tuple(-self.arc / 2 + i * step for i in range(self.count))
+        else:
+            offsets = (0.0,) * self.count
+        object.__setattr__(self, "offsets", offsets)
+
+        # Patterns that always fire the same way get their unit vectors worked out once.
+        directions = None
+        if not self.aimed and not self.jitter:
+            radians = [math.radians(offset) for offset in offsets]
+            directions = (tuple(math.cos(r) for r in radians), tuple(math.sin(r) for r in radians))
+        object.__setattr__(self, "directions", directions)
+
+    def roll(self, aim_angle):
+        """Return the (angles, speeds) of one shot; speeds is None for fixed-speed bullets."""
+        base = aim_angle if self.aimed else 0.0
+        angles = [base + offset for offset in self.offsets]
+        speeds = None
+        if self.speed_range:
+            speeds = []
+            for i in range(self.count):
+                # Angle then speed for each bullet, in the same order the old per-bullet loops rolled them.
+                if self.jitter:
+                    angles[i] += pattern_rng.uniform(-self.jitter, self.jitter)
+                speeds.append(pattern_rng.uniform(*self.speed_range) * ui_scaling_factor)
+        else:
+            if self.jitter:
+                for i in range(self.count):
+                    angles[i] += pattern_rng.uniform(-self.jitter, self.jitter)
+            if self.speed is not None:
+                speeds = [self.speed * ui_scaling_factor] * self.count
+        return angles, speeds
+
+
+def spread(bullet_class, count, jitter, speed=None, speed_range=None):
+    """Shotgun: `count` bullets along the aim line, each knocked up to `jitter` degrees off it."""
+    return BulletPattern(bullet_class, count=count, jitter=jitter, speed=speed, speed_range=speed_range)
+
+
+def ring(bullet_class, count, speed=None, aimed=False):
+    """`count` bullets evenly spaced around a full circle."""
+    return BulletPattern(bullet_class, count=count, arc=360, speed=speed, aimed=aimed)
+
+
+def burst(bullet_class, count, arc, speed=None):
+    """`count` bullets evenly fanned across `arc` degrees centred on the target."""
+    return BulletPattern(bullet_class, count=count, arc=arc, speed=speed)
+
+
+def volley(bullet_class, shots, delay_seconds, count=1, jitter=0.0, speed=None):
+    """`shots` separate shots `delay_seconds` apart, each re-aimed at the target."""
+    delay_ticks = max(1, math.ceil(delay_seconds * constants.FPS))
+    return BulletPattern(bullet_class, count=count, jitter=jitter, speed=speed,
+                         shots=shots, shot_delay_ticks=delay_ticks)
+
+
+class PatternEmitter:
+    """
+    Fires BulletPatterns into game_state.bullet_pool with one batched get_bullets() call
+    per shot, and fires the remaining shots of volleys on later ticks.
+    A volley stops early if the enemy that fired it starts dying.
+    """
+    def __init__(self):
+        self.pending = []  # [owner, pattern, shots_left, next_tick] for volleys in progress
+
+    def fire(self, pattern, owner, target_x, target_y):
+        self._shoot(pattern, owner, target_x, target_y)
+        if pattern.shots > 1:
+            self.pending.append([owner, pattern, pattern.shots - 1,
+                                 game_state.in_game_ticks_elapsed + pattern.shot_delay_ticks])
+
+    def _shoot(self, pattern, owner, target_x, target_y):
+        aim_angle = calculate_angle(owner.x, owner.y, target_x, target_y) if pattern.aimed else 0.0
+        angles, speeds = pattern.roll(aim_angle)
+        game_state.bullet_pool.get_bullets(pattern.bullet_class, owner.x, owner.y, angles,
+                                           speeds=speeds, directions=pattern.directions)
+
+    def update(self):
+        """Fire every volley shot that is due this tick, aimed at the player's current position."""
+        if not self.pending:
+            return
+        tick = game_state.in_game_ticks_elapsed
+        player = game_state.player
+        still_pending = []
+        for volley_state in self.pending:
+            owner, pattern, shots_left, next_tick = volley_state
+            if owner.dying:
+                continue
+            if tick >= next_tick:
+                self._shoot(pattern, owner, player.x, player.y)
+                shots_left -= 1
+                if shots_left <= 0:
+                    continue
+                volley_state[2] = shots_left
+                volley_state[3] = tick + pattern.shot_delay_ticks
+            still_pending.append(volley_state)
+        self.pending = still_pending
+
+    def clear(self):
+        self.pending = []
@@ -1,4 +1,28 @@
-FPS = 60
+FPS = 60  # Simulation ticks per second; every in-game timing is expressed in these ticks
+render_fps_cap = 60  # Default render frame cap (0 = uncapped), overridable via "render_fps_cap" in data/settings.txt
+max_sim_ticks_per_frame = 8  # Catch-up limit after a render hitch before the backlog is dropped
+
+record_replay_path = ""  # Save each run's inputs here for `python -m src.sim --replay`; "" = off, overridable via "record_replay" in data/settings.txt
+profiler_window_frames = 120  # Frames the profiler overlay (F3) averages and takes the worst case over
+profiler_refresh_ms = 250  # How often the profiler overlay re-renders its text
+frame_recorder_capacity = FPS * 60 * 30  # Frames the frame-time recorder keeps (30 minutes at 60 FPS)
+frame_log_dir = "data/frame_logs"  # Where frame-time logs go at game over or on F4
+dirty_rect_rendering = False  # Redraw only what changed each frame, overridable via "dirty_rects" in data/settings.txt
+dirty_rect_full_fraction = 0.5  # Flip the whole screen instead once the dirty area passes this share of it
+text_cache_limit = 512  # Rendered strings the text cache keeps before dropping the least recently used
+floating_number_capacity = 256  # Live damage/EXP numbers per pool; the oldest is dropped to make room
+floating_number_draw_budget = 96  # At most this many of the newest numbers per pool are drawn each frame
+floating_number_merge_ticks = 6  # Hits on the same target this close together add up into one number
+particle_budget = 1024  # Most effect particles alive at once; emitters get what fits
+particle_shades = 12  # Random shades per particle base colour, each with its disc and glow sprites baked once
+skin_rotation_step_degrees = 2  # Animated skins are drawn at the mouse angle rounded to this many degrees
+skin_rotation_cache_bytes = 48 * 1024 * 1024  # Memory for cached rotated skin frames before the least recently used go
+projectile_rotation_steps = 72  # Angles each rotating projectile skin is pre-rendered at (every 5 degrees)
+bullet_backend = "objects"  # "objects" (one BaseBullet per bullet) or "numpy" (NumpyBulletPool arrays)
+
+# Collision
+enemy_collision_half_size = 20  # Enemies are hit-tested as a 40x40 box around their centre
+collision_grid_cell_size = 128  # Cell size (px) of the spatial hash used for bullet-vs-enemy tests
 
 # Colors
 WHITE = (255, 255, 255)
@@ -17,8 +41,13 @@ DARK_GREY = (120, 120, 120)
 DARKER_GREY = (50, 50, 50)
 BROWN = (139, 69, 19)
 
+# Health bars
+HEALTH_BAR_FILL_STEPS = 64  # Cached fill widths per bar size; narrower bars use one per pixel
+
 music_volume = 0.1
 music_path = "assets/audio/music.mp3"
+music_dir = "assets/audio"  # One subfolder per playlist
+music_index_path = "data/music_index.json"  # Track list, durations and tags, refreshed in the background at startup
 
 # Speeds, angles, and cooldowns
 base_player_health = 110
@@ -41,6 +70,8 @@ player_damage_reduction_percent_cap = 97 # if damage reduction is greater than t
 base_hp_pickup_healing_percent = 15  # Will heal 15% of max health
 initial_experience_to_next_level = 20
 level_up_xp_cost_scaling_factor = 1.54
+level_up_prefetch_fraction = 0.9  # Start preparing the next level-up menu once the player has 90% of the EXP for it
+level_up_prefetch_shimmer_frames = 2  # Shimmer phases per upgrade button pre-rendered each frame while waiting
 
 enemy_stat_doubling_time = 80 # seconds
 
@@ -100,6 +131,8 @@ CHARGER_BASE_DAMAGE = 10
 CHARGER_MAX_HP_DAMAGE = 0.15
 
 # Enemy drawing constants
+ENEMY_DEATH_ANIMATION_FRAMES = 12  # Pre-baked fade/shrink frames per enemy type (one per tick of the 0.2s death)
+
 REGULAR_ENEMY_OUTLINE_SIZE = 64
 REGULAR_ENEMY_INNER_SIZE = 60
 REGULAR_ENEMY_OUTLINE_COLOR = BLACK
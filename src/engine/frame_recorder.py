@@ -0,0 +1,141 @@
+import os
+import json
+import time
+from time import perf_counter
+
+import numpy as np
+
+import src.engine.game_state as game_state
+import src.engine.constants as constants
+
+# One row per rendered in-game frame.
+COLUMNS = (
+    "frame_ms",  # wall time since the previous frame (what clock.tick measured)
+    "sim_ms",  # time spent running simulation ticks this frame
+    "render_ms",  # everything else this frame: drawing, HUD, menus and the flip
+    "sim_ticks",  # simulation ticks run this frame (0 while paused or in a menu)
+    "tick",  # game_state.in_game_ticks_elapsed after the frame
+    "enemy_scaling",
+    "wave_interval",
+    "enemies",
+    "bullets",
+    "damage_numbers",
+    "particles",
+    "player_level",
+    "upgrades",  # upgrade levels taken so far
+)
+_CSV_FORMATS = ("%.3f", "%.3f", "%.3f", "%d", "%d", "%.4f", "%.3f", "%d", "%d", "%d", "%d", "%d", "%d")
+
+
+class FrameRecorder:
+    """
+    Records every in-game frame's timings and world state into a preallocated ring buffer
+    (the newest `capacity` frames are kept), and exports them as CSV, NPZ and a JSON summary
+    of frame-time percentiles per minute of play.
+
+    main() calls begin_frame() after clock.tick, wraps the simulation ticks in simulating()
+    and calls end_frame() after the flip. Frames after game over aren't recorded.
+    """
+    def __init__(self, capacity=constants.frame_recorder_capacity):
+        self.capacity = capacity
+        self.rows = np.zeros((capacity, len(COLUMNS)), dtype=np.float64)
+        self.count = 0  # frames recorded since the last clear(), may exceed capacity
+        self.frame_seconds = 0.0
+        self.frame_start = 0.0
+        self.sim_seconds = 0.0
+        self.sim_ticks = 0
+        self.run_started = time.strftime("%Y%m%d-%H%M%S")
+
+    def clear(self):
+        self.count = 0
+        self.run_started = time.strftime("%Y%m%d-%H%M%S")
+
+    def begin_frame(self, frame_seconds):
+        self.frame_seconds = frame_seconds
+        self.sim_seconds = 0.0
+        self.sim_ticks = 0
+        self.frame_start = perf_counter()
+
+    def add_simulation(self, seconds, ticks):
+        self.sim_seconds += seconds
+        self.sim_ticks += ticks
+
+    def end_frame(self):
+        if game_state.game_over:
+            return
+        player = game_state.player
+        sim_ms = self.sim_seconds * 1000
+        render_ms = (perf_counter() - self.frame_start) * 1000 - sim_ms
+        self.rows[self.count % self.capacity] = (
+            self.frame_seconds * 1000, sim_ms, render_ms, self.sim_ticks,
+            game_state.in_game_ticks_elapsed, game_state.enemy_scaling, game_state.wave_interval,
+            len(game_state.enemies), game_state.bullet_pool.count_active(), len(game_state.damage_numbers),
+            len(game_state.particles),
+            player.player_level, sum(player.upgrade_levels.values()),
+        )
+        self.count += 1
+
+    def frames(self):
+        """The recorded rows, oldest first."""
+        if self.count <= self.capacity:
+            return self.rows[:self.count]
+        start = self.count % self.capacity
+        return np.concatenate((self.rows[start:], self.rows[:start]))
+
+    def summary(self, frames=None):
+        """Frame-time percentiles (ms) for the whole run and for each minute of play."""
+        if frames is None:
+            frames = self.frames()
+        frame_ms = frames[:, COLUMNS.index("frame_ms")]
+        minutes = (frames[:, COLUMNS.index("tick")] // (constants.FPS * 60)).astype(np.int64)
+
+        def stats(mask):
+            times = frame_ms[mask]
+            p50, p95, p99 = np.percentile(times, (50, 95, 99))
+            rows = frames[mask]
+            return {
+                "frames": int(times.size),
+                "p50_ms": round(float(p50), 3),
+                "p95_ms": round(float(p95), 3),
+                "p99_ms": round(float(p99), 3),
+                "max_ms": round(float(times.max()), 3),
+                "mean_sim_ms": round(float(rows[:, COLUMNS.index("sim_ms")].mean()), 3),
+                "mean_render_ms": round(float(rows[:, COLUMNS.index("render_ms")].mean()), 3),
+                "max_enemies": int(rows[:, COLUMNS.index("enemies")].max()),
+                "max_bullets": int(rows[:, COLUMNS.index("bullets")].max()),
+                "enemy_scaling": round(float(rows[-1, COLUMNS.index("enemy_scaling")]), 4),
+                "wave_interval": round(float(rows[-1, COLUMNS.index("wave_interval")]), 3),
+                "player_level": int(rows[-1, COLUMNS.index("player_level")]),
+            }
+
+        player = game_state.player
+        return {
+            "frames_recorded": self.count,
+            "frames_kept": int(frames.shape[0]),
+            "overall": stats(np.ones(frame_ms.size, dtype=bool)) if frame_ms.size else None,
+            "per_minute": {int(minute): stats(minutes == minute) for minute in np.unique(minutes)},
+            "upgrades": dict(player.upgrade_levels) if player else {},
+        }
+
+    def export(self, directory=constants.frame_log_dir):
+        """
+        Write <directory>/frames-<run start>.csv, .npz and -summary.json and return the base
+        path, or None if nothing has been recorded.
+        """
+        if not self.count:
+            return None
+        frames = self.frames()
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"frames-{self.run_started}")
+        np.savetxt(base + ".csv", frames, delimiter=",", fmt=_CSV_FORMATS, header=",".join(COLUMNS), comments="")
+        np.savez_compressed(base + ".npz", **{name: frames[:, i] for i, name in enumerate(COLUMNS)})
+        summary = self.summary(frames)
+        with open(base + "-summary.json", "w") as f:
+            json.dump(summary, f, indent=2)
+
+        print(f"Frame log written to {base}.csv/.npz")
+        print(f"{'minute':>6} {'frames':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'enemies':>8} {'scaling':>8}")
+        for minute, stats in summary["per_minute"].items():
+            print(f"{minute:>6} {stats['frames']:>7} {stats['p50_ms']:>7.2f} {stats['p95_ms']:>7.2f} "
+                  f"{stats['p99_ms']:>7.2f} {stats['max_ms']:>7.2f} {stats['max_enemies']:>8} {stats['enemy_scaling']:>8.3f}")
+        return base
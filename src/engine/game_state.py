@@ -1,6 +1,5 @@
 import src.engine.constants as constants
 
-experience_updates = []
 start_time_ms = 0
 in_game_ticks_elapsed = 0 #doesnt include menus
 elapsed_time = 0.0
@@ -39,6 +38,7 @@ is_fading_out = False
 paused = False
 showing_upgrades = False
 showing_stats = False
+level_up_offer = None  # Level-up menu prepared ahead of time, see in_game_menus.prefetch_level_up_menu
 
 game_over = False
 running = True
@@ -52,17 +52,42 @@ screen_width = 1920
 screen_height = 1080
 screen = None
 dummy_surface = None
+
+from src.ui.dirty_rects import DirtyRects
+dirty_rects = DirtyRects()  # Rects drawn over the background this frame, when dirty-rect rendering is on
+from src.ui.render_queue import RenderQueue
+render_queue = RenderQueue(dirty_rects)  # Entity draw calls push blits here; each draw layer flushes it once
 design_width = 3840
 design_height = 2160
 
-damage_numbers = []
+from src.ui.floating_numbers import FloatingNumbers
+damage_numbers = FloatingNumbers(rise=6, spread=60, jitter=1)  # Damage and heal numbers over enemies and the player
+experience_updates = FloatingNumbers(rise=2, spread=2, lift=30, prefix="+", suffix=" EXP")  # EXP gained pop-ups
+from src.ui.particles import ParticleSystem
+particles = ParticleSystem()  # Pickup sparkles; capped at constants.particle_budget
 
 #type def to not get type warnings
 from src.player.player import Player
 player:Player = None  # Will be initialized in main.py after screen dimensions are known
 
 from src.engine.projectiles import BulletPool
-bullet_pool = BulletPool()
+if constants.bullet_backend == "numpy":
+    from src.engine.bullet_arrays import NumpyBulletPool
+    bullet_pool = NumpyBulletPool()
+else:
+    bullet_pool = BulletPool()
+
+from src.engine.spatial_hash import SpatialHash
+enemy_grid = SpatialHash()  # Rebuilt from `enemies` every tick before bullets move
+
+from src.engine.bullet_patterns import PatternEmitter
+pattern_emitter = PatternEmitter()  # Fires enemy bullet patterns and the later shots of volleys
+
+from src.engine.profiler import FrameProfiler
+profiler = FrameProfiler()  # Per-stage frame timings for the F3 overlay; free while hidden
+
+from src.engine.frame_recorder import FrameRecorder
+frame_recorder = FrameRecorder()  # Every in-game frame's timings, exported at game over or on F4
 
 scroll_offset = 0  # Initialize scroll offset for upgrades tab
 
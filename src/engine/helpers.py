@@ -2,33 +2,35 @@ import math
 import pygame
 import os
 import json
-import random
-import time
 
 import src.engine.game_state as game_state
+import src.engine.rng as rng
+import src.engine.constants as constants
 import numpy as np
 
 def calculate_angle(x1, y1, x2, y2):
     return math.degrees(math.atan2(y2 - y1, x2 - x1))
 
 
-def reset_game():
-    from src.enemies.enemy_pool import EnemyPool
-    enemy_pool = EnemyPool()
-    random.seed(time.time())
+def reset_game(seed=None):
+    # Every run gets fresh RNG streams; pass a seed to make it reproducible.
+    rng.seed_all(seed)
     game_state.player.reset()
     if hasattr(game_state, 'current_upgrade_buttons'):
         delattr(game_state, 'current_upgrade_buttons')
     if hasattr(game_state, 'final_time'):
         delattr(game_state, 'final_time')
+    game_state.level_up_offer = None
     game_state.enemies.clear()
     game_state.projectiles.clear()
     game_state.hearts.clear()
+    game_state.particles.clear()
     game_state.damage_numbers.clear()
     game_state.experience_updates.clear()
-    for bullet in game_state.bullet_pool.pool:
-        bullet.deactivate()
-    game_state.player.upgrade_levels = {}
+    game_state.bullet_pool.clear()
+    game_state.pattern_emitter.clear()
+    game_state.frame_recorder.clear()
+    game_state.player.reset_upgrade_levels()
     game_state.enemy_scaling = 1
     game_state.fade_alpha = 0
     game_state.game_over = False
@@ -156,6 +158,37 @@ def save_settings(settings):
         for key, val in settings.items():
             f.write(f"{key}: {val}\n")
             
+def load_render_fps_cap():
+    """
+    Load the render frame cap from the settings file (0 means uncapped).
+    Falls back to constants.render_fps_cap if missing or invalid.
+    """
+    settings = load_settings()
+    try:
+        return max(0, int(settings.get("render_fps_cap", constants.render_fps_cap)))
+    except ValueError as e:
+        print(f"Error loading render FPS cap: {e}")
+        return constants.render_fps_cap
+
+def load_dirty_rect_rendering():
+    """
+    Load whether the in-game scene uses dirty-rectangle rendering ("dirty_rects: 1").
+    Falls back to constants.dirty_rect_rendering if missing or invalid.
+    """
+    settings = load_settings()
+    try:
+        return bool(int(settings.get("dirty_rects", int(constants.dirty_rect_rendering))))
+    except ValueError as e:
+        print(f"Error loading dirty rect setting: {e}")
+        return constants.dirty_rect_rendering
+
+def load_record_replay_path():
+    """
+    Load where to save input recordings of each run ("" means don't record).
+    Falls back to constants.record_replay_path if missing.
+    """
+    return load_settings().get("record_replay", constants.record_replay_path)
+            
 # New: uniform hover overlay function
 def draw_hover_overlay(screen, rect):
     """Draw a translucent gray overlay over the given rect."""
@@ -191,6 +224,12 @@ def quantize_phase(phase, step=0.025):
     return round(phase / step) * step
 
 def compute_shimmer_surface_for_tab_icon(rarity_color, rarity, width, height, phase, surface=None):
+    low_res_surface = get_low_res_shimmer_surface(rarity_color, rarity, width, height, phase, surface)
+    # Scale up to full size and return
+    return pygame.transform.smoothscale(low_res_surface, (width, height))
+
+def get_low_res_shimmer_surface(rarity_color, rarity, width, height, phase, surface=None):
+    """The low-resolution shimmer frame for `phase`, computed once per quantized phase."""
     # Determine low resolution dimensions
     low_width, low_height = width // LOW_RES_FACTOR, height // LOW_RES_FACTOR
 
@@ -198,9 +237,7 @@ def compute_shimmer_surface_for_tab_icon(rarity_color, rarity, width, height, ph
     q_phase = quantize_phase(phase)
     cache_key = (rarity_color, rarity, low_width, low_height, q_phase)
     if cache_key in _shimmer_cache:
-        cached_surf = _shimmer_cache[cache_key]
-        # Scale up to full size and return
-        return pygame.transform.smoothscale(cached_surf, (width, height))
+        return _shimmer_cache[cache_key]
 
     # Get the precomputed normalized grid
     norm_grid = get_normalized_grid(low_width, low_height)
@@ -230,17 +267,16 @@ def compute_shimmer_surface_for_tab_icon(rarity_color, rarity, width, height, ph
 
     # Cache the computed low-res surface
     _shimmer_cache[cache_key] = surface.copy()
-
-    # Scale up to full size before returning
-    return pygame.transform.smoothscale(surface, (width, height))
+    return surface
 
 def generate_shades(base_color, variation=30):
     """Generate a random shade of the given base color with slight variation."""
     r, g, b = base_color
+    effects_rng = rng.stream("effects")
     return (
-        max(0, min(255, r + random.randint(-variation, variation))),
-        max(0, min(255, g + random.randint(-variation, variation))),
-        max(0, min(255, b + random.randint(-variation, variation)))
+        max(0, min(255, r + effects_rng.randint(-variation, variation))),
+        max(0, min(255, g + effects_rng.randint(-variation, variation))),
+        max(0, min(255, b + effects_rng.randint(-variation, variation)))
     )
 
 _cached_bg_image = None
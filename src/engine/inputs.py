@@ -0,0 +1,201 @@
+import math
+import os
+import json
+import random
+import struct
+import pygame
+
+import src.engine.game_state as game_state
+
+
+class KeyState:
+    """
+    Stand-in for pygame.key.get_pressed() backed by a set of key codes.
+    Indexing with a pygame.K_* constant returns whether that key is held.
+    """
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class InputFrame:
+    """Everything the game loop reads from the keyboard and mouse in a single tick."""
+    def __init__(self, keys, mouse_buttons, mouse_pos):
+        self.keys = keys
+        self.mouse_buttons = mouse_buttons
+        self.mouse_pos = mouse_pos
+
+
+class LiveInput:
+    """Reads the real keyboard and mouse through pygame."""
+    def poll(self):
+        return InputFrame(pygame.key.get_pressed(), pygame.mouse.get_pressed(), pygame.mouse.get_pos())
+
+
+live_input = LiveInput()
+
+
+class ScriptedInput:
+    """
+    Generates input without a window so the game can be driven headlessly.
+
+    Scripts:
+      idle   - stand still and never shoot.
+      turret - stand still, aim at the nearest enemy and hold both mouse buttons.
+      kite   - like turret, but pick a new WASD direction every `direction_ticks` ticks.
+    Uses its own Random instance so a given seed always produces the same inputs.
+    """
+    SCRIPTS = ("idle", "turret", "kite")
+    MOVEMENT_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+    def __init__(self, script="kite", seed=0, direction_ticks=30):
+        if script not in self.SCRIPTS:
+            raise ValueError(f"Unknown input script '{script}', expected one of {self.SCRIPTS}")
+        self.script = script
+        self.rng = random.Random(seed)
+        self.direction_ticks = direction_ticks
+        self.tick = 0
+        self.held_keys = KeyState()
+
+    def _nearest_enemy_pos(self):
+        player = game_state.player
+        nearest = None
+        nearest_distance = math.inf
+        for enemy in game_state.enemies:
+            if enemy.dying:
+                continue
+            distance = math.hypot(enemy.x - player.x, enemy.y - player.y)
+            if distance < nearest_distance:
+                nearest = (int(enemy.x), int(enemy.y))
+                nearest_distance = distance
+        if nearest is None:
+            # Nothing to shoot at; aim to the right of the player.
+            nearest = (int(player.x) + 100, int(player.y))
+        return nearest
+
+    def poll(self):
+        if self.script == "idle":
+            self.tick += 1
+            return InputFrame(self.held_keys, (False, False, False), (int(game_state.player.x), int(game_state.player.y)))
+
+        if self.script == "kite" and self.tick % self.direction_ticks == 0:
+            # Hold between zero and two movement keys at random.
+            held = self.rng.sample(self.MOVEMENT_KEYS, self.rng.randint(0, 2))
+            self.held_keys = KeyState(held)
+        self.tick += 1
+
+        return InputFrame(self.held_keys, (True, False, True), self._nearest_enemy_pos())
+
+
+# One recorded tick: held-key bitmask, mouse-button bitmask, mouse x, mouse y.
+REPLAY_FRAME = struct.Struct("<BBhh")
+REPLAY_MAGIC = b"TOPREC"
+REPLAY_VERSION = 1
+# Every key handle_input() reads, in bitmask order.
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_1, pygame.K_2)
+
+
+class InputRecorder:
+    """
+    Wraps another input source and packs what it returns each tick into REPLAY_FRAME records.
+    Level-up choices are recorded too, since they come from menu clicks rather than poll().
+    Together with the run's RNG seed that is everything needed to replay the run exactly.
+    """
+    def __init__(self, source, seed, width, height):
+        self.source = source
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.frames = bytearray()
+        self.ticks = 0
+        self.upgrades = []  # [tick, upgrade name, number of upgrades offered] in the order they were picked
+
+    def poll(self):
+        frame = self.source.poll()
+        keys = frame.keys
+        key_mask = 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if keys[key]:
+                key_mask |= 1 << bit
+        button_mask = 0
+        for bit, pressed in enumerate(frame.mouse_buttons[:3]):
+            if pressed:
+                button_mask |= 1 << bit
+        self.frames += REPLAY_FRAME.pack(key_mask, button_mask, int(frame.mouse_pos[0]), int(frame.mouse_pos[1]))
+        self.ticks += 1
+        return frame
+
+    def record_upgrade(self, upgrade_name, offered):
+        # Rolling the offers draws from the upgrades stream, so the replay has to roll as many.
+        self.upgrades.append([self.ticks, upgrade_name, offered])
+
+    def save(self, path):
+        """Write a small JSON header (seed, screen size, upgrades) followed by the packed frames."""
+        header = json.dumps({
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "width": self.width,
+            "height": self.height,
+            "ticks": self.ticks,
+            "upgrades": self.upgrades,
+        }).encode("utf-8")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(REPLAY_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(self.frames)
+
+
+class InputReplay:
+    """
+    Input source that plays back a file written by InputRecorder.save().
+    Seed the game with `seed` first (see rng.seed_all) and apply next_upgrade() whenever the
+    player levels up. After the last recorded tick it returns idle input and sets `finished`.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(REPLAY_MAGIC):
+            raise ValueError(f"{path} is not an input recording")
+        offset = len(REPLAY_MAGIC)
+        (header_size,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        header = json.loads(data[offset:offset + header_size].decode("utf-8"))
+        if header["version"] != REPLAY_VERSION:
+            raise ValueError(f"Unsupported recording version {header['version']} in {path}")
+        self.seed = header["seed"]
+        self.width = header["width"]
+        self.height = header["height"]
+        self.ticks = header["ticks"]
+        self.upgrades = [(name, offered) for _, name, offered in header["upgrades"]]
+        self.frames = list(REPLAY_FRAME.iter_unpack(data[offset + header_size:]))
+        self.tick = 0
+        self.next_upgrade_index = 0
+        self.finished = False
+        self._key_states = {}  # key bitmask -> KeyState, there are only a handful of distinct ones
+
+    def poll(self):
+        if self.tick >= len(self.frames):
+            self.finished = True
+            return InputFrame(KeyState(), (False, False, False), (int(game_state.player.x), int(game_state.player.y)))
+        key_mask, button_mask, mouse_x, mouse_y = self.frames[self.tick]
+        self.tick += 1
+        keys = self._key_states.get(key_mask)
+        if keys is None:
+            keys = self._key_states[key_mask] = KeyState(
+                key for bit, key in enumerate(RECORDED_KEYS) if key_mask & (1 << bit))
+        buttons = (bool(button_mask & 1), bool(button_mask & 2), bool(button_mask & 4))
+        return InputFrame(keys, buttons, (mouse_x, mouse_y))
+
+    def next_upgrade(self):
+        """(name, number offered) of the next recorded level-up choice, or None if there are no more."""
+        if self.next_upgrade_index >= len(self.upgrades):
+            return None
+        choice = self.upgrades[self.next_upgrade_index]
+        self.next_upgrade_index += 1
+        return choice
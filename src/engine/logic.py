@@ -1,9 +1,12 @@
 import pygame
-import random
+from src.engine.rng import stream
 from src.player.pickups import HeartEffect
 import src.engine.game_state as game_state
 import src.engine.constants as constants
 from src.engine.helpers import get_ui_scaling_factor
+from src.engine.inputs import live_input
+
+pickup_rng = stream("pickups")
 
 
 def update_projectiles():
@@ -37,8 +40,8 @@ def spawn_heart():
     max_attempts = 1
     valid_position = None
     for _ in range(max_attempts):
-        x = random.randint(25, game_state.screen_width - 25)
-        y = random.randint(25, game_state.screen_height - 25)
+        x = pickup_rng.randint(25, game_state.screen_width - 25)
+        y = pickup_rng.randint(25, game_state.screen_height - 25)
         heart_rect = pygame.Rect(x - 10, y - 10, 20, 20)
         if not any(heart_rect.colliderect(ui_rect) for ui_rect in ui_zones):
             valid_position = (x, y)
@@ -60,19 +63,17 @@ def update_hearts():
         if player_rect.colliderect(heart_rect):
             heal_amount = game_state.player.heal_from_pickup()
             # Add a healing number effect
-            game_state.damage_numbers.append({
-                "x": game_state.player.x,
-                "y": game_state.player.y,
-                "value": heal_amount,
-                "timer": 60,
-                "color": constants.GREEN
-            })
+            game_state.damage_numbers.add(game_state.player.x, game_state.player.y, heal_amount, constants.GREEN, 60,
+                                          target=game_state.player)
             # Remove the heart once it's picked up
             game_state.hearts.remove(heart)
+            heart.remove()
 
-def handle_input():
-    keys = pygame.key.get_pressed()
-    mouse_pressed = pygame.mouse.get_pressed()
+def handle_input(input_source=None):
+    # Default to the real keyboard/mouse; the headless simulator passes a scripted source.
+    frame = (input_source or live_input).poll()
+    keys = frame.keys
+    mouse_pressed = frame.mouse_buttons
 
     # Handle movement
     game_state.player.update(keys)
@@ -85,13 +86,77 @@ def handle_input():
 
     # Handle shooting
     if mouse_pressed[0] and not game_state.game_over:
-        game_state.player.shoot_regular(pygame.mouse.get_pos())
+        game_state.player.shoot_regular(frame.mouse_pos)
 
     if mouse_pressed[2] and not game_state.game_over:
-        game_state.player.shoot_special(pygame.mouse.get_pos())
+        game_state.player.shoot_special(frame.mouse_pos)
+
+    game_state.player.update_angle(frame.mouse_pos)
 
     return keys
 
+def update_wave_spawning(enemy_pool, in_game_seconds):
+    if not game_state.wave_active:
+        if (in_game_seconds - game_state.last_wave_time >= game_state.wave_interval or 
+            len(game_state.enemies) == 0):
+            game_state.wave_active = True
+            game_state.wave_enemies_spawned = 0
+            game_state.next_enemy_spawn_time = in_game_seconds + 0.5
+    else:
+        if in_game_seconds >= game_state.next_enemy_spawn_time and game_state.wave_enemies_spawned < 5:
+            enemy_pool.spawn_enemy()
+            game_state.wave_enemies_spawned += 1
+            game_state.next_enemy_spawn_time = in_game_seconds + 0.5
+        if game_state.wave_enemies_spawned >= 5:
+            game_state.wave_active = False
+            game_state.last_wave_time = in_game_seconds
+
+def update_world(enemy_pool):
+    """
+    Advance everything that isn't player input by one in-game tick: wave spawning,
+    enemies, projectiles and pickups. Shared by main.py and the headless simulator.
+    """
+    in_game_seconds = game_state.in_game_ticks_elapsed / constants.FPS
+    game_state.enemy_scaling = calculate_enemy_scaling(in_game_seconds)
+    game_state.wave_interval = calculate_wave_spawn_interval(in_game_seconds)
+
+    profiler = game_state.profiler
+    update_wave_spawning(enemy_pool, in_game_seconds)
+    enemy_pool.update()
+    game_state.pattern_emitter.update()
+    profiler.lap("enemies")
+    update_projectiles()
+    profiler.lap("bullets")
+    spawn_heart()
+    update_hearts()
+    profiler.lap("pickups")
+
+def step_simulation(enemy_pool, input_source=None):
+    """Run exactly one fixed in-game tick: player input, world update, death check."""
+    handle_input(input_source)
+    game_state.profiler.lap("input")
+    update_world(enemy_pool)
+    check_player_death()
+    game_state.in_game_ticks_elapsed += 1
+
+def get_interpolated_entities():
+    """Everything drawn at a position the simulation moves each tick."""
+    entities = [game_state.player]
+    entities.extend(game_state.enemies)
+    entities.extend(game_state.bullet_pool.interpolated_entities())
+    return entities
+
+def check_player_death():
+    """Flag game over the first tick the player's health reaches zero. Returns True once dead."""
+    if game_state.player.health <= 0:
+        if not game_state.game_over:  # Only do this once
+            import src.engine.score as score
+            game_state.game_over = True
+            game_state.final_time = game_state.in_game_ticks_elapsed // constants.FPS
+            game_state.final_score = score.score
+        return True
+    return False
+
 def calculate_enemy_scaling(elapsed_seconds):
     scaling_factor = 1.98 ** (elapsed_seconds / constants.enemy_stat_doubling_time)
     return scaling_factor
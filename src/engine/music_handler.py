@@ -1,11 +1,19 @@
 import os
 import random
-from mutagen import File
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 
 import src.engine.constants as constants
 import src.engine.game_state as game_state
 from src.engine.helpers import load_settings, save_settings
+from src.engine.music_library import MusicLibrary
+
+music_library = MusicLibrary()
+# Loading, playing and queueing tracks and saving the song settings all happen on this one
+# thread, in the order asked for, so changing songs never waits on the disk in a game frame.
+music_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+settings_lock = threading.Lock()  # The settings file is read-modify-written from both threads
 
 # --- Music Settings Functions ---
 
@@ -27,9 +35,10 @@ def save_music_settings(volume):
     Save the music volume to the settings file.
     This updates only the 'music_volume' key.
     """
-    settings = load_settings()
-    settings["music_volume"] = volume
-    save_settings(settings)
+    with settings_lock:
+        settings = load_settings()
+        settings["music_volume"] = volume
+        save_settings(settings)
 
 # --- Song/Playlist Settings Functions ---
 
@@ -38,10 +47,11 @@ def save_current_song_settings():
     Save the current playlist and song indices into the settings file.
     This updates the keys 'current_playlist_index' and 'current_song_index'.
     """
-    settings = load_settings()
-    settings["current_playlist_index"] = game_state.current_playlist_index
-    settings["current_song_index"] = game_state.current_song_index
-    save_settings(settings)
+    with settings_lock:
+        settings = load_settings()
+        settings["current_playlist_index"] = game_state.current_playlist_index
+        settings["current_song_index"] = game_state.current_song_index
+        save_settings(settings)
 
 def load_last_song_settings():
     """
@@ -64,56 +74,84 @@ def load_last_song_settings():
 
 def load_all_playlists():
     """
-    Return a list of subfolder names in assets/audio/.
-    Each subfolder is treated as a separate playlist.
+    Return the playlist names from the music library.
+    Each subfolder of assets/audio/ is treated as a separate playlist.
     """
-    audio_base = "assets/audio"
-    subfolders = [
-        d for d in os.listdir(audio_base)
-        if os.path.isdir(os.path.join(audio_base, d))
-    ]
-    return subfolders
+    return music_library.get_playlists()
 
 def load_song_list_for(folder_name):
     """
-    Given a folder name, return all .mp3 files inside assets/audio/<folder_name>.
+    Given a folder name, return all .mp3 files inside assets/audio/<folder_name>, from the music library.
     """
-    song_folder = os.path.join("assets", "audio", folder_name)
-    return [
-        os.path.join(song_folder, f)
-        for f in os.listdir(song_folder)
-        if f.endswith('.mp3')
-    ]
+    return music_library.get_songs(folder_name)
 
 # Set a custom event for when the music ends.
 MUSIC_END_EVENT = pygame.USEREVENT + 1
 pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+# Posted by the loading thread when the music library is ready or has been refreshed.
+MUSIC_LIBRARY_EVENT = pygame.USEREVENT + 2
 
-def play_current_song():
-    if game_state.song_list:
-        index = game_state.current_song_index
-        song_path = game_state.song_list[index]
-        game_state.current_song = song_path
-
-        base = os.path.basename(song_path)
-        name_artist = os.path.splitext(base)[0]
-        game_state.current_song_display = name_artist
-
+def run_music_job(job, *args):
+    """Run job(*args) on the music thread after everything already asked of it."""
+    def run():
+        if not pygame.mixer.get_init():
+            return  # The game is shutting down
         try:
-            audio = File(song_path)
-            duration = audio.info.length
+            job(*args)
         except Exception as e:
-            print("Error reading audio info:", e)
-            duration = 0
+            print(f"Error playing music: {e}")
+    music_worker.submit(run)
+
+def stop_music_worker():
+    """Drop any music jobs still waiting and let the one running finish; call before pygame.quit()."""
+    music_worker.shutdown(wait=True, cancel_futures=True)
+
+def start_song(song_path, next_path):
+    """Music job: play song_path from the start, with next_path queued to follow it."""
+    pygame.mixer.music.load(song_path)  # Also drops whatever was queued
+    pygame.mixer.music.set_volume(constants.music_volume)
+    # Play the song once (no looping)
+    pygame.mixer.music.play(0, start=0)
+    pygame.mixer.music.queue(next_path)
 
-        pygame.mixer.music.load(song_path)
-        pygame.mixer.music.set_volume(constants.music_volume)
-        # Register the music end event for this song.
-        pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
-        # Play the song once (no looping)
-        pygame.mixer.music.play(0, start=0)
+def continue_song(song_path, next_path):
+    """
+    Music job for when a song has ended: the mixer is already playing the queued song_path, so
+    queue next_path behind it. If nothing had been queued in time, start song_path instead.
+    """
+    if pygame.mixer.music.get_busy():
+        pygame.mixer.music.queue(next_path)
+    else:
+        start_song(song_path, next_path)
+
+def show_current_song():
+    index = game_state.current_song_index
+    song_path = game_state.song_list[index]
+    game_state.current_song = song_path
+
+    base = os.path.basename(song_path)
+    name_artist = os.path.splitext(base)[0]
+    game_state.current_song_display = name_artist
+
+def get_next_song_path():
+    return game_state.song_list[(game_state.current_song_index + 1) % len(game_state.song_list)]
 
-        save_current_song_settings()
+def play_current_song():
+    if game_state.song_list:
+        show_current_song()
+        run_music_job(start_song, game_state.current_song, get_next_song_path())
+        run_music_job(save_current_song_settings)
+
+def song_ended():
+    """
+    Handle MUSIC_END_EVENT: the mixer has moved on to the song queued after the one that ended,
+    so catch up with it and queue the one after that.
+    """
+    if game_state.song_list:
+        game_state.current_song_index = (game_state.current_song_index + 1) % len(game_state.song_list)
+        show_current_song()
+        run_music_job(continue_song, game_state.current_song, get_next_song_path())
+        run_music_job(save_current_song_settings)
 
 def previous_song():
     """
@@ -142,47 +180,101 @@ def switch_playlist():
     game_state.current_song_index = 0
     play_current_song()
 
+def pick_song(last_settings):
+    """
+    Pick the playlist and song to start with from the music library: the last played ones if
+    possible, otherwise a random playlist and a random song. Leaves game_state alone, so it can
+    run on the loading thread; start_picked_song() applies the pick on the main thread.
+    """
+    playlist_folders = load_all_playlists()
+    if not playlist_folders:
+        raise Exception("No subfolders found in assets/audio.")
+
+    cp_index = cs_index = None
+    if last_settings is not None:
+        cp_index = last_settings.get("current_playlist_index")
+        cs_index = last_settings.get("current_song_index")
+    if cp_index is None or cp_index >= len(playlist_folders):
+        cp_index = random.randint(0, len(playlist_folders) - 1)
+    current_playlist = playlist_folders[cp_index]
+    song_list = load_song_list_for(current_playlist)
+    if not song_list:
+        raise Exception(f"No songs found in folder: {current_playlist}")
+    if cs_index is None or cs_index >= len(song_list):
+        cs_index = random.randint(0, len(song_list) - 1)
+    return {
+        "playlist_folders": playlist_folders,
+        "current_playlist_index": cp_index,
+        "song_list": song_list,
+        "current_song_index": cs_index,
+    }
+
+def start_picked_song(pick):
+    game_state.playlist_folders = pick["playlist_folders"]
+    game_state.current_playlist_index = pick["current_playlist_index"]
+    game_state.song_list = pick["song_list"]
+    game_state.current_song_index = pick["current_song_index"]
+    play_current_song()
+
+def sync_with_library():
+    """After a refresh, point the playlist and song list at the library's up-to-date ones, staying on the same song where it still exists."""
+    current_playlist = game_state.playlist_folders[game_state.current_playlist_index]
+    game_state.playlist_folders = load_all_playlists()
+    if current_playlist not in game_state.playlist_folders:
+        return  # Gone entirely; the old list plays on until the playlist is switched
+    song_list = load_song_list_for(current_playlist)
+    if not song_list:
+        return
+    current_song = getattr(game_state, "current_song", None)
+    if current_song in song_list:
+        song_index = song_list.index(current_song)
+    else:
+        song_index = min(game_state.current_song_index, len(song_list) - 1)
+    game_state.current_playlist_index = game_state.playlist_folders.index(current_playlist)
+    game_state.song_list = song_list
+    game_state.current_song_index = song_index
+
+def music_library_updated(event):
+    """
+    Handle MUSIC_LIBRARY_EVENT. The playlist fields are only ever changed here on the main thread,
+    alongside next_song() and friends, so skipping tracks while the library loads can't leave the
+    song index and the song list out of step.
+    """
+    if hasattr(event, "pick"):
+        start_picked_song(event.pick)
+    elif getattr(game_state, "song_list", None):
+        sync_with_library()
+        # Re-queue the next track so it comes from the synced list
+        run_music_job(continue_song, game_state.current_song, get_next_song_path())
+
 def load_and_play_music():
     """
     Initialize volume, load all playlists, and resume the last played song if possible.
     If no saved song exists, default to a random playlist and a random song.
+    Runs on its own thread: the chosen song and the refreshed library are handed to the main
+    thread with MUSIC_LIBRARY_EVENT.
     """
     try:
         constants.music_volume = load_music_settings()
 
-        # Load all playlists (subfolders under assets/audio)
-        game_state.playlist_folders = load_all_playlists()
-        if not game_state.playlist_folders:
-            raise Exception("No subfolders found in assets/audio.")
-
-        # Try loading previous song settings
+        # Load all playlists (subfolders under assets/audio), from the saved index if there is one
+        music_library.load()
         last_settings = load_last_song_settings()
-        if last_settings is not None:
-            cp_index = last_settings.get("current_playlist_index")
-            cs_index = last_settings.get("current_song_index")
-            if cp_index is not None and cp_index < len(game_state.playlist_folders):
-                game_state.current_playlist_index = cp_index
-            else:
-                game_state.current_playlist_index = random.randint(0, len(game_state.playlist_folders) - 1)
-            current_playlist = game_state.playlist_folders[game_state.current_playlist_index]
-            game_state.song_list = load_song_list_for(current_playlist)
-            if game_state.song_list:
-                if cs_index is not None and cs_index < len(game_state.song_list):
-                    game_state.current_song_index = cs_index
-                else:
-                    game_state.current_song_index = random.randint(0, len(game_state.song_list) - 1)
-            else:
-                raise Exception(f"No songs found in folder: {current_playlist}")
-        else:
-            # No previous settings found, choose a random playlist and song
-            game_state.current_playlist_index = random.randint(0, len(game_state.playlist_folders) - 1)
-            current_playlist = game_state.playlist_folders[game_state.current_playlist_index]
-            game_state.song_list = load_song_list_for(current_playlist)
-            if not game_state.song_list:
-                raise Exception(f"No songs found in folder: {current_playlist}")
-            game_state.current_song_index = random.randint(0, len(game_state.song_list) - 1)
+        pick = pick_song(last_settings)
 
-        play_current_song()
+        refreshed = False
+        if not os.path.exists(pick["song_list"][pick["current_song_index"]]):
+            # The saved index is out of date (a track was renamed or removed), so update it before playing
+            music_library.refresh()
+            pick = pick_song(last_settings)
+            refreshed = True
+
+        pygame.event.post(pygame.event.Event(MUSIC_LIBRARY_EVENT, pick=pick))
+
+        if not refreshed:
+            # Pick up added, removed or changed tracks
+            music_library.refresh()
+            pygame.event.post(pygame.event.Event(MUSIC_LIBRARY_EVENT))
 
     except Exception as e:
         print(f"Error loading music: {e}")
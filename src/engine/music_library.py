@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+
+from mutagen import File
+
+import src.engine.constants as constants
+
+
+def read_track_info(path, stat):
+    """Duration and tags of one audio file, read with mutagen; the file name stands in for missing tags."""
+    name, _ = os.path.splitext(os.path.basename(path))
+    title, _, artist = name.partition(" - ")
+    track = {"mtime": stat.st_mtime, "size": stat.st_size, "duration": 0, "title": title, "artist": artist}
+    try:
+        audio = File(path, easy=True)
+        track["duration"] = audio.info.length
+        tags = audio.tags or {}
+        track["title"] = tags.get("title", [title])[0]
+        track["artist"] = tags.get("artist", [artist])[0]
+    except Exception as e:
+        print(f"Error reading audio info for {path}: {e}")
+    return track
+
+
+class MusicLibrary:
+    """
+    The playlists under `music_dir` (one subfolder each) and their .mp3 tracks, with every track's
+    duration and tags, saved to `music_index_path` between runs.
+
+    load() reads the saved index so playback can start without listing or parsing anything;
+    refresh() re-lists the folders and re-reads only tracks that are new or whose size or mtime
+    changed. Tracks keep their place in a playlist across refreshes, so saved song indices stay
+    valid; new ones go at the end. Safe to read from the main thread while a refresh runs.
+    """
+    def __init__(self, music_dir=constants.music_dir, index_path=constants.music_index_path):
+        self.music_dir = music_dir
+        self.index_path = index_path
+        self.lock = threading.Lock()
+        self.playlists = {}  # folder name -> [track path, ...]
+        self.tracks = {}  # track path -> {"mtime", "size", "duration", "title", "artist"}
+
+    def get_playlists(self):
+        with self.lock:
+            return list(self.playlists)
+
+    def get_songs(self, folder_name):
+        with self.lock:
+            return list(self.playlists.get(folder_name, []))
+
+    def get_track(self, path):
+        with self.lock:
+            return self.tracks.get(path)
+
+    def load(self):
+        """Read the saved index, or just list the folders if there isn't a usable one yet."""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            playlists, tracks = dict(index["playlists"]), dict(index["tracks"])
+        except (OSError, ValueError, KeyError, TypeError):
+            playlists, tracks = self.list_folders(), {}
+        with self.lock:
+            self.playlists, self.tracks = playlists, tracks
+
+    def list_folders(self):
+        playlists = {}
+        for folder_name in os.listdir(self.music_dir):
+            folder = os.path.join(self.music_dir, folder_name)
+            if os.path.isdir(folder):
+                playlists[folder_name] = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith('.mp3')]
+        return playlists
+
+    def refresh(self):
+        """Bring the index up to date with the folders and save it. Slow (it parses files): run it off the main thread."""
+        listed = self.list_folders()
+        with self.lock:
+            old_playlists, old_tracks = self.playlists, self.tracks
+
+        playlists = {}
+        for folder_name in list(old_playlists) + [name for name in listed if name not in old_playlists]:
+            if folder_name not in listed:
+                continue
+            songs = set(listed[folder_name])
+            known = [path for path in old_playlists.get(folder_name, []) if path in songs]
+            known_set = set(known)
+            playlists[folder_name] = known + [path for path in listed[folder_name] if path not in known_set]
+
+        tracks = {}
+        for songs in playlists.values():
+            for path in songs:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                track = old_tracks.get(path)
+                if track is None or track["mtime"] != stat.st_mtime or track["size"] != stat.st_size:
+                    track = read_track_info(path, stat)
+                tracks[path] = track
+
+        with self.lock:
+            self.playlists, self.tracks = playlists, tracks
+        self.save()
+
+    def save(self):
+        with self.lock:
+            index = {"playlists": self.playlists, "tracks": self.tracks}
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.index_path)
@@ -0,0 +1,68 @@
+from time import perf_counter
+from collections import deque
+
+import src.engine.constants as constants
+
+
+class FrameProfiler:
+    """
+    Lap timer for the stages of one rendered frame, shown by drawing.draw_profiler_overlay().
+
+    Call begin_frame() when a frame starts, lap(stage) after each stage and end_frame() once it
+    has been flipped. A lap charges the time since the previous lap to `stage`; stages that run
+    several times a frame (the simulation stages run once per tick) are summed.
+    While the overlay is hidden every call returns straight away.
+    """
+    def __init__(self, window=constants.profiler_window_frames):
+        self.enabled = False
+        self.window = window
+        self.history = {}  # stage -> deque of per-frame ms, in the order stages first ran
+        self.frame_history = deque(maxlen=window)  # whole-frame ms
+        self.current = {}
+        self.last = 0.0
+        self.frame_start = 0.0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.history = {}
+        self.frame_history.clear()
+        self.current = {}
+        self.last = self.frame_start = perf_counter()
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current = {}
+        self.last = self.frame_start = perf_counter()
+
+    def lap(self, stage):
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self.current[stage] = self.current.get(stage, 0.0) + (now - self.last)
+        self.last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        current = self.current
+        for stage, seconds in current.items():
+            history = self.history.get(stage)
+            if history is None:
+                history = self.history[stage] = deque(maxlen=self.window)
+            history.append(seconds * 1000)
+        # Stages that didn't run this frame (e.g. no simulation ticks) count as 0 ms.
+        for stage, history in self.history.items():
+            if stage not in current:
+                history.append(0.0)
+        self.frame_history.append((self.last - self.frame_start) * 1000)
+        self.current = {}
+
+    def summary(self):
+        """[(stage, average ms, worst ms)] over the window, ending with the whole frame."""
+        rows = [(stage, sum(history) / len(history), max(history))
+                for stage, history in self.history.items() if history]
+        if self.frame_history:
+            frames = self.frame_history
+            rows.append(("frame", sum(frames) / len(frames), max(frames)))
+        return rows
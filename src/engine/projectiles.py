@@ -2,15 +2,82 @@ from enum import Enum
 from dataclasses import dataclass
 import pygame
 import math
+import numpy as np
 import src.engine.game_state as game_state
 import src.engine.constants as constants
 from src.engine.helpers import get_ui_scaling_factor
 from src.player.skins import ProjectileSkin
+from src.ui.render_queue import get_disc
 
 ui_scaling_factor = get_ui_scaling_factor()
 
 from typing import Tuple
 
+def swept_box_overlap(x0, y0, x1, y1, half_size, left, top, right, bottom) -> bool:
+    """
+    Swept collision test: does a square of `half_size` moving from (x0, y0) to (x1, y1)
+    overlap the box at any point along the way? This is a slab test of the movement
+    segment against the box grown by `half_size`. Fast bullets therefore hit what they
+    pass through, not only what they end the tick on top of.
+    Touching edges don't count, matching pygame.Rect.colliderect.
+    """
+    t_enter = 0.0
+    t_exit = 1.0
+
+    dx = x1 - x0
+    if dx == 0:
+        if not (left - half_size < x0 < right + half_size):
+            return False
+    else:
+        t1 = (left - half_size - x0) / dx
+        t2 = (right + half_size - x0) / dx
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_enter:
+            t_enter = t1
+        if t2 < t_exit:
+            t_exit = t2
+        if t_enter >= t_exit:
+            return False
+
+    dy = y1 - y0
+    if dy == 0:
+        return top - half_size < y0 < bottom + half_size
+    t1 = (top - half_size - y0) / dy
+    t2 = (bottom + half_size - y0) / dy
+    if t1 > t2:
+        t1, t2 = t2, t1
+    if t1 > t_enter:
+        t_enter = t1
+    if t2 < t_exit:
+        t_exit = t2
+    return t_enter < t_exit
+
+
+def swept_box_overlaps(x0, y0, x1, y1, half_size, left, top, right, bottom):
+    """
+    Vectorised swept_box_overlap for batched bullet backends: the positions and
+    half sizes are NumPy arrays (one entry per bullet), and the box is a single target.
+    Returns a boolean array.
+    """
+    t_enter = np.zeros(len(x0))
+    t_exit = np.ones(len(x0))
+    hit = np.ones(len(x0), dtype=bool)
+    for start, end, low, high in ((x0, x1, left, right), (y0, y1, top, bottom)):
+        delta = end - start
+        low = low - half_size
+        high = high + half_size
+        moving = delta != 0
+        # A bullet that doesn't move along this axis must already be inside the slab.
+        hit &= moving | ((low < start) & (start < high))
+        safe_delta = np.where(moving, delta, 1.0)
+        t1 = (low - start) / safe_delta
+        t2 = (high - start) / safe_delta
+        t_enter = np.where(moving, np.maximum(t_enter, np.minimum(t1, t2)), t_enter)
+        t_exit = np.where(moving, np.minimum(t_exit, np.maximum(t1, t2)), t_exit)
+    return hit & (t_enter < t_exit)
+
+
 class Alignment(Enum):
     PLAYER = "player"
     ENEMY = "enemy"
@@ -34,22 +101,30 @@ class BaseBullet:
 
     def __post_init__(self):
         self.hit_targets = set()  # Track which targets have been hit
+        # Where the bullet started its latest move, for swept collision tests.
+        self.prev_x = self.x
+        self.prev_y = self.y
+        # Colour and size never change after construction, so look the cached disc up once.
+        self.disc_radius = int(self.size)
+        self.disc = get_disc(self.colour, self.disc_radius) if self.disc_radius > 0 else None
 
     def update(self):
         if not self.active:
             return  # Skip update if bullet is not active
 
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.speed * math.cos(math.radians(self.angle))
         self.y += self.speed * math.sin(math.radians(self.angle))
         
-        # Check if bullet is out of bounds first
-        if self.is_out_of_bounds():
-            self.deactivate()
-            return
-        
-        # Check for collisions based on alignment
+        # Check for collisions based on alignment. These test the whole move, so they run
+        # before the out-of-bounds check: a bullet still hits a target it crossed on its way off screen.
         if self.alignment == Alignment.PLAYER:
-            for enemy in game_state.enemies[:]:  # Use slice copy to avoid modification during iteration
+            # Only enemies sharing a grid cell with the swept path can possibly be hit.
+            for enemy in game_state.enemy_grid.query(min(self.prev_x, self.x) - self.size,
+                                                     min(self.prev_y, self.y) - self.size,
+                                                     max(self.prev_x, self.x) + self.size,
+                                                     max(self.prev_y, self.y) + self.size):
                 if self.check_and_apply_collision(enemy):
                     if self.pierce <= 0:
                         self.deactivate()
@@ -57,14 +132,23 @@ class BaseBullet:
         elif self.alignment == Alignment.ENEMY:
             if self.check_and_apply_collision(game_state.player):
                 self.deactivate()
+
+        if self.active and self.is_out_of_bounds():
+            self.deactivate()
     
     def draw(self, screen):
-        if self.active:
-            pygame.draw.circle(screen, self.colour, (int(self.x), int(self.y)), int(self.size))
+        """Queue this bullet on game_state.render_queue; the bullet pool flushes it."""
+        if self.active and self.disc is not None:
+            radius = self.disc_radius
+            game_state.render_queue.push(self.disc, (int(self.x) - radius, int(self.y) - radius))
     
     def get_rect(self) -> pygame.Rect:
         return pygame.Rect(self.x - self.size, self.y - self.size, self.size * 2, self.size * 2)
         
+    def swept_overlap(self, left, top, right, bottom) -> bool:
+        """Whether the bullet overlapped the box at any point during its latest move."""
+        return swept_box_overlap(self.prev_x, self.prev_y, self.x, self.y, self.size, left, top, right, bottom)
+
     def get_position(self) -> Tuple[float, float]:
         return (self.x, self.y)
 
@@ -87,8 +171,22 @@ class BaseBullet:
         self.__init__(*args, **kwargs)
 
 class BulletPool:
+    """
+    Object pool of BaseBullet instances.
+    Inactive bullets wait in a free list per bullet class and live bullets sit in one dense
+    list, so acquiring or releasing a bullet is O(1) and update/draw only touch live bullets.
+    """
     def __init__(self):
-        self.pool = []  # Holds all bullet objects (active and inactive)
+        self.free_lists = {}  # bullet class -> inactive bullets of exactly that class
+        self.active_bullets = []  # live bullets, in the order they were fired
+        self.stats = {}  # bullet class -> {"live", "free", "high_water"} counters
+        self._templates = {}  # bullet class -> scratch instance used by get_bullets()
+
+    def _class_stats(self, bullet_class):
+        stats = self.stats.get(bullet_class)
+        if stats is None:
+            stats = self.stats[bullet_class] = {"live": 0, "free": 0, "high_water": 0}
+        return stats
 
     def get_bullet(self, bullet_class, *args, **kwargs):
         """
@@ -96,27 +194,107 @@ class BulletPool:
         If none is available, create a new one.
         The args/kwargs are the parameters for the bullet's constructor.
         """
-        # Look for an inactive bullet of the same type.
-        for bullet in self.pool:
-            if isinstance(bullet, bullet_class) and not bullet.active:
-                bullet.reset(*args, **kwargs)
-                return bullet
-        # If none found, create a new bullet.
-        bullet = bullet_class(*args, **kwargs)
-        self.pool.append(bullet)
+        stats = self._class_stats(bullet_class)
+        free_list = self.free_lists.get(bullet_class)
+        if free_list:
+            bullet = free_list.pop()
+            bullet.reset(*args, **kwargs)
+            stats["free"] -= 1
+        else:
+            bullet = bullet_class(*args, **kwargs)
+        self.active_bullets.append(bullet)
+        stats["live"] += 1
+        if stats["live"] > stats["high_water"]:
+            stats["high_water"] = stats["live"]
         return bullet
 
+    def get_bullets(self, bullet_class, x, y, angles, speeds=None, directions=None, **kwargs):
+        """
+        Allocate one bullet of `bullet_class` per angle, all fired from (x, y).
+        The constructor runs once on a scratch instance and every bullet copies its fields,
+        so a whole pattern costs one __init__ instead of one per bullet.
+        `speeds` are constructor speed arguments per bullet (bullet classes scale speed
+        linearly); `directions` is only used by the NumPy backend.
+        """
+        template = self._templates.get(bullet_class)
+        if speeds is not None:
+            kwargs["speed"] = 1.0
+        if template is None:
+            template = self._templates[bullet_class] = bullet_class(x=x, y=y, angle=angles[0], **kwargs)
+        else:
+            template.reset(x=x, y=y, angle=angles[0], **kwargs)
+        fields = template.__dict__
+        unit_speed = template.speed
+
+        stats = self._class_stats(bullet_class)
+        free_list = self.free_lists.setdefault(bullet_class, [])
+        active_bullets = self.active_bullets
+        for i, angle in enumerate(angles):
+            if free_list:
+                bullet = free_list.pop()
+                stats["free"] -= 1
+            else:
+                bullet = bullet_class.__new__(bullet_class)
+            bullet.__dict__.update(fields)
+            bullet.angle = angle
+            if speeds is not None:
+                bullet.speed = unit_speed * speeds[i]
+            bullet.hit_targets = set()
+            active_bullets.append(bullet)
+        stats["live"] += len(angles)
+        if stats["live"] > stats["high_water"]:
+            stats["high_water"] = stats["live"]
+
+    def _release(self, bullet):
+        bullet_class = type(bullet)
+        self.free_lists.setdefault(bullet_class, []).append(bullet)
+        stats = self.stats[bullet_class]
+        stats["live"] -= 1
+        stats["free"] += 1
+
     def update(self):
-        """Update all active bullets."""
-        for bullet in self.pool:
+        """Update all active bullets, moving any that deactivate back to their free lists."""
+        # Enemies have already moved this tick; bucket them once for every bullet's collision checks.
+        game_state.enemy_grid.rebuild(game_state.enemies)
+        survivors = []
+        for bullet in self.active_bullets:
+            bullet.update()
             if bullet.active:
-                bullet.update()
+                survivors.append(bullet)
+            else:
+                self._release(bullet)
+        self.active_bullets = survivors
 
-    def draw(self, screen):
-        """Draw all active bullets."""
-        for bullet in self.pool:
-            if bullet.active:
-                bullet.draw(screen)
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw all active bullets.
+        `alpha` is unused here: these bullets are interpolated by the PositionInterpolator
+        via interpolated_entities().
+        """
+        for bullet in self.active_bullets:
+            bullet.draw(screen)
+        game_state.render_queue.flush(screen)
+
+    def clear(self):
+        """Deactivate every bullet (used when a run is reset)."""
+        for bullet in self.active_bullets:
+            bullet.deactivate()
+            self._release(bullet)
+        self.active_bullets = []
+
+    def interpolated_entities(self):
+        return self.active_bullets
+
+    def count_active(self):
+        return len(self.active_bullets)
+
+    def get_stats(self):
+        """Live, free and high-water bullet counts keyed by bullet class name."""
+        return {bullet_class.__name__: dict(stats) for bullet_class, stats in self.stats.items()}
+
+    def __len__(self):
+        """Total bullets ever allocated (live + free)."""
+        return sum(stats["live"] + stats["free"] for stats in self.stats.values())
 @dataclass
 class PlayerBaseBullet(BaseBullet):
     # New attribute for projectile skin.
@@ -137,16 +315,16 @@ class PlayerBaseBullet(BaseBullet):
             pierce=pierce,
             can_repierce=can_repierce
         )
-        self.projectile_skin = projectile_skin
+        self.projectile_skin = projectile_skin  # shared by every bullet fired with it
+        self.spawn_tick = game_state.in_game_ticks_elapsed  # how far a spinning skin has turned
 
     def draw(self, screen):
         if self.active:
             if self.projectile_skin:
-                # Update and draw the projectile skin.
-                self.projectile_skin.update()
-                self.projectile_skin.draw(screen, int(self.x), int(self.y), int(self.size))
+                game_state.render_queue.push(*self.projectile_skin.get_sprite(
+                    int(self.x), int(self.y), int(self.size), self.angle, game_state.in_game_ticks_elapsed - self.spawn_tick))
             else:
-                pygame.draw.circle(screen, self.colour, (int(self.x), int(self.y)), int(self.size))
+                super().draw(screen)
     
     def compute_scaled_damage(self) -> float:
         if getattr(self, "scales_with_distance_travelled", False):
@@ -167,8 +345,9 @@ class PlayerBaseBullet(BaseBullet):
             return self.damage
 
     def check_and_apply_collision(self, enemy) -> bool:
+        half_size = constants.enemy_collision_half_size
         if (enemy.health > 0 and
-            pygame.Rect(enemy.x - 20, enemy.y - 20, 40, 40).colliderect(self.get_rect())):
+            self.swept_overlap(enemy.x - half_size, enemy.y - half_size, enemy.x + half_size, enemy.y + half_size)):
             
             if not self.can_repierce and enemy in self.hit_targets:
                 return False
@@ -241,10 +420,9 @@ class BaseEnemyBullet(BaseBullet):
         )
     def check_and_apply_collision(self, target) -> bool:
         # Use player's size attribute for collision detection
-        if pygame.Rect(game_state.player.x - game_state.player.size/2, 
-                      game_state.player.y - game_state.player.size/2, 
-                      game_state.player.size, 
-                      game_state.player.size).colliderect(self.get_rect()):
+        half_size = game_state.player.size / 2
+        if self.swept_overlap(game_state.player.x - half_size, game_state.player.y - half_size,
+                              game_state.player.x + half_size, game_state.player.y + half_size):
             actual_damage = math.floor(self.damage * self.scaling)
             game_state.player.take_damage(actual_damage)
         
@@ -286,11 +464,11 @@ class BasicEnemyHomingBullet(BaseEnemyBullet):
             base_damage=constants.base_basic_enemy_damage,
             colour=constants.RED
         )
-        self.spawn_time: float = pygame.time.get_ticks() / 1000.0
+        # Measured in in-game ticks so homing behaves the same when paused or simulated headlessly.
+        self.spawn_tick: int = game_state.in_game_ticks_elapsed
     
     def should_home(self) -> bool:
-        current_time = pygame.time.get_ticks() / 1000.0
-        return (current_time - self.spawn_time) < 1
+        return (game_state.in_game_ticks_elapsed - self.spawn_tick) < constants.FPS
         
     def update(self):
         super().update()
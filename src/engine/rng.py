@@ -0,0 +1,52 @@
+import time
+import random
+
+# Named random streams, one per subsystem, all derived from a single run seed.
+# Gameplay code draws only from its own stream, so e.g. rendering a particle or opening a menu
+# can't shift the enemy spawns of a seeded or replayed run.
+#   spawns   - enemy type and spawn side
+#   enemies  - enemy AI: shot delays, strafing
+#   patterns - bullet pattern spread and speeds
+#   pickups  - heart spawn positions
+#   upgrades - level-up offers and Roll the Dice
+#   effects  - cosmetic only (particles, damage-number jitter); may be consumed by drawing
+STREAM_NAMES = ("spawns", "enemies", "patterns", "pickups", "upgrades", "effects")
+
+_streams = {}
+run_seed = None
+
+
+def stream(name):
+    """
+    The random.Random for subsystem `name`. Modules keep the returned object for the whole
+    process; seed_all() reseeds it in place.
+    """
+    rng = _streams.get(name)
+    if rng is None:
+        rng = _streams[name] = random.Random()
+        if run_seed is not None:
+            rng.seed(f"{run_seed}:{name}")
+    return rng
+
+
+def seed_all(seed=None):
+    """Reseed every stream from one run seed (a fresh one from the clock if None). Returns the seed used."""
+    global run_seed
+    if seed is None:
+        seed = time.time_ns() % (2 ** 32)
+    run_seed = seed
+    for name in STREAM_NAMES:
+        stream(name).seed(f"{seed}:{name}")
+    return seed
+
+
+def get_states():
+    return {name: rng.getstate() for name, rng in _streams.items()}
+
+
+def set_states(states):
+    for name, state in states.items():
+        stream(name).setstate(state)
+
+
+seed_all()
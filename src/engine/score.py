@@ -4,6 +4,7 @@ import hashlib
 from src.engine.helpers import get_text_scaling_factor
 import src.engine.game_state as game_state
 import src.engine.constants as constants
+from src.ui.text_cache import render_text
 
 # Initialize score
 score = 0
@@ -72,10 +73,10 @@ def update_high_score():
         save_high_score()
 
 def draw_score(screen):
-    score_text = game_state.FONTS["medium"].render(f"Score: {score}", True, constants.WHITE)
-    high_score_text = game_state.FONTS["medium"].render(f"High Score: {high_score}", True, constants.WHITE)
-    screen.blit(score_text, (20, 55))
-    screen.blit(high_score_text, (20, 85))
+    score_text = render_text(game_state.FONTS["medium"], f"Score: {score}", constants.WHITE)
+    high_score_text = render_text(game_state.FONTS["medium"], f"High Score: {high_score}", constants.WHITE)
+    game_state.dirty_rects.add(screen.blit(score_text, (20, 55)))
+    game_state.dirty_rects.add(screen.blit(high_score_text, (20, 85)))
     
 def get_score():
     return score
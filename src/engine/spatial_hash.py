@@ -0,0 +1,64 @@
+import src.engine.constants as constants
+
+
+class SpatialHash:
+    """
+    Uniform grid bucketing enemies by the cells their collision box overlaps.
+    Rebuilt once per tick so each bullet only tests enemies in the cells it touches
+    instead of every enemy on screen.
+
+    Queries return candidates in the same order as the list the grid was built from,
+    so "first enemy hit wins" behaves exactly like a linear scan of game_state.enemies.
+    """
+    def __init__(self, cell_size=constants.collision_grid_cell_size, half_extent=constants.enemy_collision_half_size):
+        self.cell_size = cell_size
+        # Half the side of an enemy's collision box, plus a pixel of slack because
+        # pygame.Rect truncates the float coordinates it is built from.
+        self.half_extent = half_extent + 1
+        self.cells = {}
+        self.order = {}
+
+    def rebuild(self, entities):
+        cells = {}
+        order = {}
+        cell_size = self.cell_size
+        half_extent = self.half_extent
+        for index, entity in enumerate(entities):
+            order[id(entity)] = index
+            min_cx = int((entity.x - half_extent) // cell_size)
+            max_cx = int((entity.x + half_extent) // cell_size)
+            min_cy = int((entity.y - half_extent) // cell_size)
+            max_cy = int((entity.y + half_extent) // cell_size)
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [entity]
+                    else:
+                        bucket.append(entity)
+        self.cells = cells
+        self.order = order
+
+    def query(self, left, top, right, bottom):
+        """Return entities whose cells overlap the given box, in build order."""
+        cell_size = self.cell_size
+        min_cx = int((left - 1) // cell_size)
+        max_cx = int((right + 1) // cell_size)
+        min_cy = int((top - 1) // cell_size)
+        max_cy = int((bottom + 1) // cell_size)
+
+        if min_cx == max_cx and min_cy == max_cy:
+            # Common case: a bucket is already in build order and has no duplicates.
+            return self.cells.get((min_cx, min_cy), ())
+
+        found = {}
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    for entity in bucket:
+                        found[id(entity)] = entity
+        if len(found) < 2:
+            return list(found.values())
+        order = self.order
+        return sorted(found.values(), key=lambda entity: order[id(entity)])
@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+
+import src.engine.constants as constants
+
+
+class FixedTimestep:
+    """
+    Accumulates real frame time and hands out whole simulation ticks of 1 / tick_rate seconds.
+    Every timing in the game is expressed in ticks at constants.FPS, so the simulation always
+    advances at that rate no matter how fast or slow frames are rendered.
+    """
+    def __init__(self, tick_rate=constants.FPS, max_ticks_per_frame=constants.max_sim_ticks_per_frame):
+        self.tick_seconds = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+
+    def advance(self, frame_seconds):
+        """Add a frame's worth of time and return how many ticks should run this frame."""
+        self.accumulator += frame_seconds
+        ticks = int(self.accumulator / self.tick_seconds)
+        if ticks > self.max_ticks_per_frame:
+            # After a long hitch, drop the backlog instead of spiralling into ever longer frames.
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.tick_seconds
+        return ticks
+
+    def reset(self):
+        """Forget any accumulated time, e.g. while paused or in a menu."""
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self):
+        """How far (0..1) the renderer is between the previous tick and the current one."""
+        return min(1.0, self.accumulator / self.tick_seconds)
+
+
+class PositionInterpolator:
+    """
+    Remembers where entities were at the start of the latest tick so they can be drawn
+    part-way between that and their current position.
+    Entities are keyed by id(); pooled objects stay alive, and anything activated after
+    the snapshot is simply drawn where it is.
+    """
+    def __init__(self):
+        self.previous = {}
+
+    def snapshot(self, entities):
+        self.previous = {id(entity): (entity.x, entity.y) for entity in entities}
+
+    def clear(self):
+        self.previous = {}
+
+    @contextmanager
+    def interpolated(self, entities, alpha):
+        """Temporarily move entities to their interpolated positions for drawing."""
+        saved = []
+        if self.previous and alpha < 1.0:
+            for entity in entities:
+                previous = self.previous.get(id(entity))
+                if previous is None:
+                    continue
+                x, y = entity.x, entity.y
+                saved.append((entity, x, y))
+                entity.x = previous[0] + (x - previous[0]) * alpha
+                entity.y = previous[1] + (y - previous[1]) * alpha
+        try:
+            yield
+        finally:
+            for entity, x, y in saved:
+                entity.x = x
+                entity.y = y
@@ -1,25 +1,34 @@
 import pygame
 import threading
+from time import perf_counter
 import os  # Import os module to check for file existence
 
 import src.engine.constants as constants
 import src.engine.game_state as game_state
 import src.engine.logic as logic
 import src.ui.drawing as drawing
+import src.ui.text_cache as text_cache
 import src.engine.score as score
+import src.engine.rng as rng
 from src.player.player import Player, PlayerState
 from src.engine.helpers import (
-    reset_game, fade_to_black, fade_from_black_step, load_skin_selection, save_skin_selection, get_background_image
+    reset_game, fade_to_black, fade_from_black_step, load_skin_selection, save_skin_selection, get_background_image,
+    load_render_fps_cap, load_record_replay_path, load_dirty_rect_rendering
 )
 from src.ui.menu import (
-    draw_level_up_menu, draw_pause_menu, draw_upgrades_tab, draw_stats_tab, 
+    draw_level_up_menu, prefetch_level_up_menu, draw_pause_menu, draw_upgrades_tab, draw_stats_tab, 
     draw_main_menu, draw_skin_selection_menu
 )
 from src.engine.music_handler import (
-    MUSIC_END_EVENT, switch_playlist, previous_song, next_song, 
-    load_and_play_music
+    MUSIC_END_EVENT, MUSIC_LIBRARY_EVENT, switch_playlist, previous_song, next_song, song_ended,
+    music_library_updated, stop_music_worker, load_and_play_music
 )
 from src.enemies.enemy_pool import EnemyPool
+from src.enemies.sprites import prebake_enemy_sprites
+from src.engine.timestep import FixedTimestep, PositionInterpolator
+from src.engine.inputs import live_input, InputRecorder
+from src.player.pickups import update_heart_effects, draw_heart_effects
+from src.player.upgrades import get_upgrade_icons
 
 
 def main():
@@ -68,6 +77,42 @@ def main():
     # Create a clock once for the game loop.
     clock = pygame.time.Clock()
     enemy_pool = EnemyPool()  # Ideally created once (adjust as needed)
+    prebake_enemy_sprites(enemy_pool.enemy_classes)
+    game_state.player.prebake_projectile_skins()
+    get_upgrade_icons()
+    # The simulation runs at a fixed constants.FPS ticks per second, independent of the render rate.
+    render_fps_cap = load_render_fps_cap()
+    timestep = FixedTimestep()
+    interpolator = PositionInterpolator()
+    # Optionally record every run so it can be replayed exactly with `python -m src.sim --replay`.
+    record_replay_path = load_record_replay_path()
+    recorder = None
+
+    profiler = game_state.profiler
+    frame_recorder = game_state.frame_recorder
+    dirty_rects = game_state.dirty_rects
+    dirty_rects.enabled = load_dirty_rect_rendering()
+
+    def present_frame(full_screen=False):
+        """
+        Show a finished in-game frame; `full_screen` for frames with a menu or fade over the whole screen.
+        Menus drawn over the game and the flip itself are profiled too.
+        """
+        profiler.lap("menus")
+        if profiler.enabled:
+            drawing.draw_profiler_overlay()
+            profiler.lap("profiler")
+        if full_screen:
+            dirty_rects.invalidate()
+        dirty_rects.present()
+        profiler.lap("flip")
+        profiler.end_frame()
+        frame_recorder.end_frame()
+
+    def start_recording():
+        if not record_replay_path:
+            return None
+        return InputRecorder(live_input, rng.run_seed, game_state.screen_width, game_state.screen_height)
 
     # Main loop (state-machine style).
     while True:
@@ -75,8 +120,11 @@ def main():
         events = pygame.event.get()
         for event in events:
             if event.type == MUSIC_END_EVENT:
-                next_song()
+                song_ended()
+            if event.type == MUSIC_LIBRARY_EVENT:
+                music_library_updated(event)
             if event.type == pygame.QUIT:
+                stop_music_worker()
                 pygame.quit()
                 exit()
 
@@ -95,6 +143,8 @@ def main():
                     if start_button.rect.collidepoint(design_mouse_pos):
                         game_state.in_main_menu = False
                         game_state.running = True
+                        rng.seed_all()
+                        recorder = start_recording()
                         fade_to_black(game_state.screen, 5, 10)
                         game_state.screen.fill(constants.BLACK)
                         game_state.fade_alpha = 255
@@ -106,6 +156,7 @@ def main():
                         game_state.screen.fill(constants.BLACK)
                         game_state.fade_alpha = 255
                     elif quit_button.rect.collidepoint(design_mouse_pos):
+                        stop_music_worker()
                         pygame.quit()
                         exit()
             pygame.display.flip()
@@ -156,9 +207,11 @@ def main():
 
         # ---------------- Game Loop State ----------------
         if game_state.running:
-            clock.tick(constants.FPS)
+            frame_seconds = clock.tick(render_fps_cap) / 1000.0
+            profiler.begin_frame()
+            frame_recorder.begin_frame(frame_seconds)
             bg_image = get_background_image()
-            game_state.screen.blit(bg_image, (0, 0))  
+            dirty_rects.restore_background(game_state.screen, bg_image)
             
             # Filter events for in-game processing.
             filtered_events = []
@@ -172,6 +225,10 @@ def main():
                         game_state.showing_stats = False
                         game_state.showing_upgrades = False
                         escHandled = True
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    frame_recorder.export()
                 else:
                     filtered_events.append(event)
             events = filtered_events
@@ -180,33 +237,58 @@ def main():
             for event in events:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE and game_state.game_over:
                     reset_game()
+                    recorder = start_recording()
+                    timestep.reset()
+                    interpolator.clear()
                     bg_image = get_background_image()
                     game_state.screen.blit(bg_image, (0, 0)) 
+                    dirty_rects.invalidate()
                     game_loop_faded_in = False
                     game_state.fade_alpha = 255
                     reset_triggered = True
                     break
             if reset_triggered:
                 continue
+            profiler.lap("background")
 
             if (not getattr(game_state, 'paused', False) and 
                 game_state.player.state != PlayerState.LEVELING_UP and 
                 not getattr(game_state, 'showing_upgrades', False) and 
                 not getattr(game_state, 'showing_stats', False)):
-                logic.handle_input()
-                game_state.player.update_angle(pygame.mouse.get_pos())
-
-            enemy_pool.draw(game_state.screen)
-            game_state.bullet_pool.draw(game_state.screen)
-            for heart in game_state.hearts:
-                heart.update()
-                heart.draw(game_state.screen)
-            game_state.player.draw(game_state.screen)
+                # Run as many fixed ticks as the elapsed frame time calls for.
+                sim_start = perf_counter()
+                sim_ticks = 0
+                for _ in range(timestep.advance(frame_seconds)):
+                    interpolator.snapshot(logic.get_interpolated_entities())
+                    profiler.lap("interpolation")
+                    logic.step_simulation(enemy_pool, recorder)
+                    sim_ticks += 1
+                    if game_state.player.state == PlayerState.LEVELING_UP:
+                        # Freeze the world the moment the level-up menu should open.
+                        timestep.reset()
+                        break
+                frame_recorder.add_simulation(perf_counter() - sim_start, sim_ticks)
+                if game_state.player.state != PlayerState.LEVELING_UP:
+                    # Get the next level-up menu ready while the player closes in on it.
+                    prefetch_level_up_menu()
+            else:
+                timestep.reset()
+                interpolator.clear()
+
+            # Draw moving entities between their last two simulated positions.
+            with interpolator.interpolated(logic.get_interpolated_entities(), timestep.alpha):
+                enemy_pool.draw(game_state.screen)
+                profiler.lap("draw enemies")
+                game_state.bullet_pool.draw(game_state.screen, timestep.alpha)
+                profiler.lap("draw bullets")
+                update_heart_effects()
+                draw_heart_effects(game_state.screen)
+                game_state.render_queue.flush(game_state.screen)
+                profiler.lap("draw pickups")
+                game_state.player.draw(game_state.screen)
+                profiler.lap("draw player")
             score.draw_score(game_state.screen)
-            
-            in_game_seconds = game_state.in_game_ticks_elapsed / constants.FPS
-            game_state.enemy_scaling = logic.calculate_enemy_scaling(in_game_seconds)
-            game_state.wave_interval = logic.calculate_wave_spawn_interval(in_game_seconds)
+
             left_click_cooldown_progress, right_click_cooldown_progress = game_state.player.get_cooldown_progress()
             fps = clock.get_fps()
             drawing.draw_skill_icons(left_click_cooldown_progress, right_click_cooldown_progress, fps)
@@ -215,7 +297,7 @@ def main():
             elapsed_seconds = game_state.in_game_ticks_elapsed // constants.FPS
             minutes = elapsed_seconds // 60
             seconds = elapsed_seconds % 60
-            time_text = game_state.FONTS["medium"].render(f"Time: {minutes:02d}:{seconds:02d}", True, constants.WHITE)
+            time_text = text_cache.render_text(game_state.FONTS["medium"], f"Time: {minutes:02d}:{seconds:02d}", constants.WHITE)
             time_rect = time_text.get_rect(topright=(game_state.screen_width - 20, 20))
             bg_rect = time_rect.copy()
             bg_rect.inflate_ip(20, 10)
@@ -223,11 +305,12 @@ def main():
             bg_surface.fill(constants.BLACK)
             bg_surface.set_alpha(128)
             game_state.screen.blit(bg_surface, bg_rect)
-            pygame.draw.rect(game_state.screen, (0, 0, 0), bg_rect, 2)
+            dirty_rects.add(pygame.draw.rect(game_state.screen, (0, 0, 0), bg_rect, 2))
             game_state.screen.blit(time_text, time_rect)
             
             drawing.draw_notification()
             drawing.draw_player_state_value_updates()
+            profiler.lap("hud")
             
             if getattr(game_state, 'paused', False):
                 quit_button, resume_button, volume_slider, upgrades_button, stats_button, volume_button, playlist_button, previous_button, skip_button = draw_pause_menu(game_state.screen)
@@ -244,6 +327,10 @@ def main():
                     if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                         design_mouse_pos = pygame.mouse.get_pos()
                         if quit_button.rect.collidepoint(design_mouse_pos):
+                            if recorder is not None:
+                                recorder.save(record_replay_path)
+                                recorder = None
+                            enemy_pool.clear()
                             reset_game()
                             game_state.in_main_menu = True
                             game_loop_faded_in = False
@@ -267,7 +354,7 @@ def main():
                             previous_song()
                         elif skip_button.rect.collidepoint(design_mouse_pos):
                             next_song()
-                pygame.display.flip()
+                present_frame(full_screen=True)
                 continue
             
             if getattr(game_state, 'showing_upgrades', False):
@@ -284,7 +371,7 @@ def main():
                         if close_button.rect.collidepoint(design_mouse_pos):
                             game_state.showing_upgrades = False
                             game_state.paused = True
-                pygame.display.flip()
+                present_frame(full_screen=True)
                 continue
             
             if getattr(game_state, 'showing_stats', False):
@@ -301,7 +388,7 @@ def main():
                         if close_button.rect.collidepoint(design_mouse_pos):
                             game_state.showing_stats = False
                             game_state.paused = True
-                pygame.display.flip()
+                present_frame(full_screen=True)
                 continue
             
             if game_state.player.state == PlayerState.LEVELING_UP:
@@ -316,7 +403,7 @@ def main():
 
                 # If less than 500ms have passed, skip processing clicks
                 if elapsed < 500:
-                    pygame.display.flip()
+                    present_frame(full_screen=True)
                     continue
 
                 for event in events:
@@ -325,6 +412,8 @@ def main():
                         break
                     for button in upgrade_buttons:
                         if button.handle_event(event):
+                            if recorder is not None:
+                                recorder.record_upgrade(button.upgrade.name, len(upgrade_buttons))
                             game_state.player.apply_upgrade(button.upgrade)
                             game_state.player.state = PlayerState.ALIVE
                             if hasattr(game_state, 'current_upgrade_buttons'):
@@ -334,53 +423,31 @@ def main():
                                 delattr(game_state, 'level_up_start_time')
                             break
 
-                pygame.display.flip()
+                present_frame(full_screen=True)
                 continue
 
-            
-            # Wave spawning logic
-            if not game_state.wave_active:
-                if (in_game_seconds - game_state.last_wave_time >= game_state.wave_interval or 
-                    len(game_state.enemies) == 0):
-                    game_state.wave_active = True
-                    game_state.wave_enemies_spawned = 0
-                    game_state.next_enemy_spawn_time = in_game_seconds + 0.5
-            else:
-                if in_game_seconds >= game_state.next_enemy_spawn_time and game_state.wave_enemies_spawned < 5:
-                    enemy_pool.spawn_enemy()
-                    game_state.wave_enemies_spawned += 1
-                    game_state.next_enemy_spawn_time = in_game_seconds + 0.5
-                if game_state.wave_enemies_spawned >= 5:
-                    game_state.wave_active = False
-                    game_state.last_wave_time = in_game_seconds
-
-            enemy_pool.update()
-            logic.update_projectiles()
-            logic.spawn_heart()
-            logic.update_hearts()
-
-            if game_state.player.health <= 0:
-                if not game_state.game_over:  # Only do this once
-                    game_state.game_over = True
-                    game_state.final_time = game_state.in_game_ticks_elapsed // constants.FPS
-                    game_state.final_score = score.score
 
             if game_state.game_over:
+                if recorder is not None:
+                    recorder.save(record_replay_path)
+                    recorder = None
+                if frame_recorder.count:
+                    frame_recorder.export()
+                    frame_recorder.clear()
                 game_state.fade_alpha = min(game_state.fade_alpha + 10, 255)
                 game_state.player.x = game_state.screen_width // 2
                 game_state.player.y = game_state.screen_height // 2
-                game_state.enemies.clear()
+                enemy_pool.clear()
                 score.update_high_score()
                 drawing.show_game_over_screen(game_state.screen, game_state.screen_width, game_state.screen_height, game_state.fade_alpha)
 
-            game_state.in_game_ticks_elapsed += 1
             if not game_loop_faded_in:
                 if game_state.fade_alpha > 0:
                     fade_from_black_step(game_state.screen, step=20)
                 else:
                     game_loop_faded_in = True
 
-            pygame.display.flip()
+            present_frame(full_screen=game_state.game_over or not game_loop_faded_in)
             continue
         
         pygame.display.update()
@@ -391,6 +458,7 @@ def main():
             break
 
     # (Optional: if you have any other state, process it here.)
+    stop_music_worker()
     pygame.mixer.quit()
     pygame.quit()
     exit()
@@ -1,14 +1,16 @@
 from enum import Enum
 import pygame
 import math
-import random
+from src.engine.rng import stream
 
 from src.engine.projectiles import PlayerBasicBullet, PlayerSpecialBullet
 from src.engine.helpers import calculate_angle, get_ui_scaling_factor
 import src.engine.constants as constants
 from src.player.skins import Skin
+from src.ui.drawing import render_health_bar
 
 ui_scaling_factor = get_ui_scaling_factor()
+upgrade_rng = stream("upgrades")
 
 class PlayerState(Enum):
     ALIVE = "alive"
@@ -98,8 +100,8 @@ class Player:
         self.last_special_shot_time = 0
 
         self.applied_upgrades = set()  # Tracks names of applied upgrades
-        self.upgrade_levels = {}  # Tracks number of times each upgrade has been applied
-        self.active_buffs = {}  # Dictionary to store active buffs and their end ticks (not times)
+        self.reset_upgrade_levels()
+        self.active_buffs = []  # Active buffs and their end ticks (not times)
         
         # NEW: initialize bonus damage accumulation for the next special attack.
         self.special_attack_bonus_damage = 0
@@ -129,7 +131,7 @@ class Player:
 
         # Draw the current skin
         current_skin = self.skins.get(self.current_skin_id, self.skins["default"])
-        current_skin.draw(screen, self.x, self.y, self.size, flip=flip)
+        game_state.dirty_rects.add(current_skin.draw(screen, self.x, self.y, self.size, flip=flip))
         
         # Direction arrow
         if not self.dying:  # Optionally, you can hide the arrow during the dissolve                
@@ -140,24 +142,21 @@ class Player:
             start_y = self.y + arrow_start_offset * math.sin(angle_rad)
             end_x = self.x + (arrow_start_offset + arrow_length) * math.cos(angle_rad)
             end_y = self.y + (arrow_start_offset + arrow_length) * math.sin(angle_rad)
-            pygame.draw.line(screen, constants.BLUE, (start_x, start_y), (end_x, end_y), 3)
+            game_state.dirty_rects.add(pygame.draw.line(screen, constants.BLUE, (start_x, start_y), (end_x, end_y), 3))
 
         # Draw health bar with fade effect during death
         self.draw_health_bar(screen)
 
     def draw_health_bar(self, screen, bar_width=300, bar_height=20):
+        import src.engine.game_state as game_state
         x = 20  # Fixed position for health bar
         y = 20
-        filled_width = int((self.health / self.max_health) * bar_width)
-        surface = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA)
-        pygame.draw.rect(surface, (0, 0, 0, 190), (0, 0, bar_width, bar_height))
-        pygame.draw.rect(surface, constants.TRANSLUCENT_GREEN, (0, 0, filled_width, bar_height))
-        pygame.draw.rect(surface, constants.BLACK, (0, 0, bar_width, bar_height), 2)
-        screen.blit(surface, (x, y))
+        surface = render_health_bar(self.health, self.max_health, constants.TRANSLUCENT_GREEN, bar_width, bar_height,
+                                    background=(0, 0, 0, 190), border_width=2)
+        game_state.dirty_rects.add(screen.blit(surface, (x, y)))
 
     def update_angle(self, mouse_pos):
-        design_mouse_pos = pygame.mouse.get_pos()
-        mx, my = design_mouse_pos
+        mx, my = mouse_pos
         self.angle = calculate_angle(self.x, self.y, mx, my)
         
     def move(self, keys):
@@ -238,8 +237,7 @@ class Player:
         if self.state == PlayerState.DEAD or (game_state.in_game_ticks_elapsed - self.last_shot_time) < (self.shoot_cooldown * constants.FPS):
             return
 
-        design_mouse_pos = pygame.mouse.get_pos()
-        mx, my = design_mouse_pos
+        mx, my = mouse_pos
         angle = calculate_angle(self.x, self.y, mx, my)
         self.last_shot_time = game_state.in_game_ticks_elapsed
         effective_multiplier = self.effective_damage_multiplier
@@ -250,14 +248,7 @@ class Player:
         total_projectiles = 1 + self.basic_bullet_extra_projectiles_per_shot_bonus
 
         if total_projectiles == 1:
-            # Clone the projectile skin so that the bullet gets its own instance.
-            if hasattr(base_skin, "clone_with_firing_rotation"):
-                projectile_skin = base_skin.clone_with_firing_rotation(angle)
-            elif hasattr(base_skin, "clone"):
-                projectile_skin = base_skin.clone()
-            else:
-                projectile_skin = base_skin
-
+            # Bullets share the skin's sprites; each draws them at its own angle and age.
             game_state.bullet_pool.get_bullet(
                 PlayerBasicBullet,
                 self.x, self.y, angle, 
@@ -266,7 +257,7 @@ class Player:
                 self.basic_bullet_speed_multiplier, 
                 math.ceil(self.basic_bullet_piercing_multiplier),
                 scales_with_distance_travelled=self.basic_bullet_scales_with_distance_travelled,
-                projectile_skin=projectile_skin
+                projectile_skin=base_skin
             )
         else:
             spread_distance = 15  # pixels between projectiles
@@ -278,13 +269,6 @@ class Player:
             for i in range(total_projectiles):
                 offset_x = start_x + (spread_distance * i) * math.cos(math.radians(perpendicular_angle))
                 offset_y = start_y + (spread_distance * i) * math.sin(math.radians(perpendicular_angle))
-                
-                if hasattr(base_skin, "clone_with_firing_rotation"):
-                    bullet_skin = base_skin.clone_with_firing_rotation(angle)
-                elif hasattr(base_skin, "clone"):
-                    bullet_skin = base_skin.clone()
-                else:
-                    bullet_skin = base_skin
 
                 game_state.bullet_pool.get_bullet(
                     PlayerBasicBullet,
@@ -294,7 +278,7 @@ class Player:
                     self.basic_bullet_speed_multiplier,
                     math.ceil(self.basic_bullet_piercing_multiplier),
                     scales_with_distance_travelled=self.basic_bullet_scales_with_distance_travelled,
-                    projectile_skin=bullet_skin
+                    projectile_skin=base_skin
                 )
 
     def shoot_special(self, mouse_pos):
@@ -302,19 +286,12 @@ class Player:
         if self.state == PlayerState.DEAD or (game_state.in_game_ticks_elapsed - self.last_special_shot_time) < (self.special_shot_cooldown * constants.FPS):
             return
 
-        design_mouse_pos = pygame.mouse.get_pos()
-        mx, my = design_mouse_pos
+        mx, my = mouse_pos
         angle = calculate_angle(self.x, self.y, mx, my)
         self.last_special_shot_time = game_state.in_game_ticks_elapsed
         effective_multiplier = self.effective_damage_multiplier
 
-        base_skin = self.skins[self.current_skin_id].projectile_skin_special
-        if hasattr(base_skin, "clone_with_firing_rotation"):
-            projectile_skin = base_skin.clone_with_firing_rotation(angle)
-        elif hasattr(base_skin, "clone"):
-            projectile_skin = base_skin.clone()
-        else:
-            projectile_skin = base_skin
+        projectile_skin = self.skins[self.current_skin_id].projectile_skin_special
 
         game_state.bullet_pool.get_bullet(
             PlayerSpecialBullet,
@@ -344,13 +321,7 @@ class Player:
             self.state = PlayerState.DEAD
         self.special_attack_bonus_damage += amount * (self.percent_damage_taken_special_attack_bonus/100)
         
-        game_state.damage_numbers.append({
-                "x": game_state.player.x,
-                "y": game_state.player.y,
-                "value": reduced_damage,
-                "timer": 60,
-                "color": constants.RED
-        })
+        game_state.damage_numbers.add(self.x, self.y, reduced_damage, constants.RED, 60, target=self)
 
     def heal(self, amount):
         self.health = min(self.max_health, self.health + amount)
@@ -379,13 +350,7 @@ class Player:
         self.player_experience += modified_amount
         if self.player_experience >= self.experience_to_next_level:
             self.level_up()
-        game_state.experience_updates.append({
-            "x": self.x,
-            "y": self.y,
-            "value": int(modified_amount),
-            "timer": 60,
-            "color": constants.BLUE
-        })
+        game_state.experience_updates.add(self.x, self.y, int(modified_amount), constants.BLUE, 60, target=self)
             
     def level_up(self):
         self.player_level += 1
@@ -395,24 +360,39 @@ class Player:
 
         print(f"Player leveled up to level {self.player_level}")
 
+    def reset_upgrade_levels(self):
+        self.upgrade_levels = {}  # Tracks number of times each upgrade has been applied
+        # Levels per category and in total, kept up to date for get_random_upgrades' weighting
+        self.upgrade_tallies = {"damage": 0, "survival": 0, "cooldown": 0, "utility": 0, "basic": 0, "special": 0}
+        self.total_upgrade_levels = 0
+        self.maxed_upgrades = set()  # Names of upgrades at their max_level
+
+    def count_upgrade(self, upgrade):
+        """Add a level of `upgrade` to upgrade_levels and the running tallies."""
+        level = self.upgrade_levels[upgrade.name] = self.upgrade_levels.get(upgrade.name, 0) + 1
+        self.applied_upgrades.add(upgrade)
+        self.total_upgrade_levels += 1
+        for category in upgrade.category:
+            if category in self.upgrade_tallies:
+                self.upgrade_tallies[category] += 1
+        if level >= upgrade.max_level:
+            self.maxed_upgrades.add(upgrade.name)
+
     def gain_random_upgrade(self):
-        from src.player.upgrades import UpgradePool
+        from src.player.upgrades import get_upgrade_pool
         import src.engine.game_state as game_state
         
-        upgrade_pool = UpgradePool()
-        upgrades = upgrade_pool.get_random_upgrades(1, self)
+        upgrades = get_upgrade_pool().get_random_upgrades(1, self)
         
         if upgrades:
             random_upgrade = upgrades[0]
-            self.upgrade_levels[random_upgrade.name] = self.upgrade_levels.get(random_upgrade.name, 0) + 1
-            self.applied_upgrades.add(random_upgrade)
+            self.count_upgrade(random_upgrade)
             game_state.notification_queue.append(f"Obtained RANDOM Upgrade: {random_upgrade.name}")
             game_state.notification_queue.append("Roll the Dice chances reset to 3%!")
 
     def apply_upgrade(self, upgrade, source="manual"):
         upgrade.apply(self)
-        self.upgrade_levels[upgrade.name] = self.upgrade_levels.get(upgrade.name, 0) + 1
-        self.applied_upgrades.add(upgrade)
+        self.count_upgrade(upgrade)
         print(f"Applied upgrade: {upgrade.name}")  # Debugging output
 
         import src.engine.game_state as game_state
@@ -428,7 +408,7 @@ class Player:
         has_roll_the_dice = any(upg.name == "Roll the Dice" for upg in self.applied_upgrades)
 
         # 2. **Determine if Roll the Dice triggers a random upgrade**
-        roll_triggered = self.random_upgrade_chance >= 1.0 or (self.random_upgrade_chance > 0 and random.random() < self.random_upgrade_chance)
+        roll_triggered = self.random_upgrade_chance >= 1.0 or (self.random_upgrade_chance > 0 and upgrade_rng.random() < self.random_upgrade_chance)
 
         if roll_triggered:
             self.gain_random_upgrade()
@@ -458,6 +438,16 @@ class Player:
                 xp_gain = self.experience_to_next_level * (self.passive_xp_gain_percent_bonus / 100)
                 self.gain_experience(xp_gain)
 
+    def prebake_projectile_skins(self):
+        """Render every skin's projectile sprites at the default bullet sizes, so the first shots don't stall."""
+        basic_size = int(PlayerBasicBullet(0, 0, 0, 1, 1, 1, 1).size)
+        special_size = int(PlayerSpecialBullet(0, 0, 0, 1, 1, 0, 1, 1, 1).size)
+        for skin in self.skins.values():
+            if skin.projectile_skin_basic:
+                skin.projectile_skin_basic.prebake(basic_size)
+            if skin.projectile_skin_special:
+                skin.projectile_skin_special.prebake(special_size)
+
     def change_skin(self, new_skin_id):
         if new_skin_id in self.skins:
             self.current_skin_id = new_skin_id
@@ -2,7 +2,42 @@
 import pygame
 import math
 import os
+from collections import OrderedDict
 import src.engine.game_state as game_state
+import src.engine.constants as constants
+
+_scaled_frames = {}  # (frame, width, height) -> frame scaled to the player's size
+_rotated_frames = OrderedDict()  # (frame, width, height, angle step) -> rotated frame, least recently used first
+_rotated_bytes = 0
+
+def get_rotated_frame(frame, width, height, rotation):
+    """
+    `frame` scaled to (width, height) and rotated by `rotation` degrees (anticlockwise, as
+    pygame.transform.rotate), rounded to the nearest constants.skin_rotation_step_degrees.
+    Each frame is scaled once per size and each step rotated the first time it is needed; the
+    rotations are dropped least recently used first once they pass constants.skin_rotation_cache_bytes.
+    Returns (surface, the rotation actually used). Don't draw on the surface: it is shared.
+    """
+    global _rotated_bytes
+    step = constants.skin_rotation_step_degrees
+    steps = round(360 / step)
+    index = round(rotation / step) % steps
+    key = (frame, width, height, index)
+    rotated = _rotated_frames.get(key)
+    if rotated is not None:
+        _rotated_frames.move_to_end(key)
+        return rotated, index * step
+
+    scaled_key = (frame, width, height)
+    scaled = _scaled_frames.get(scaled_key)
+    if scaled is None:
+        scaled = _scaled_frames[scaled_key] = pygame.transform.scale(frame, (width, height))
+    rotated = _rotated_frames[key] = pygame.transform.rotate(scaled, index * step)
+    _rotated_bytes += rotated.get_width() * rotated.get_height() * rotated.get_bytesize()
+    while _rotated_bytes > constants.skin_rotation_cache_bytes and len(_rotated_frames) > 1:
+        _, dropped = _rotated_frames.popitem(last=False)
+        _rotated_bytes -= dropped.get_width() * dropped.get_height() * dropped.get_bytesize()
+    return rotated, index * step
 
 class Skin:
     def __init__(self, id, name, color, shape, rarity, frames_folder=None,
@@ -95,6 +130,7 @@ class Skin:
             print("Loaded special projectile skin:", special_path)
 
     def draw(self, screen, x, y, size, flip=False):
+        """Draw the skin centred on (x, y); returns the screen rect it covered."""
         from src.player.player import PlayerState
 
         can_rotate = (not game_state.paused and not game_state.game_over and 
@@ -121,36 +157,34 @@ class Skin:
             else:
                 frame = self.frames[frame_index]
 
-            scaled_frame = pygame.transform.scale(frame, (scaled_width, scaled_height))
+            rotated_frame, rotation = get_rotated_frame(frame, scaled_width, scaled_height, -self.last_rotation)
             if can_rotate:
-                rotated_frame = pygame.transform.rotate(scaled_frame, -self.last_rotation)
                 self.frame_counter += 1
                 if self.frame_counter >= self.frame_delay:
                     self.current_frame = (self.current_frame + 1) % len(self.frames)
                     self.frame_counter = 0
                     if self.current_frame == 0:
                         self.animation_cycle += 1
-            else:
-                rotated_frame = pygame.transform.rotate(scaled_frame, -self.last_rotation)
 
             rect = rotated_frame.get_rect(center=(x, y))
-            screen.blit(rotated_frame, rect.topleft)
+            drawn = screen.blit(rotated_frame, rect.topleft)
             
             if self.weapon_frame:
-                scaled_weapon = pygame.transform.scale(self.weapon_frame, (scaled_width, scaled_height))
-                rotated_weapon = pygame.transform.rotate(scaled_weapon, -self.last_rotation)
-                theta_rad = math.radians(self.last_rotation)
+                rotated_weapon, _ = get_rotated_frame(self.weapon_frame, scaled_width, scaled_height, -self.last_rotation)
+                # Offset along the same quantised angle the sprites were rotated by.
+                theta_rad = math.radians(-rotation)
                 offset_x = -self.weapon_offset_distance * math.sin(theta_rad)
                 offset_y = self.weapon_offset_distance * math.cos(theta_rad)
                 weapon_center = (x + offset_x, y + offset_y)
                 weapon_rect = rotated_weapon.get_rect(center=weapon_center)
-                screen.blit(rotated_weapon, weapon_rect.topleft)
+                drawn = drawn.union(screen.blit(rotated_weapon, weapon_rect.topleft))
+            return drawn
                 
         else:
             if self.shape == "square":
                 rect = pygame.Rect(x - size / 1.5, y - size / 1.5, size, size)
                 pygame.draw.rect(screen, self.color, rect)
-                pygame.draw.rect(screen, (0, 0, 0), rect, 1)
+                return pygame.draw.rect(screen, (0, 0, 0), rect, 1)
             else:
                 points = []
                 for i in range(5):
@@ -159,31 +193,53 @@ class Skin:
                     py = y - size / 1.5 * math.sin(angle_rad)
                     points.append((px, py))
                 pygame.draw.polygon(screen, self.color, points)
-                pygame.draw.polygon(screen, (0, 0, 0), points, 1)
+                return pygame.draw.polygon(screen, (0, 0, 0), points, 1)
                 
 class ProjectileSkin:
-    def __init__(self, image_path, weapon_scale_factor_x=1.0, weapon_scale_factor_y=1.0):
-        self.base_image = pygame.image.load(image_path).convert_alpha()
-        self.current_angle = 0
+    """
+    Sprites for one kind of skinned projectile, shared by every bullet that fires it (a flyweight:
+    bullets keep only a reference to it and their own angle and spawn tick).
+    The image is scaled once per bullet size and, for skins that rotate, pre-rotated into
+    constants.projectile_rotation_steps angles at the same time, so get_sprite() is a lookup.
+    This base skin doesn't rotate.
+    """
+    rotation_steps = 1
+
+    def __init__(self, image, weapon_scale_factor_x=1.0, weapon_scale_factor_y=1.0):
+        if isinstance(image, str):
+            image = pygame.image.load(image).convert_alpha()
+        self.base_image = image
         self.weapon_scale_factor_x = weapon_scale_factor_x
         self.weapon_scale_factor_y = weapon_scale_factor_y
+        self._sprites = {}  # integer bullet size -> [(sprite, centring offset)] per rotation step
+
+    def rotation(self, angle, age):
+        """Clockwise rotation in degrees of a bullet heading at `angle` that was fired `age` ticks ago."""
+        return 0
+
+    def prebake(self, size):
+        """Scale the image for bullets of `size` and render all its rotations."""
+        sprites = self._sprites.get(size)
+        if sprites is None:
+            scaled = pygame.transform.scale(self.base_image, (int(size * self.weapon_scale_factor_x),
+                                                              int(size * self.weapon_scale_factor_y)))
+            sprites = []
+            for step in range(self.rotation_steps):
+                rotated = pygame.transform.rotate(scaled, -step * 360 / self.rotation_steps) if step else scaled.copy()
+                # Projectile images are mostly transparent; RLE lets blits skip the empty runs.
+                rotated.set_alpha(255, pygame.RLEACCEL)
+                sprites.append((rotated, (-(rotated.get_width() // 2), -(rotated.get_height() // 2))))
+            self._sprites[size] = sprites
+        return sprites
+
+    def get_sprite(self, x, y, size, angle=0, age=0):
+        """The sprite and the top-left position that centres it on (x, y)."""
+        sprites = self._sprites.get(size) or self.prebake(size)
+        if self.rotation_steps > 1:
+            surface, (dx, dy) = sprites[round(self.rotation(angle, age) * self.rotation_steps / 360) % self.rotation_steps]
+        else:
+            surface, (dx, dy) = sprites[0]
+        return surface, (x + dx, y + dy)
 
-    def update(self):
-        self.current_angle = (self.current_angle) % 360
-
-    def draw(self, screen, x, y, size):
-        scale_x = size * self.weapon_scale_factor_x
-        scale_y = size * self.weapon_scale_factor_y
-        scaled_image = pygame.transform.scale(self.base_image, (int(scale_x), int(scale_y)))
-        rect = scaled_image.get_rect(center=(x, y))
-        screen.blit(scaled_image, rect.topleft)
-
-    def clone_with_firing_rotation(self, rotation):
-        # Create a new instance with the same parameters
-        new_instance = ProjectileSkin.__new__(ProjectileSkin)
-        new_instance.base_image = self.base_image
-        new_instance.weapon_scale_factor_x = self.weapon_scale_factor_x
-        new_instance.weapon_scale_factor_y = self.weapon_scale_factor_y
-        # Lock in the firing rotation (we use it as the current_angle)
-        new_instance.current_angle = rotation
-        return new_instance
+    def draw(self, screen, x, y, size, angle=0, age=0):
+        screen.blit(*self.get_sprite(x, y, size, angle, age))
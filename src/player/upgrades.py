@@ -1,10 +1,23 @@
 from dataclasses import dataclass
 from typing import Callable, List
-import random
+from src.engine.rng import stream
 from math import floor
+import numpy as np
 import pygame
 from src.player.player import Player
 
+upgrade_rng = stream("upgrades")
+
+upgrade_icon_names = ["additional_projectiles", "attack_cooldown","attack_damage", "basic_distance", "bullet_speed", "cooldown_ex",
+                      "damage_ex", "defence", "dmg_pickup", "extra_choice", "fat_special", "fear", "frenzy", "greed", "heavy",
+                      "hp_pickup", "hp_regen", "hp", "hybrid_plus", "hybrid", "lifesteal", "more_pickup", "movement_speed",
+                      "pacifist", "permanent_dmg", "permanent_hp", "pierce", "pride","rage", "repierce", "roll_the_dice", "sacrifice", "size_matters", 
+                      "sniper", "special_distance", "super_regen", "turtle_up", "unhealthy", "vengeful", "you_lucky_bastard"]
+
+_icon_atlas = None  # every upgrade icon side by side on one surface
+_icon_images = {}  # icon name -> subsurface of _icon_atlas
+_upgrade_pool = None
+
 @dataclass
 class Upgrade:
     name: str
@@ -25,7 +38,47 @@ class Upgrade:
             return self.name == other.name
         return False
 
+def get_upgrade_icons():
+    """
+    Icon name -> image, decoded from assets/icons on first call and packed into a single atlas.
+    Needs a display (the atlas is convert_alpha()'d), so it is only called from the menus.
+    """
+    global _icon_atlas
+    if _icon_atlas is None:
+        images = {}
+        for icon_name in upgrade_icon_names:
+            try:
+                images[icon_name] = pygame.image.load(f"assets/icons/{icon_name}.png")
+            except (pygame.error, FileNotFoundError):
+                print(f"Failed to load icon: {icon_name}")
+
+        width = sum(image.get_width() for image in images.values())
+        height = max((image.get_height() for image in images.values()), default=0)
+        _icon_atlas = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        x = 0
+        for icon_name, image in images.items():
+            # Copy the pixels as-is onto the transparent atlas rather than alpha blending them.
+            _icon_atlas.blit(image, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += image.get_width()
+        _icon_atlas = _icon_atlas.convert_alpha()
+
+        x = 0
+        for icon_name, image in images.items():
+            _icon_images[icon_name] = _icon_atlas.subsurface((x, 0, image.get_width(), image.get_height()))
+            x += image.get_width()
+    return _icon_images
+
+
+def get_upgrade_pool():
+    """The process-wide UpgradePool, built on first use. It holds no per-run state: that is all on the Player."""
+    global _upgrade_pool
+    if _upgrade_pool is None:
+        _upgrade_pool = UpgradePool()
+    return _upgrade_pool
+
+
 class UpgradePool:
+    """Every upgrade and its weighting. Use get_upgrade_pool() rather than building another one."""
     def __init__(self):
         self.rarity_weights = {
             "test": 1000000,
@@ -45,18 +98,6 @@ class UpgradePool:
         # 5. hp scaling should be 2x per level as the benchmark
         # 6. there should be balanced porportion bewteen hp/DR and damage scaling
         
-        # Load upgrade icons
-        self.icon_images = {}
-        for icon_name in ["additional_projectiles", "attack_cooldown","attack_damage", "basic_distance", "bullet_speed", "cooldown_ex",
-                          "damage_ex", "defence", "dmg_pickup", "extra_choice", "fat_special", "fear", "frenzy", "greed", "heavy",
-                          "hp_pickup", "hp_regen", "hp", "hybrid_plus", "hybrid", "lifesteal", "more_pickup", "movement_speed",
-                          "pacifist", "permanent_dmg", "permanent_hp", "pierce", "pride","rage", "repierce", "roll_the_dice", "sacrifice", "size_matters", 
-                          "sniper", "special_distance", "super_regen", "turtle_up", "unhealthy", "vengeful", "you_lucky_bastard"]:
-            try:
-                self.icon_images[icon_name] = pygame.image.load(f"assets/icons/{icon_name}.png").convert_alpha()
-            except:
-                print(f"Failed to load icon: {icon_name}")
-
         self.upgrades = [
             Upgrade(
                 name="Attack Damage",
@@ -619,26 +660,32 @@ class UpgradePool:
                 icon="roll_the_dice"
             ),
         ]
+        self.index_upgrades()
 
-    def get_random_upgrades(self, count: int, player: Player) -> List[Upgrade]:
-        # Filter out upgrades that have reached their max level etc.
-        available_upgrades = [
-            upgrade for upgrade in self.upgrades 
-            if player.upgrade_levels.get(upgrade.name, 0) < upgrade.max_level
-        ]
-        
-        # Build a mapping from upgrade name to upgrade for quick lookup
-        upgrades_by_name = {upgrade.name: upgrade for upgrade in self.upgrades}
+    def index_upgrades(self):
+        """The per-upgrade tables get_random_upgrades builds its weight vector from."""
+        self.upgrade_index = {upgrade.name: i for i, upgrade in enumerate(self.upgrades)}
+        self.base_weights = np.array([self.rarity_weights[upgrade.Rarity] for upgrade in self.upgrades], dtype=np.float64)
+        groups = {}  # ordered main categories -> group index
+        category_group_of = []
+        path_of = []  # 0: both paths or neither, 1: basic only, 2: special only
+        for upgrade in self.upgrades:
+            group = tuple(cat for cat in upgrade.category if cat in ("damage", "survival", "cooldown", "utility"))
+            category_group_of.append(groups.setdefault(group, len(groups)))
+            basic, special = "basic" in upgrade.category, "special" in upgrade.category
+            path_of.append(0 if basic == special else 1 if basic else 2)
+        self.category_groups = list(groups)
+        self.category_group_of = np.array(category_group_of, dtype=np.intp)
+        self.path_of = np.array(path_of, dtype=np.intp)
+
+    @property
+    def icon_images(self):
+        return get_upgrade_icons()
 
-        # Count applied upgrades per main category (damage, survival, cooldown, utility)
-        category_counts = {"damage": 0, "survival": 0, "cooldown": 0, "utility": 0}
-        total_applied = sum(player.upgrade_levels.values())
-        for upgrade_name, lvl in player.upgrade_levels.items():
-            upgrade = upgrades_by_name.get(upgrade_name)
-            if upgrade:
-                for category in upgrade.category:  # iterate over the list of categories
-                    if category in category_counts:
-                        category_counts[category] += lvl
+    def get_random_upgrades(self, count: int, player: Player, rng=upgrade_rng) -> List[Upgrade]:
+        # Count applied upgrades per main category (damage, survival, cooldown, utility); the player keeps these tallies
+        category_counts = player.upgrade_tallies
+        total_applied = player.total_upgrade_levels
 
         # Define target ratios (adjust these values to taste)
         target_ratios = {"damage": 0.40, "survival": 0.35, "cooldown": 0.15, "utility": 0.10}
@@ -658,15 +705,8 @@ class UpgradePool:
             multipliers[cat] = multiplier
 
         # EXTRA BIAS FOR BASIC vs. SPECIAL DAMAGE PATHS
-        basic_count = 0
-        special_count = 0
-        for upgrade_name, lvl in player.upgrade_levels.items():
-            upgrade = upgrades_by_name.get(upgrade_name)
-            if upgrade:
-                if "basic" in upgrade.category:
-                    basic_count += lvl
-                if "special" in upgrade.category:
-                    special_count += lvl
+        basic_count = category_counts["basic"]
+        special_count = category_counts["special"]
 
         if basic_count > special_count:
             basic_bias = 1.2  # favor basic upgrades
@@ -679,42 +719,29 @@ class UpgradePool:
             special_bias = 1.0
 
         # COMPUTE FINAL WEIGHTS
-        weights = []
-        for upgrade in available_upgrades:
-            base_weight = self.rarity_weights[upgrade.Rarity]
-            # Average main multipliers instead of max:
-            main_factors = [multipliers.get(cat, 1) for cat in upgrade.category if cat in multipliers]
-            if main_factors:
-                main_multiplier = sum(main_factors) / len(main_factors)
+        # Average main multipliers instead of max, once per distinct set of main categories:
+        group_multipliers = []
+        for group in self.category_groups:
+            if group:
+                group_multipliers.append(sum(multipliers[cat] for cat in group) / len(group))
             else:
-                main_multiplier = 1
-
-            # Extra bias for basic/special:
-            if "basic" in upgrade.category and "special" in upgrade.category:
-                extra_multiplier = 1.0  # or a slight bias if desired, like 1.05
-            elif "basic" in upgrade.category:
-                extra_multiplier = basic_bias
-            elif "special" in upgrade.category:
-                extra_multiplier = special_bias
-            else:
-                extra_multiplier = 1.0
-
-            weight = base_weight * main_multiplier * extra_multiplier
-            weights.append(weight)
+                group_multipliers.append(1)
+        # Extra bias for basic/special (none for upgrades on both paths or neither):
+        path_multipliers = np.array([1.0, basic_bias, special_bias])
+        weights = (self.base_weights * np.array(group_multipliers, dtype=np.float64)[self.category_group_of]
+                   * path_multipliers[self.path_of])
+        # Filter out upgrades that have reached their max level etc.
+        for upgrade_name in player.maxed_upgrades:
+            weights[self.upgrade_index[upgrade_name]] = 0.0
 
-        # Randomly choose upgrades based on the computed weights.
+        # Randomly choose upgrades based on the computed weights, without replacement. Each pick is
+        # the same single draw random.choices makes, so a seed still gives the same upgrades.
         selected_upgrades = []
-        for _ in range(min(count, len(available_upgrades))):
-            if not available_upgrades:
-                break
-            chosen_upgrade = random.choices(available_upgrades, weights=weights, k=1)[0]
-            selected_upgrades.append(chosen_upgrade)
-            index = available_upgrades.index(chosen_upgrade)
-            available_upgrades.pop(index)
-            weights.pop(index)
+        for _ in range(min(count, len(self.upgrades) - len(player.maxed_upgrades))):
+            cumulative_weights = np.cumsum(weights)
+            index = int(np.searchsorted(cumulative_weights, rng.random() * cumulative_weights[-1], side="right"))
+            index = min(index, len(weights) - 1)
+            selected_upgrades.append(self.upgrades[index])
+            weights[index] = 0.0
 
-        print("Selected random upgrade(s):")
-        for upgrade in selected_upgrades:
-            print(f"- {upgrade.name} (Categories: {upgrade.category})")
-        
         return selected_upgrades
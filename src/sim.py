@@ -0,0 +1,172 @@
+import os
+import sys
+import time
+import argparse
+
+# Must be set before pygame initialises its video/audio subsystems.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import src.engine.constants as constants
+import src.engine.game_state as game_state
+import src.engine.logic as logic
+import src.engine.rng as rng
+import src.engine.score as score
+from src.engine.inputs import ScriptedInput, InputRecorder, InputReplay
+from src.player.player import Player, PlayerState
+from src.enemies.enemy_pool import EnemyPool
+from src.engine.projectiles import BulletPool
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.sim",
+        description="Run the in-game simulation headlessly (no drawing, no frame cap) and report ticks per second."
+    )
+    parser.add_argument("--ticks", type=int, default=None,
+                        help="number of in-game ticks to simulate (default: 5 minutes, or the whole replay)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the game's RNG streams and the input script")
+    parser.add_argument("--input", choices=ScriptedInput.SCRIPTS, default="kite", help="scripted input source driving the player")
+    parser.add_argument("--width", type=int, default=1920, help="simulated screen width")
+    parser.add_argument("--height", type=int, default=1080, help="simulated screen height")
+    parser.add_argument("--bullets", choices=("objects", "numpy"), default=constants.bullet_backend,
+                        help="bullet backend: per-object BulletPool or the NumPy structure-of-arrays pool")
+    parser.add_argument("--restart", action="store_true", help="start a new run when the player dies instead of stopping")
+    parser.add_argument("--record", metavar="PATH", help="save the run's seed, inputs and level-up choices to PATH")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="replay a recording instead of scripted input; its seed and screen size override "
+                             "--seed/--width/--height, --ticks defaults to its length and --restart must match "
+                             "the recorded run")
+    return parser.parse_args(argv)
+
+
+def setup(width, height, seed, bullet_backend=constants.bullet_backend):
+    """Initialise pygame on the dummy driver and build the same world main() does."""
+    pygame.init()
+    if bullet_backend == "numpy":
+        from src.engine.bullet_arrays import NumpyBulletPool
+        game_state.bullet_pool = NumpyBulletPool()
+    else:
+        game_state.bullet_pool = BulletPool()
+    game_state.screen_width = width
+    game_state.screen_height = height
+    # A real (if invisible) display surface is needed for convert_alpha() in skin/icon loading.
+    game_state.screen = pygame.display.set_mode((width, height))
+    game_state.player = Player(width // 2, height // 2, width, height)
+
+    rng.seed_all(seed)
+    game_state.in_main_menu = False
+    game_state.running = True
+    game_state.paused = False
+    game_state.game_over = False
+    return EnemyPool()
+
+
+def auto_level_up(input_source):
+    """
+    Stand in for the level-up menu by taking the first upgrade offered, or the recorded
+    choice when replaying. Choices are saved when recording.
+    """
+    from src.player.upgrades import get_upgrade_pool
+    upgrade_pool = get_upgrade_pool()
+    choice = input_source.next_upgrade() if isinstance(input_source, InputReplay) else None
+    offered = choice[1] if choice else 1
+    upgrades = upgrade_pool.get_random_upgrades(offered, game_state.player)
+    upgrade = upgrades[0] if upgrades else None
+    if choice:
+        upgrade = next((upg for upg in upgrade_pool.upgrades if upg.name == choice[0]), None)
+    if upgrade is not None:
+        if isinstance(input_source, InputRecorder):
+            input_source.record_upgrade(upgrade.name, len(upgrades))
+        game_state.player.apply_upgrade(upgrade)
+    game_state.player.state = PlayerState.ALIVE
+
+
+def restart_run(seed):
+    from src.engine.helpers import reset_game
+    reset_game(seed)
+
+
+def run(ticks=None, seed=0, script="kite", width=1920, height=1080, restart=False,
+        bullet_backend=constants.bullet_backend, record=None, replay=None):
+    """
+    Drive the game_state.running branch of main() for `ticks` in-game ticks as fast as possible.
+    `record` saves the run to that path; `replay` plays back a recording instead of the script.
+    Returns a dict of summary statistics.
+    """
+    if replay:
+        input_source = InputReplay(replay)
+        seed, width, height = input_source.seed, input_source.width, input_source.height
+        if ticks is None:
+            ticks = input_source.ticks
+    else:
+        input_source = ScriptedInput(script, seed=seed)
+    if ticks is None:
+        ticks = constants.FPS * 60 * 5
+    if record:
+        input_source = InputRecorder(input_source, seed, width, height)
+    enemy_pool = setup(width, height, seed, bullet_backend)
+
+    deaths = 0
+    simulated_ticks = 0
+    peak_enemies = 0
+    peak_bullets = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if game_state.player.state == PlayerState.LEVELING_UP:
+            auto_level_up(input_source)
+
+        logic.step_simulation(enemy_pool, input_source)
+        simulated_ticks += 1
+        peak_enemies = max(peak_enemies, len(game_state.enemies))
+        peak_bullets = max(peak_bullets, game_state.bullet_pool.count_active())
+
+        if game_state.game_over:
+            deaths += 1
+            if not restart:
+                break
+            enemy_pool.clear()
+            restart_run(seed + deaths)
+    elapsed = time.perf_counter() - start
+    if record:
+        input_source.save(record)
+
+    return {
+        "ticks": simulated_ticks,
+        "seconds": elapsed,
+        "ticks_per_second": simulated_ticks / elapsed if elapsed > 0 else float("inf"),
+        "deaths": deaths,
+        "player_level": game_state.player.player_level,
+        "score": score.score,
+        "peak_enemies": peak_enemies,
+        "peak_bullets": peak_bullets,
+        "bullet_pool_size": len(game_state.bullet_pool),
+        "bullet_stats": game_state.bullet_pool.get_stats(),
+        "bullet_free_slots": (game_state.bullet_pool.get_free_slot_count()
+                              if hasattr(game_state.bullet_pool, "get_free_slot_count") else None),
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    stats = run(args.ticks, seed=args.seed, script=args.input, width=args.width,
+                height=args.height, restart=args.restart, bullet_backend=args.bullets,
+                record=args.record, replay=args.replay)
+    print(f"Simulated {stats['ticks']} ticks in {stats['seconds']:.2f}s "
+          f"({stats['ticks_per_second']:.0f} ticks/s, {stats['ticks_per_second'] / constants.FPS:.1f}x real time)")
+    print(f"Deaths: {stats['deaths']}  Player level: {stats['player_level']}  Score: {stats['score']}  "
+          f"Peak enemies: {stats['peak_enemies']}  Peak bullets: {stats['peak_bullets']}  "
+          f"Bullet pool size: {stats['bullet_pool_size']}")
+    if stats["bullet_free_slots"] is not None:
+        print(f"  Shared free slots: {stats['bullet_free_slots']}")
+    for class_name, counts in sorted(stats["bullet_stats"].items()):
+        free = f", free {counts['free']}" if "free" in counts else ""
+        print(f"  {class_name}: live {counts['live']}{free}, high-water {counts['high_water']}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
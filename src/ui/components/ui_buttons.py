@@ -1,13 +1,13 @@
 import pygame
 import random
-import numpy as np
 import math
 from typing import Optional
 
 import src.engine.constants as constants
 import src.engine.game_state as game_state
-from src.engine.helpers import get_ui_scaling_factor, compute_shimmer_surface_for_tab_icon, draw_hover_overlay
-from src.ui.components.ui_particles import Particle
+from src.engine.helpers import get_ui_scaling_factor, compute_shimmer_surface_for_tab_icon, get_low_res_shimmer_surface, draw_hover_overlay
+from src.ui.particles import ParticleSystem
+from src.ui.text_cache import render_text
 
 ui_scaling_factor = get_ui_scaling_factor()
 
@@ -29,7 +29,7 @@ class Button:
         pygame.draw.rect(screen, constants.BLACK, self.rect, int(4 * ui_scaling_factor))
         
         # Draw the button text.
-        text_surface = game_state.FONTS["medium"].render(self.text, True, constants.BLACK)
+        text_surface = render_text(game_state.FONTS["medium"], self.text, constants.BLACK)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -94,14 +94,55 @@ class UpgradeButton(Button):
         self.rainbow_timer = 0  # Timer for the shimmer effect (in degrees)
         self.cooldown = 0  # Cooldown attribute
 
-        # Precompute coordinate grids for vectorized shimmer computations
-        # These grids remain constant for the button size.
-        self._x_grid, self._y_grid = np.meshgrid(np.arange(self.width), np.arange(self.height))
-        self.shimmer_width = 0.3  # Parameter for the falloff width
-
         # We'll cache a sequence of shimmer surfaces if needed.
         self.cached_shimmer = None
         self.cached_phase = None
+        self.prerendered_timer = 0  # How far along the shimmer cycle prerender_shimmer() has got
+
+        # The icon and text never change, so scale and lay them out once.
+        self.icon_scaled = None
+        if self.icon_image:
+            self.icon_scaled = pygame.transform.scale(
+                self.icon_image,
+                (self.icon_size - int(68 * ui_scaling_factor), self.icon_size - int(68 * ui_scaling_factor))
+            )
+        self.title_surfaces = [render_text(game_state.FONTS["medium"], line, constants.BLACK)
+                               for line in self.wrap_text(game_state.FONTS["medium"], self.upgrade.name)]
+        self.rarity_surface = render_text(game_state.FONTS["smaller"], self.upgrade.Rarity, constants.BLACK)
+        self.desc_surfaces = [render_text(game_state.FONTS["small"], line, constants.BLACK)
+                              for line in self.wrap_text(game_state.FONTS["small"], self.upgrade.description)]
+
+    def wrap_text(self, font, text):
+        """Split text into centred lines that fit the button."""
+        words = text.split()
+        lines = []
+        current_line = []
+        for word in words:
+            test_line = ' '.join(current_line + [word])
+            # Only the width matters here, so measure rather than render.
+            if font.size(test_line)[0] <= self.width - int(40 * ui_scaling_factor):
+                current_line.append(word)
+            else:
+                if current_line:
+                    lines.append(' '.join(current_line))
+                current_line = [word]
+        if current_line:
+            lines.append(' '.join(current_line))
+        return lines
+
+    def prerender_shimmer(self, frames):
+        """
+        Compute the next `frames` shimmer phases draw() will ask for, ahead of time, so the menu's
+        first second doesn't have to. Returns False once the whole cycle is cached.
+        """
+        rarity_color = self.RARITY_COLORS.get(self.upgrade.Rarity, constants.GREEN)
+        for _ in range(frames):
+            if self.prerendered_timer >= 360:
+                return False
+            self.prerendered_timer += 4
+            get_low_res_shimmer_surface(rarity_color, self.upgrade.Rarity, self.width, self.height,
+                                        (self.prerendered_timer % 360) / 360.0)
+        return self.prerendered_timer < 360
 
     def draw(self, screen):
         # Update hover state based on current mouse position.
@@ -130,11 +171,7 @@ class UpgradeButton(Button):
         icon_circle_center = None
         icon_circle_radius = None
 
-        if self.icon_image:
-            icon_scaled = pygame.transform.scale(
-                self.icon_image,
-                (self.icon_size - int(68 * ui_scaling_factor), self.icon_size - int(68 * ui_scaling_factor))
-            )
+        if self.icon_scaled:
             icon_circle_radius = self.icon_size // 2 - int(10 * ui_scaling_factor)
             icon_circle_center = (
                 self.rect.x + icon_circle_radius - self.circle_margin - int(30 * ui_scaling_factor), 
@@ -145,8 +182,8 @@ class UpgradeButton(Button):
             pygame.draw.circle(screen, constants.BLACK, icon_circle_center, icon_circle_radius, int(4 * ui_scaling_factor))
             
             # Draw the icon image.
-            icon_rect = icon_scaled.get_rect(center=icon_circle_center)
-            screen.blit(icon_scaled, icon_rect)
+            icon_rect = self.icon_scaled.get_rect(center=icon_circle_center)
+            screen.blit(self.icon_scaled, icon_rect)
             
             # Draw the icon-specific hover overlay.
             if self.hover:
@@ -155,52 +192,19 @@ class UpgradeButton(Button):
                 screen.blit(icon_overlay, (icon_circle_center[0] - icon_circle_radius, icon_circle_center[1] - icon_circle_radius))
         
         # Draw centralized wrapped title text.
-        words = self.upgrade.name.split()
-        title_lines = []
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = game_state.FONTS["medium"].render(test_line, True, constants.BLACK)
-            if test_surface.get_width() <= self.width - int(40 * ui_scaling_factor):
-                current_line.append(word)
-            else:
-                if current_line:
-                    title_lines.append(' '.join(current_line))
-                current_line = [word]
-        if current_line:
-            title_lines.append(' '.join(current_line))
-        
         title_y = self.rect.y + int(40 * ui_scaling_factor) + (self.icon_size - int(94 * ui_scaling_factor)) + getattr(self, "title_offset", 0)
-        for line in title_lines:
-            title_surface = game_state.FONTS["medium"].render(line, True, constants.BLACK)
+        for title_surface in self.title_surfaces:
             title_rect = title_surface.get_rect(center=(self.rect.centerx, title_y))
             screen.blit(title_surface, title_rect)
             title_y += title_surface.get_height()
         
         # Render rarity text below the title.
-        rarity_surface = game_state.FONTS["smaller"].render(self.upgrade.Rarity, True, constants.BLACK)
-        rarity_rect = rarity_surface.get_rect(center=(self.rect.centerx, title_y - int(4 * ui_scaling_factor)))
-        screen.blit(rarity_surface, rarity_rect)
+        rarity_rect = self.rarity_surface.get_rect(center=(self.rect.centerx, title_y - int(4 * ui_scaling_factor)))
+        screen.blit(self.rarity_surface, rarity_rect)
         
         # Render centralized wrapped description text below rarity.
-        desc_words = self.upgrade.description.split()
-        desc_lines = []
-        current_desc_line = []
-        for word in desc_words:
-            test_line = ' '.join(current_desc_line + [word])
-            test_surface = game_state.FONTS["small"].render(test_line, True, constants.BLACK)
-            if test_surface.get_width() <= self.width - int(40 * ui_scaling_factor):
-                current_desc_line.append(word)
-            else:
-                if current_desc_line:
-                    desc_lines.append(' '.join(current_desc_line))
-                current_desc_line = [word]
-        if current_desc_line:
-            desc_lines.append(' '.join(current_desc_line))
-        
         y_offset = rarity_rect.bottom + int(36 * ui_scaling_factor)
-        for line in desc_lines:
-            desc_surface = game_state.FONTS["small"].render(line, True, constants.BLACK)
+        for desc_surface in self.desc_surfaces:
             desc_rect = desc_surface.get_rect(center=(self.rect.centerx, y_offset))
             screen.blit(desc_surface, desc_rect)
             y_offset += desc_surface.get_height()
@@ -251,7 +255,7 @@ class SkinButton(UpgradeButton):
         self.glow_timer = 0  # Animates from 0 up to 500 when selected.
         self.skin_id: Optional[str] = None  # Use skin_id instead of skin_index.
         self.pulse_phase = 0   # For the pulsing (scaling) effect.
-        self.particles = []    # List to hold particle effects.
+        self.particles = ParticleSystem(capacity=64, rng=random)  # Sparkles while selected.
         self.title_offset = -10 * ui_scaling_factor
 
     def trigger_glow(self):
@@ -319,14 +323,11 @@ class SkinButton(UpgradeButton):
                     self.rect.centerx + random.uniform(-self.rect.width / 2, self.rect.width / 2),
                     self.rect.centery + random.uniform(-self.rect.height / 2, self.rect.height / 2)
                 )
-                self.particles.append(Particle(particle_pos, self.color))
+                self.particles.emit(particle_pos, self.color, speed=1, lifetime=(40, 60))
         
         # Update and draw all active particles.
-        for particle in self.particles:
-            particle.update()
-            particle.draw(screen)
-        # Remove expired particles.
-        self.particles = [p for p in self.particles if p.lifetime > 0 and p.radius > 0]
+        self.particles.update()
+        self.particles.draw(screen)
         
         # Draw the base button content (shimmer, text, icon)
         super().draw(screen)
@@ -1,6 +1,6 @@
 import pygame
 from src.engine.helpers import get_ui_scaling_factor
-from src.engine.music_handler import save_music_settings
+from src.engine.music_handler import save_music_settings, run_music_job
 import src.engine.constants as constants
 
 ui_scaling_factor = get_ui_scaling_factor()
@@ -66,7 +66,7 @@ class Slider:
                 )
                 self.value = (new_knob_x - self.x) / (self.width - self.knob_width)
                 constants.music_volume = self.value
-                pygame.mixer.music.set_volume(self.value)
+                run_music_job(pygame.mixer.music.set_volume, self.value)
                 save_music_settings(self.value)  # Save the new volume
 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -80,5 +80,5 @@ class Slider:
             )
             self.value = (new_knob_x - self.x) / (self.width - self.knob_width)
             constants.music_volume = self.value
-            pygame.mixer.music.set_volume(self.value)
+            run_music_job(pygame.mixer.music.set_volume, self.value)
             save_music_settings(self.value)  # Save the new volume
\ No newline at end of file
@@ -0,0 +1,66 @@
+import pygame
+
+import src.engine.constants as constants
+
+
+class DirtyRects:
+    """
+    Optional dirty-rectangle renderer for the in-game scene.
+
+    When enabled, everything drawn over the background reports the rect it touched via add()
+    (blit() and pygame.draw return them). Each frame only last frame's rects are restored from
+    the cached background, and only those plus this frame's rects are pushed to the display
+    with pygame.display.update(rects).
+    Anything that paints the whole screen (menus, fades, game over) calls invalidate(); that
+    frame and the next one fall back to a full background blit and flip. So does any frame whose
+    dirty area is more than `full_fraction` of the screen.
+    When disabled, restore_background() and present() are a full blit and a flip, as before.
+    """
+    def __init__(self, full_fraction=constants.dirty_rect_full_fraction):
+        self.enabled = False
+        self.full_fraction = full_fraction
+        self.rects = []  # touched this frame
+        self.previous = []  # touched last frame; erased at the start of this one
+        self.restore_all = True
+        self.flip_all = True
+
+    def add(self, rect):
+        if self.enabled:
+            self.rects.append(rect)
+
+    def add_many(self, rects):
+        if self.enabled:
+            self.rects.extend(rects)
+
+    def invalidate(self):
+        """The whole screen changed this frame: flip it all, and redraw the whole background next frame."""
+        self.flip_all = True
+        self.restore_all = True
+
+    def restore_background(self, screen, background):
+        """Start a frame by clearing what was drawn last frame back to `background`."""
+        if not self.enabled or self.restore_all:
+            screen.blit(background, (0, 0))
+            self.restore_all = False
+            self.flip_all = True
+        else:
+            screen.blits([(background, rect, rect) for rect in self.previous], doreturn=False)
+            self.flip_all = False
+        self.rects = []
+
+    def present(self):
+        if not self.enabled:
+            pygame.display.flip()
+            return
+        if self.flip_all:
+            pygame.display.flip()
+        else:
+            updated = self.previous + self.rects
+            area = sum(rect.width * rect.height for rect in updated)
+            width, height = pygame.display.get_surface().get_size()
+            if area > width * height * self.full_fraction:
+                pygame.display.flip()
+            else:
+                pygame.display.update(updated)
+        self.previous = self.rects
+        self.rects = []
@@ -1,10 +1,10 @@
 import pygame
-import random
 
 import src.engine.game_state as game_state
 import src.engine.constants as constants
 from src.engine.helpers import get_ui_scaling_factor
 import src.engine.score as score
+from src.ui.text_cache import render_text
     
 ui_scaling_factor = get_ui_scaling_factor()
     
@@ -23,7 +23,7 @@ def draw_experience_bar():
     screen.blit(background_surf, (bar_x, bar_y))
 
     # Draw the border
-    pygame.draw.rect(screen, constants.BLACK, (bar_x - 4 * ui_scaling_factor, bar_y - 4 * ui_scaling_factor, bar_width + 8 * ui_scaling_factor, bar_height + 8 * ui_scaling_factor), int(4 * ui_scaling_factor))
+    game_state.dirty_rects.add(pygame.draw.rect(screen, constants.BLACK, (bar_x - 4 * ui_scaling_factor, bar_y - 4 * ui_scaling_factor, bar_width + 8 * ui_scaling_factor, bar_height + 8 * ui_scaling_factor), int(4 * ui_scaling_factor)))
 
     # Calculate the filled width based on current experience
     filled_width = int((game_state.player.player_experience / game_state.player.experience_to_next_level) * bar_width)
@@ -47,24 +47,25 @@ def draw_skill_icons(left_click_cooldown_progress, right_click_cooldown_progress
     fps_text = f"FPS: {fps:.0f}"
     
     # Render FPS text with a black border (outline effect)
-    text_surface = game_state.FONTS["small"].render(fps_text, True, constants.WHITE)
-    text_outline = game_state.FONTS["small"].render(fps_text, True, constants.BLACK)
+    text_surface = render_text(game_state.FONTS["small"], fps_text, constants.WHITE)
+    text_outline = render_text(game_state.FONTS["small"], fps_text, constants.BLACK)
 
     # FPS position (below the timer, aligned along the same X-axis)
     fps_x = x - 146 * ui_scaling_factor
     fps_y = y + icon_size + padding - 180 * ui_scaling_factor  # Adjust the value to fine-tune the placement
 
     # Draw black outline for better visibility (offset slightly in multiple directions)
-    screen.blit(text_outline, (int(fps_x - 2 * ui_scaling_factor), int(fps_y - 2 * ui_scaling_factor)))
-    screen.blit(text_outline, (int(fps_x + 2 * ui_scaling_factor), int(fps_y - 2 * ui_scaling_factor)))
-    screen.blit(text_outline, (int(fps_x - 2 * ui_scaling_factor), int(fps_y + 2 * ui_scaling_factor)))
-    screen.blit(text_outline, (int(fps_x + 2 * ui_scaling_factor), int(fps_y + 2 * ui_scaling_factor)))
+    dirty_rects = game_state.dirty_rects
+    dirty_rects.add(screen.blit(text_outline, (int(fps_x - 2 * ui_scaling_factor), int(fps_y - 2 * ui_scaling_factor))))
+    dirty_rects.add(screen.blit(text_outline, (int(fps_x + 2 * ui_scaling_factor), int(fps_y - 2 * ui_scaling_factor))))
+    dirty_rects.add(screen.blit(text_outline, (int(fps_x - 2 * ui_scaling_factor), int(fps_y + 2 * ui_scaling_factor))))
+    dirty_rects.add(screen.blit(text_outline, (int(fps_x + 2 * ui_scaling_factor), int(fps_y + 2 * ui_scaling_factor))))
     screen.blit(text_surface, (fps_x, fps_y))
 
     # --- Draw Left Click Icon ---
     left_icon_surface = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
     pygame.draw.rect(left_icon_surface, (200, 200, 200, 128), (0, 0, icon_size, icon_size))  # Translucent white background
-    text = game_state.FONTS["medium"].render("L", True, constants.WHITE)  # Black "L"
+    text = render_text(game_state.FONTS["medium"], "L", constants.WHITE)  # Black "L"
     text_rect = text.get_rect(center=(icon_size // 2, icon_size // 2))
     left_icon_surface.blit(text, text_rect)
 
@@ -74,13 +75,13 @@ def draw_skill_icons(left_click_cooldown_progress, right_click_cooldown_progress
         pygame.draw.rect(left_icon_surface, (0, 0, 0, 128),
                          (0, icon_size - cooldown_height, icon_size, cooldown_height))
     pygame.draw.rect(left_icon_surface, constants.BLACK, (0, 0, icon_size, icon_size), 2)
-    screen.blit(left_icon_surface, (x, y - 20 * ui_scaling_factor))
+    dirty_rects.add(screen.blit(left_icon_surface, (x, y - 20 * ui_scaling_factor)))
 
     # --- Draw Right Click Icon ---
     y += icon_size + padding  # Position below the left icon
     right_icon_surface = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
     pygame.draw.rect(right_icon_surface, (200, 200, 200, 128), (0, 0, icon_size, icon_size))
-    text = game_state.FONTS["medium"].render("R", True, constants.WHITE)  # Black "R"
+    text = render_text(game_state.FONTS["medium"], "R", constants.WHITE)  # Black "R"
     text_rect = text.get_rect(center=(icon_size // 2, icon_size // 2))
     right_icon_surface.blit(text, text_rect)
     if right_click_cooldown_progress < 1:
@@ -88,16 +89,49 @@ def draw_skill_icons(left_click_cooldown_progress, right_click_cooldown_progress
         pygame.draw.rect(right_icon_surface, (0, 0, 0, 128),
                          (0, icon_size - cooldown_height, icon_size, cooldown_height))
     pygame.draw.rect(right_icon_surface, constants.BLACK, (0, 0, icon_size, icon_size), 2)
-    screen.blit(right_icon_surface, (x, y - 20 * ui_scaling_factor))
-
-def draw_health_bar(x, y, health, max_health, color, bar_width=200, bar_height=10):
-    screen = game_state.screen
-    filled_width = int((health / max_health) * bar_width)
-    surface = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA)
-    pygame.draw.rect(surface, (0, 0, 0, int(380 * ui_scaling_factor)), (0, 0, bar_width, bar_height))
-    pygame.draw.rect(surface, color, (0, 0, filled_width, bar_height))
-    pygame.draw.rect(surface, constants.BLACK, (0, 0, bar_width, bar_height), 1) 
-    screen.blit(surface, (x, y))
+    dirty_rects.add(screen.blit(right_icon_surface, (x, y - 20 * ui_scaling_factor)))
+
+_health_bar_backgrounds = {}  # (width, height, background, border) -> empty bar
+_health_bar_fills = {}  # (width, height, background, border, colour) -> [bar surface per fill step]
+
+def render_health_bar(health, max_health, color, bar_width=200, bar_height=10,
+                      background=None, border_width=1):
+    """
+    Return a health bar surface from the cache (draw_health_bar blits it; render queues push it).
+    Each bar size keeps one empty background, and the fill is quantised into at most
+    HEALTH_BAR_FILL_STEPS widths, each rendered the first time it is needed.
+    Don't draw on the returned surface: it is shared.
+    """
+    if background is None:
+        background = (0, 0, 0, int(380 * ui_scaling_factor))
+    bar_width = int(bar_width)
+    bar_height = int(bar_height)
+    key = (bar_width, bar_height, background, border_width)
+    empty_bar = _health_bar_backgrounds.get(key)
+    if empty_bar is None:
+        empty_bar = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA)
+        pygame.draw.rect(empty_bar, background, (0, 0, bar_width, bar_height))
+        pygame.draw.rect(empty_bar, constants.BLACK, (0, 0, bar_width, bar_height), border_width)
+        _health_bar_backgrounds[key] = empty_bar
+
+    steps = max(1, min(constants.HEALTH_BAR_FILL_STEPS, bar_width))
+    fraction = max(0.0, min(1.0, health / max_health))
+    step = int(fraction * steps)
+    fills = _health_bar_fills.get(key + (color,))
+    if fills is None:
+        fills = _health_bar_fills[key + (color,)] = [None] * (steps + 1)
+    bar = fills[step]
+    if bar is None:
+        filled_width = step * bar_width // steps
+        bar = empty_bar.copy()
+        pygame.draw.rect(bar, color, (0, 0, filled_width, bar_height))
+        pygame.draw.rect(bar, constants.BLACK, (0, 0, bar_width, bar_height), border_width)
+        fills[step] = bar
+    return bar
+
+def draw_health_bar(x, y, health, max_health, color, bar_width=200, bar_height=10, background=None, border_width=1):
+    game_state.screen.blit(render_health_bar(health, max_health, color, bar_width, bar_height,
+                                             background, border_width), (x, y))
 
 def draw_fade_overlay():
     screen = game_state.screen
@@ -106,52 +140,67 @@ def draw_fade_overlay():
     fade_surface.fill(constants.BLACK)
     screen.blit(fade_surface, (0, 0))
 
+_profiler_panel = None
+_profiler_panel_refreshed_ms = 0
+
+def draw_profiler_overlay():
+    """
+    Draw the F3 profiler panel beside the FPS counter: average and worst ms per frame stage
+    over the last constants.profiler_window_frames frames, plus entity counts.
+    The panel is only re-rendered every constants.profiler_refresh_ms.
+    """
+    global _profiler_panel, _profiler_panel_refreshed_ms
+    now = pygame.time.get_ticks()
+    if _profiler_panel is None or now - _profiler_panel_refreshed_ms >= constants.profiler_refresh_ms:
+        _profiler_panel_refreshed_ms = now
+        particles = len(game_state.particles)
+        font = game_state.FONTS["tiny"]
+        # The font is proportional, so the stage name and both numbers are separate columns.
+        rows = [("stage", "avg ms", "max ms")]
+        rows.extend((stage, f"{average:.2f}", f"{worst:.2f}") for stage, average, worst in game_state.profiler.summary())
+        rows = [[font.render(cell, True, constants.WHITE) for cell in row] for row in rows]
+        footer = [font.render(line, True, constants.WHITE) for line in (
+            f"enemies {len(game_state.enemies)}  bullets {game_state.bullet_pool.count_active()}",
+            f"damage numbers {len(game_state.damage_numbers)}  particles {particles}",
+        )]
+
+        padding = int(8 * ui_scaling_factor)
+        gap = int(16 * ui_scaling_factor)
+        line_height = font.get_linesize()
+        column_widths = [max(row[i].get_width() for row in rows) for i in range(3)]
+        width = max(sum(column_widths) + gap * 2, max(text.get_width() for text in footer)) + padding * 2
+        height = line_height * (len(rows) + len(footer)) + padding * 2
+        _profiler_panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        _profiler_panel.fill((0, 0, 0, 170))
+        y = padding
+        for name, average, worst in rows:
+            _profiler_panel.blit(name, (padding, y))
+            average_right = padding + column_widths[0] + gap + column_widths[1]
+            _profiler_panel.blit(average, (average_right - average.get_width(), y))
+            _profiler_panel.blit(worst, (average_right + gap + column_widths[2] - worst.get_width(), y))
+            y += line_height
+        for text in footer:
+            _profiler_panel.blit(text, (padding, y))
+            y += line_height
+
+    # Left of the skill icons, just below the FPS counter.
+    icon_size = 140 * ui_scaling_factor
+    padding = 20 * ui_scaling_factor
+    right = game_state.screen_width - icon_size - padding * 2
+    top = padding + 120 * ui_scaling_factor + 40 * ui_scaling_factor
+    game_state.dirty_rects.add(game_state.screen.blit(_profiler_panel, (int(right - _profiler_panel.get_width()), int(top))))
+
 def draw_player_state_value_updates():
     if not game_state.running:  # Clear all updates if the game is not running
         game_state.damage_numbers.clear()
         game_state.experience_updates.clear()
         return
-    
-    screen = game_state.screen
 
-    # Draw damage numbers
-    for update in game_state.damage_numbers[:]:
-        # Generate and store x_offset if it doesn't exist
-        if "x_offset" not in update:
-            update["x_offset"] = random.randint(-60, 60)
-            
-        display_value = int(update["value"])
-        text = game_state.FONTS["tiny"].render(str(display_value), True, update["color"])
-        text_surface = text.convert_alpha()
-        screen.blit(text_surface, (update["x"] - text.get_width() // 2 + update["x_offset"], 
-                                 update["y"] - text.get_height() // 2 + random.randint(-1, 1)))
-
-        from src.player.player import PlayerState
-        if not game_state.paused and not game_state.showing_stats and not game_state.showing_upgrades and game_state.player.state != PlayerState.LEVELING_UP:
-            update["y"] -= 6 * ui_scaling_factor
-            update["timer"] -= 1
-
-            if update["timer"] <= 0:
-                game_state.damage_numbers.remove(update)
-
-    # Draw experience pop-ups
-    for exp_update in game_state.experience_updates[:]:
-        # Generate and store x_offset if it doesn't exist
-        if "x_offset" not in exp_update:
-            exp_update["x_offset"] = random.randint(-2, 2)
-            
-        text = game_state.FONTS["tiny"].render(f"+{exp_update['value']} EXP", True, exp_update["color"])
-        text_surface = text.convert_alpha()
-        screen.blit(text_surface, (exp_update["x"] - text.get_width() // 2 + exp_update["x_offset"], 
-                                 exp_update["y"] - 30 * ui_scaling_factor - text.get_height() // 2))
-
-        from src.player.player import PlayerState
-        if not game_state.paused and not game_state.showing_stats and not game_state.showing_upgrades and game_state.player.state != PlayerState.LEVELING_UP:
-            exp_update["y"] -= 2 * ui_scaling_factor  # Move up by 1 pixel per frame
-            exp_update["timer"] -= 1
-
-            if exp_update["timer"] <= 0:
-                game_state.experience_updates.remove(exp_update)
+    from src.player.player import PlayerState
+    # Numbers hold still while the game is paused or in a menu.
+    advance = not game_state.paused and not game_state.showing_stats and not game_state.showing_upgrades and game_state.player.state != PlayerState.LEVELING_UP
+    game_state.dirty_rects.add_many(game_state.damage_numbers.draw(game_state.screen, advance))
+    game_state.dirty_rects.add_many(game_state.experience_updates.draw(game_state.screen, advance))
             
 def draw_notification():
     if not game_state.running:
@@ -224,7 +273,7 @@ def draw_notification():
         # print(f"DEBUG: Timer decremented to {game_state.notification_timer}")
 
     # Render the notification text.
-    text_surface = game_state.FONTS["medium"].render(game_state.notification_message, True, constants.WHITE)
+    text_surface = render_text(game_state.FONTS["medium"], game_state.notification_message, constants.WHITE)
     text_rect = text_surface.get_rect(center=(game_state.screen_width // 2, y + 60 * ui_scaling_factor))
 
     # Calculate background box dimensions.
@@ -237,7 +286,7 @@ def draw_notification():
 
     # Draw the background and border.
     game_state.screen.blit(background_surface, box_rect.topleft)
-    pygame.draw.rect(game_state.screen, constants.BLACK, box_rect, int(4 * ui_scaling_factor))
+    game_state.dirty_rects.add(pygame.draw.rect(game_state.screen, constants.BLACK, box_rect, int(4 * ui_scaling_factor)))
     game_state.screen.blit(text_surface, text_rect)
 
     # print(f"DEBUG: Notification drawn: {game_state.notification_message}")
@@ -272,32 +321,32 @@ def show_game_over_screen(screen, screen_width, screen_height, alpha):
     game_over_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
     game_over_surface.fill((0, 0, 0, alpha))
     
-    text_large = game_state.FONTS["huge"].render("YOU DIED", True, constants.WHITE)
+    text_large = render_text(game_state.FONTS["huge"], "YOU DIED", constants.WHITE)
     text_large_rect = text_large.get_rect(center=(screen_width // 2, screen_height // 2 - 120))
     game_over_surface.blit(text_large, text_large_rect)
     
     final_time = getattr(game_state, 'final_time', 0)
     minutes = final_time // 60
     seconds = final_time % 60
-    timer_text = game_state.FONTS["medium"].render(f"Time: {minutes:02d}:{seconds:02d}", True, constants.WHITE)
+    timer_text = render_text(game_state.FONTS["medium"], f"Time: {minutes:02d}:{seconds:02d}", constants.WHITE)
     timer_text_rect = timer_text.get_rect(center=(screen_width // 2, screen_height // 2 - 40))
     game_over_surface.blit(timer_text, timer_text_rect)
     
     # Use the captured final score instead of the live score
     final_score = getattr(game_state, 'final_score', score.score)
-    score_text = game_state.FONTS["medium"].render(f"Score: {final_score}", True, constants.WHITE)
+    score_text = render_text(game_state.FONTS["medium"], f"Score: {final_score}", constants.WHITE)
     score_text_rect = score_text.get_rect(center=(screen_width // 2, screen_height // 2 + 20))
     game_over_surface.blit(score_text, score_text_rect)
     
-    high_score_text = game_state.FONTS["medium"].render(f"High Score: {score.high_score}", True, constants.WHITE)
+    high_score_text = render_text(game_state.FONTS["medium"], f"High Score: {score.high_score}", constants.WHITE)
     high_score_text_rect = high_score_text.get_rect(center=(screen_width // 2, screen_height // 2 + 60))
     game_over_surface.blit(high_score_text, high_score_text_rect)
     
-    restart_text = game_state.FONTS["medium"].render("Press SPACE to restart", True, constants.WHITE)
+    restart_text = render_text(game_state.FONTS["medium"], "Press SPACE to restart", constants.WHITE)
     restart_text_rect = restart_text.get_rect(center=(screen_width // 2, screen_height // 2 + 100))
     game_over_surface.blit(restart_text, restart_text_rect)
     
-    version_text = game_state.FONTS["small"].render("Gooner Game v0.1.3 - (WIP)", True, constants.WHITE)
+    version_text = render_text(game_state.FONTS["small"], "Gooner Game v0.1.3 - (WIP)", constants.WHITE)
     version_text_rect = version_text.get_rect(center=(screen_width // 2, screen_height - 20))
     game_over_surface.blit(version_text, version_text_rect)
     
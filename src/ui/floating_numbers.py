@@ -0,0 +1,136 @@
+import numpy as np
+
+import src.engine.game_state as game_state
+import src.engine.constants as constants
+from src.engine.rng import stream
+from src.engine.helpers import get_ui_scaling_factor
+from src.ui.text_cache import draw_glyph_text, glyph_text_size
+
+ui_scaling_factor = get_ui_scaling_factor()
+effects_rng = stream("effects")
+
+
+class FloatingNumbers:
+    """
+    Fixed-size pool of rising numbers (damage, heals, EXP), one slot per number in NumPy arrays.
+
+    add() is called from the simulation; a hit on the same target in the same colour within
+    `floating_number_merge_ticks` of the last one is added onto that number instead of starting
+    a new one. When every slot is taken the oldest number is dropped. draw() runs once per
+    rendered frame: it draws at most `floating_number_draw_budget` of the newest numbers from
+    the glyph cache, then moves them all up and counts down their timers in one go.
+    """
+    def __init__(self, rise, spread, jitter=0, lift=0, prefix="", suffix="",
+                 capacity=constants.floating_number_capacity):
+        self.rise = rise * ui_scaling_factor  # pixels per frame
+        self.spread = spread  # random horizontal offset range, picked the first time a number is drawn
+        self.jitter = jitter  # random vertical shake per frame
+        self.lift = lift * ui_scaling_factor  # drawn this far above the spawn point
+        self.prefix = prefix
+        self.suffix = suffix
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.value = np.zeros(capacity, dtype=np.float64)
+        self.timer = np.zeros(capacity, dtype=np.int64)
+        self.x_offset = np.zeros(capacity, dtype=np.int64)
+        self.placed = np.zeros(capacity, dtype=bool)  # x_offset has been picked
+        self.last_hit = np.zeros(capacity, dtype=np.int64)  # tick of the last hit merged in
+        self.serial = np.zeros(capacity, dtype=np.int64)  # spawn order, for the draw budget and eviction
+        self.active = np.zeros(capacity, dtype=bool)
+        self.colours = [None] * capacity
+        self.keys = [None] * capacity  # merge key of each slot
+        self.by_key = {}  # (id(target), colour) -> slot
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.live = 0
+        self.next_serial = 0
+
+    def __len__(self):
+        return self.live
+
+    def clear(self):
+        self.active[:] = False
+        self.colours = [None] * self.capacity
+        self.keys = [None] * self.capacity
+        self.by_key.clear()
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+        self.live = 0
+
+    def add(self, x, y, value, colour, duration, target=None):
+        """Show `value` rising from (x, y) for `duration` frames, merged into a recent number on `target` if there is one."""
+        tick = game_state.in_game_ticks_elapsed
+        key = None
+        if target is not None:
+            key = (id(target), colour)
+            slot = self.by_key.get(key)
+            if slot is not None and tick - self.last_hit[slot] <= constants.floating_number_merge_ticks:
+                self.value[slot] += value
+                self.timer[slot] = max(self.timer[slot], duration)
+                self.last_hit[slot] = tick
+                return
+
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            live = np.flatnonzero(self.active)
+            slot = int(live[np.argmin(self.serial[live])])
+            self._release(slot)
+            self.free_slots.pop()
+
+        self.x[slot] = x
+        self.y[slot] = y
+        self.value[slot] = value
+        self.timer[slot] = duration
+        self.placed[slot] = False
+        self.last_hit[slot] = tick
+        self.serial[slot] = self.next_serial
+        self.next_serial += 1
+        self.active[slot] = True
+        self.colours[slot] = colour
+        self.keys[slot] = key
+        if key is not None:
+            self.by_key[key] = slot
+        self.live += 1
+
+    def _release(self, slot):
+        self.active[slot] = False
+        key = self.keys[slot]
+        if key is not None and self.by_key.get(key) == slot:
+            del self.by_key[key]
+        self.keys[slot] = None
+        self.colours[slot] = None
+        self.free_slots.append(slot)
+        self.live -= 1
+
+    def draw(self, screen, advance=True):
+        """Draw the live numbers and, unless the game is frozen, move them on a frame. Returns the rects drawn."""
+        if not self.live:
+            return []
+        live = np.flatnonzero(self.active)
+        if live.size > constants.floating_number_draw_budget:
+            newest = np.argsort(self.serial[live])[-constants.floating_number_draw_budget:]
+            drawn = live[np.sort(newest)]
+        else:
+            drawn = live
+
+        font = game_state.FONTS["tiny"]
+        rects = []
+        for slot in drawn.tolist():
+            if not self.placed[slot]:
+                self.x_offset[slot] = effects_rng.randint(-self.spread, self.spread)
+                self.placed[slot] = True
+            colour = self.colours[slot]
+            text = f"{self.prefix}{int(self.value[slot])}{self.suffix}"
+            width, height = glyph_text_size(font, text, colour)
+            y = self.y[slot] - self.lift - height // 2
+            if self.jitter:
+                y += effects_rng.randint(-self.jitter, self.jitter)
+            rects.append(draw_glyph_text(screen, font, text, colour,
+                                         (self.x[slot] - width // 2 + self.x_offset[slot], y)))
+
+        if advance:
+            self.y[live] -= self.rise
+            self.timer[live] -= 1
+            for slot in live[self.timer[live] <= 0].tolist():
+                self._release(slot)
+        return rects
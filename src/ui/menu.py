@@ -1,6 +1,6 @@
 import src.engine.game_state as game_state
 # ACCESSED FROM MAIN.PY
-from src.ui.menus.in_game_menus import draw_pause_menu, draw_level_up_menu, draw_stats_tab, draw_upgrades_tab
+from src.ui.menus.in_game_menus import draw_pause_menu, draw_level_up_menu, prefetch_level_up_menu, draw_stats_tab, draw_upgrades_tab
 from src.ui.menus.main_menus import draw_main_menu, draw_skin_selection_menu
 
 # Dynamically assign attributes to game_state to satisfy linter type checking
@@ -1,63 +1,141 @@
 import pygame
 import math
+import random
 
 import src.engine.game_state as game_state
 import src.engine.constants as constants
+from src.ui.text_cache import render_text
 from src.engine.helpers import get_ui_scaling_factor, compute_shimmer_surface_for_tab_icon
 from src.ui.components.ui_buttons import Button, IconButton, UpgradeButton
 from src.ui.components.ui_sliders import Slider
 
 ui_scaling_factor = get_ui_scaling_factor()
+_level_up_overlay = None
 
-def draw_level_up_menu(screen):
-    # Create semi-transparent overlay
-    overlay = pygame.Surface((game_state.screen_width, game_state.screen_height))
-    overlay.fill(constants.BLACK)
-    overlay.set_alpha(128)
-    screen.blit(overlay, (0, 0))
-
-    # Get the number of upgrade choices the player should have
-    num_choices = 3  # Default
+def get_level_up_choice_count():
     if any(upgrade.name == "+1 Upgrade Choice" for upgrade in game_state.player.applied_upgrades):
-        num_choices = 4
+        return 4
+    return 3  # Default
 
-    # Create menu panel - using proportional sizes and adjusting width based on number of choices
+def get_level_up_panel_rect(num_choices):
+    # Using proportional sizes and adjusting width based on number of choices
     panel_width = int(game_state.screen_width * (0.65 if num_choices == 3 else 0.85))
     panel_height = int(game_state.screen_height * 0.4)
     panel_x = (game_state.screen_width - panel_width) // 2
     panel_y = (game_state.screen_height - panel_height) // 2
+    return pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+
+def create_upgrade_buttons(upgrades, num_choices):
+    from src.player.upgrades import get_upgrade_icons
+    icon_images = get_upgrade_icons()
+    panel_y = get_level_up_panel_rect(num_choices).y
+
+    # Create buttons with proportional sizes
+    button_width = int(game_state.screen_width * 0.18)  # ~16% of screen width
+    button_height = int(game_state.screen_height * 0.2)  # ~15% of screen height
+    button_spacing = int(game_state.screen_width * 0.023)  # ~2.6% of screen width
     
-    pygame.draw.rect(screen, constants.DARKER_GREY, (panel_x, panel_y, panel_width, panel_height))
-    pygame.draw.rect(screen, constants.BLACK, (panel_x, panel_y, panel_width, panel_height), int(4 * ui_scaling_factor))
+    # Calculate total width of all buttons and spacing
+    total_width = (button_width * num_choices) + (button_spacing * (num_choices - 1))
+    start_x = (game_state.screen_width - total_width) // 2
+
+    buttons = []
+    for i, upgrade in enumerate(upgrades):
+        x = start_x + (button_width + button_spacing) * i
+        y = panel_y + 230 * ui_scaling_factor
+        icon_image = icon_images.get(upgrade.icon, None)
+        buttons.append(UpgradeButton(x, y, button_width, button_height, upgrade, icon_image))
+    return buttons
+
+def get_level_up_offer_key(num_choices):
+    player = game_state.player
+    return (id(player), player.total_upgrade_levels, num_choices, game_state.screen_width, game_state.screen_height)
+
+def is_level_up_offer_current(offer, num_choices, rng_state):
+    """Whether rolling now, from upgrade_rng state `rng_state`, would give exactly `offer`."""
+    return offer is not None and offer["key"] == get_level_up_offer_key(num_choices) and offer["rng_state"] == rng_state
+
+def prefetch_level_up_menu():
+    """
+    Called every frame of play. Once the player has `level_up_prefetch_fraction` of the EXP for the
+    next level, roll the offer on a copy of upgrade_rng and build its buttons and title, then
+    pre-render a few shimmer frames per call. The offer is redone whenever the player's upgrades or upgrade_rng move on.
+    """
+    from src.player.upgrades import get_upgrade_pool, upgrade_rng
+    player = game_state.player
+    if player.player_experience < constants.level_up_prefetch_fraction * player.experience_to_next_level:
+        return
+    num_choices = get_level_up_choice_count()
+    offer = game_state.level_up_offer
+    rng_state = upgrade_rng.getstate()
+    if not is_level_up_offer_current(offer, num_choices, rng_state):
+        rng = random.Random()
+        rng.setstate(rng_state)
+        upgrades = get_upgrade_pool().get_random_upgrades(num_choices, player, rng)
+        game_state.level_up_offer = {
+            "key": get_level_up_offer_key(num_choices),
+            "rng_state": rng_state,
+            "rng_state_after": rng.getstate(),
+            "buttons": create_upgrade_buttons(upgrades, num_choices),
+        }
+        get_level_up_overlay()
+        get_level_up_title(player.player_level + 1)
+        return
+    for button in offer["buttons"]:
+        button.prerender_shimmer(constants.level_up_prefetch_shimmer_frames)
+
+def take_level_up_offer(num_choices):
+    """
+    The prefetched buttons, if they are still exactly what rolling now would give; upgrade_rng is
+    moved on as if they had just been rolled. None otherwise.
+    """
+    from src.player.upgrades import upgrade_rng
+    offer = game_state.level_up_offer
+    game_state.level_up_offer = None
+    if not is_level_up_offer_current(offer, num_choices, upgrade_rng.getstate()):
+        return None
+    upgrade_rng.setstate(offer["rng_state_after"])
+    return offer["buttons"]
+
+def get_level_up_overlay():
+    """The semi-transparent black overlay behind the level-up menu, made once per screen size."""
+    global _level_up_overlay
+    size = (game_state.screen_width, game_state.screen_height)
+    if _level_up_overlay is None or _level_up_overlay.get_size() != size:
+        _level_up_overlay = pygame.Surface(size)
+        _level_up_overlay.fill(constants.BLACK)
+        _level_up_overlay.set_alpha(128)
+    return _level_up_overlay
+
+def get_level_up_title(level):
+    return render_text(game_state.FONTS["large"], f"Level {level} - Choose an Upgrade", constants.WHITE)
+
+def draw_level_up_menu(screen):
+    # Draw semi-transparent overlay
+    screen.blit(get_level_up_overlay(), (0, 0))
+
+    # Get the number of upgrade choices the player should have
+    num_choices = get_level_up_choice_count()
+
+    # Create menu panel
+    panel_rect = get_level_up_panel_rect(num_choices)
+    pygame.draw.rect(screen, constants.DARKER_GREY, panel_rect)
+    pygame.draw.rect(screen, constants.BLACK, panel_rect, int(4 * ui_scaling_factor))
 
     # Level up text
-    text = game_state.FONTS["large"].render(f"Level {game_state.player.player_level} - Choose an Upgrade", True, constants.WHITE)
-    text_rect = text.get_rect(center=(game_state.screen_width // 2, panel_y + 100 * ui_scaling_factor))
+    text = get_level_up_title(game_state.player.player_level)
+    text_rect = text.get_rect(center=(game_state.screen_width // 2, panel_rect.y + 100 * ui_scaling_factor))
     screen.blit(text, text_rect)
 
     # Create buttons if they don't exist or if the list is empty
     if not getattr(game_state, 'current_upgrade_buttons', None) or not game_state.current_upgrade_buttons:
-        # Get random upgrades
-        from src.player.upgrades import UpgradePool
-        upgrade_pool = UpgradePool()
-        upgrades = upgrade_pool.get_random_upgrades(num_choices, game_state.player)
-        
-        # Create buttons with proportional sizes
-        button_width = int(game_state.screen_width * 0.18)  # ~16% of screen width
-        button_height = int(game_state.screen_height * 0.2)  # ~15% of screen height
-        button_spacing = int(game_state.screen_width * 0.023)  # ~2.6% of screen width
-        
-        # Calculate total width of all buttons and spacing
-        total_width = (button_width * num_choices) + (button_spacing * (num_choices - 1))
-        start_x = (game_state.screen_width - total_width) // 2
-
-        game_state.current_upgrade_buttons = []
-        for i, upgrade in enumerate(upgrades):
-            x = start_x + (button_width + button_spacing) * i
-            y = panel_y + 230 * ui_scaling_factor
-            icon_image = upgrade_pool.icon_images.get(upgrade.icon, None)
-            button = UpgradeButton(x, y, button_width, button_height, upgrade, icon_image)
-            game_state.current_upgrade_buttons.append(button)
+        buttons = take_level_up_offer(num_choices)
+        if buttons is None:
+            # Nothing prefetched (e.g. one kill took the player from under 90% EXP to a level), so roll now
+            from src.player.upgrades import get_upgrade_pool
+            upgrades = get_upgrade_pool().get_random_upgrades(num_choices, game_state.player)
+            buttons = create_upgrade_buttons(upgrades, num_choices)
+        game_state.current_upgrade_buttons = buttons
 
     # Draw existing buttons
     for button in game_state.current_upgrade_buttons:
@@ -91,7 +169,7 @@ def draw_pause_menu(screen):
     pygame.draw.rect(screen, constants.BLACK, (panel_x, panel_y, panel_width, panel_height), int(4 * ui_scaling_factor))
 
     # Pause menu title
-    text = game_state.FONTS["large"].render("Pause Menu", True, constants.WHITE)
+    text = render_text(game_state.FONTS["large"], "Pause Menu", constants.WHITE)
     text_rect = text.get_rect(center=(game_state.screen_width // 2, panel_y + int(80 * ui_scaling_factor)))
     screen.blit(text, text_rect)
 
@@ -193,7 +271,7 @@ def draw_pause_menu(screen):
     pygame.draw.rect(screen, constants.BLACK, music_ui['song_display_rect'], 2)
     
     current_song_display = getattr(game_state, 'current_song_display', "No Song")
-    text_surface = game_state.FONTS["small"].render(current_song_display, True, constants.BLACK)
+    text_surface = render_text(game_state.FONTS["small"], current_song_display, constants.BLACK)
     
     padding = 70 * ui_scaling_factor  
     ticker_width = text_surface.get_width() + padding
@@ -270,7 +348,7 @@ def draw_upgrades_tab(screen):
     pygame.draw.rect(screen, constants.BLACK, (panel_x, panel_y, panel_width, panel_height), 2)
 
     # Draw title
-    title_surface = game_state.FONTS["medium"].render("Obtained Upgrades", True, constants.WHITE)
+    title_surface = render_text(game_state.FONTS["medium"], "Obtained Upgrades", constants.WHITE)
     title_rect = title_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + title_height // 2 + 30 * ui_scaling_factor))
     screen.blit(title_surface, title_rect)
 
@@ -294,7 +372,7 @@ def draw_upgrades_tab(screen):
 
         # Draw upgrade name
         display_name = f"{upgrade.name} ({game_state.player.upgrade_levels.get(upgrade.name, 0)}x)"
-        name_surface = game_state.FONTS["small"].render(display_name, True, constants.BLACK)
+        name_surface = render_text(game_state.FONTS["small"], display_name, constants.BLACK)
         name_rect = name_surface.get_rect(center=(x_offset + button_width // 2, current_y_offset + button_height // 2))
         screen.blit(name_surface, name_rect)
 
@@ -324,7 +402,7 @@ def draw_stats_tab(screen):
     pygame.draw.rect(screen, constants.BLACK, (panel_x, panel_y, panel_width, panel_height), int(4 * ui_scaling_factor))
 
     # Draw title at the top
-    title_surface = game_state.FONTS["medium"].render("Player Stats", True, constants.WHITE)
+    title_surface = render_text(game_state.FONTS["medium"], "Player Stats", constants.WHITE)
     title_rect = title_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 60 * ui_scaling_factor))
     screen.blit(title_surface, title_rect)
 
@@ -437,14 +515,14 @@ def draw_stats_tab(screen):
         for i in group_indices:
             header, stat_list = groups[i]
             # Render header
-            header_surface = game_state.FONTS["stat-header"].render(header, True, constants.WHITE)
+            header_surface = render_text(game_state.FONTS["stat-header"], header, constants.WHITE)
             screen.blit(header_surface, (col_x, current_y))
             current_y += game_state.FONTS["stat-header"].get_linesize() + int(4 * ui_scaling_factor)
 
             # Render each stat line (indented slightly)
             for name, value in stat_list:
                 stat_text = f"{name}: {value}"
-                stat_surface = game_state.FONTS["stat-desc"].render(stat_text, True, constants.WHITE)
+                stat_surface = render_text(game_state.FONTS["stat-desc"], stat_text, constants.WHITE)
                 screen.blit(stat_surface, (col_x + 20 * ui_scaling_factor, current_y))
                 current_y += game_state.FONTS["stat-desc"].get_linesize() + 10 * ui_scaling_factor
 
@@ -1,6 +1,7 @@
 import pygame
 
 import src.engine.constants as constants
+from src.ui.text_cache import render_text
 import src.engine.game_state as game_state
 from src.engine.helpers import get_ui_scaling_factor, get_background_image
 from src.ui.components.ui_buttons import Button, SkinButton
@@ -13,7 +14,7 @@ def draw_main_menu(screen):
     screen.blit(bg_image, (0, 0))
     
     # Draw menu title
-    title_text = game_state.FONTS["massive"].render("Gooner Game", True, constants.WHITE)
+    title_text = render_text(game_state.FONTS["massive"], "Gooner Game", constants.WHITE)
     title_rect = title_text.get_rect(center=(game_state.screen_width // 2, game_state.screen_height // 2 - 100))
     screen.blit(title_text, title_rect)
 
@@ -29,7 +30,7 @@ def draw_main_menu(screen):
     quit_button = Button(game_state.screen_width // 2 - 200 * ui_scaling_factor, game_state.screen_height // 2 + 240 * ui_scaling_factor, 400 * ui_scaling_factor, 100 * ui_scaling_factor, "Quit", constants.RED)
     quit_button.draw(screen)
     
-    version_text = game_state.FONTS["small"].render("v0.1.3 - (WIP)", True, constants.BLACK)
+    version_text = render_text(game_state.FONTS["small"], "v0.1.3 - (WIP)", constants.BLACK)
     version_rect = version_text.get_rect(bottomright=(game_state.screen_width - 20 * ui_scaling_factor, game_state.screen_height - 20 * ui_scaling_factor))
     screen.blit(version_text, version_rect)
 
@@ -41,7 +42,7 @@ def draw_skin_selection_menu(screen):
     screen.blit(bg_image, (0, 0))
 
     # Draw title
-    title_surface = game_state.FONTS["huge"].render("Select Your Skin", True, constants.WHITE)
+    title_surface = render_text(game_state.FONTS["huge"], "Select Your Skin", constants.WHITE)
     title_rect = title_surface.get_rect(center=(game_state.screen_width // 2, 100 * ui_scaling_factor))
     screen.blit(title_surface, title_rect)
 
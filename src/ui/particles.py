@@ -0,0 +1,149 @@
+import numpy as np
+import pygame
+
+import src.engine.constants as constants
+from src.engine.rng import stream
+from src.engine.helpers import get_ui_scaling_factor, generate_shades
+from src.ui.render_queue import get_disc
+
+ui_scaling_factor = get_ui_scaling_factor()
+effects_rng = stream("effects")
+
+_palettes = {}  # base colour -> indices into _colours of its shades
+_colours = []  # every shade handed out so far
+_sprites = {}  # (colour index, integer radius) -> (disc, blurred glow)
+
+
+def _palette(base_colour):
+    """The `particle_shades` random shades a base colour's particles pick from, generated on first use."""
+    base_colour = tuple(base_colour)
+    palette = _palettes.get(base_colour)
+    if palette is None:
+        palette = []
+        for _ in range(constants.particle_shades):
+            palette.append(len(_colours))
+            _colours.append(generate_shades(base_colour))
+        _palettes[base_colour] = palette
+    return palette
+
+
+def blur_surface(surface, scale_factor=0.25):
+    """Blur a surface by downscaling then upscaling it (never below 1x1, which smoothscale leaves undefined)."""
+    width, height = surface.get_size()
+    small_surface = pygame.transform.smoothscale(surface, (max(1, int(width * scale_factor)), max(1, int(height * scale_factor))))
+    return pygame.transform.smoothscale(small_surface, (width, height))
+
+
+def _sprite(colour_index, radius):
+    """The disc and additive glow for one shade at one integer radius, baked once."""
+    key = (colour_index, radius)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        colour = _colours[colour_index]
+        glow_surf = pygame.Surface((radius, radius), pygame.SRCALPHA)
+        # A low alpha keeps the glow subtle once it is added on top of the disc.
+        pygame.draw.circle(glow_surf, colour + (50,), (radius, radius), radius)
+        sprite = _sprites[key] = (get_disc(colour, radius, radius * 2), blur_surface(glow_surf))
+    return sprite
+
+
+class ParticleSystem:
+    """
+    Glowing particles that drift and shrink, kept as parallel NumPy arrays with the live ones packed
+    at the front so update() is a handful of array ops over all of them.
+
+    Each particle is a disc plus a blurred glow added on top. Their colour comes from a small
+    palette of shades per base colour, and both sprites are baked once per (shade, integer radius),
+    so draw() only builds one batched list of blits.
+    At most `capacity` particles live at once (the global particle budget); emit() spawns what fits.
+    """
+    def __init__(self, capacity=constants.particle_budget, rng=effects_rng):
+        self.capacity = capacity
+        self.rng = rng
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.int64)
+        self.colour = np.zeros(capacity, dtype=np.int64)  # index into _colours
+        self.owner = np.zeros(capacity, dtype=np.int64)  # id() of the emitter, 0 for none
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, pos, base_colour, count=1, speed=0.5, lifetime=(30, 50), owner=None):
+        """
+        Spawn up to `count` particles at `pos` with a random velocity of up to `speed` on each axis
+        and a random lifetime in frames. Returns how many fit in the budget.
+        """
+        start = self.count
+        count = max(0, min(count, self.capacity - start))
+        if not count:
+            return 0
+        rng = self.rng
+        palette = _palette(base_colour)
+        end = start + count
+        self.x[start:end] = pos[0]
+        self.y[start:end] = pos[1]
+        self.owner[start:end] = 0 if owner is None else id(owner)
+        min_radius, max_radius = int(10 * ui_scaling_factor), int(16 * ui_scaling_factor)
+        for i in range(start, end):
+            self.vx[i] = rng.uniform(-speed, speed)
+            self.vy[i] = rng.uniform(-speed, speed)
+            self.radius[i] = rng.randint(min_radius, max_radius)
+            self.lifetime[i] = rng.randint(*lifetime)
+            self.colour[i] = palette[rng.randrange(len(palette))]
+        self.count = end
+        return count
+
+    def owned_by(self, owner):
+        return int(np.count_nonzero(self.owner[:self.count] == id(owner)))
+
+    def release(self, owner):
+        """Remove every particle `owner` emitted."""
+        self._keep(self.owner[:self.count] != id(owner))
+
+    def _keep(self, keep):
+        kept = int(np.count_nonzero(keep))
+        if kept == self.count:
+            return
+        for array in (self.x, self.y, self.vx, self.vy, self.radius, self.lifetime, self.colour, self.owner):
+            array[:kept] = array[:self.count][keep]
+        self.count = kept
+
+    def update(self):
+        """Move, age and shrink every particle by one frame and drop the ones that are done."""
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.lifetime[:n] -= 1
+        radius = self.radius[:n]
+        np.maximum(radius - 0.1, 0, out=radius)
+        self._keep((self.lifetime[:n] > 0) & (radius > 0))
+
+    def draw(self, screen, render_queue=None):
+        """Blit every particle's disc and glow in one batch, onto `screen` or into `render_queue`."""
+        n = self.count
+        if not n:
+            return
+        radius = self.radius[:n]
+        left = (self.x[:n] - radius).tolist()
+        top = (self.y[:n] - radius).tolist()
+        entries = []
+        for colour_index, size, x, y in zip(self.colour[:n].tolist(), radius.astype(np.int64).tolist(), left, top):
+            if size <= 0:
+                continue
+            disc, glow = _sprite(colour_index, size)
+            entries.append((disc, (x, y)))
+            entries.append((glow, (x, y), None, pygame.BLEND_ADD))
+        if render_queue is not None:
+            render_queue.push_many(entries)
+        else:
+            screen.blits(entries, doreturn=False)
@@ -0,0 +1,58 @@
+import pygame
+
+DISC_CACHE_LIMIT = 4096  # Heart particles come in many random shades; start over rather than grow forever
+
+_disc_cache = {}  # (colour, radius, size) -> pre-rendered disc surface
+
+
+def get_disc(colour, radius, size=None):
+    """
+    A filled circle of integer `radius` in `colour`, centred at (radius, radius) on a
+    transparent square surface of side `size` (large enough for the whole disc by default).
+    Blitting it at (x - radius, y - radius) gives the same pixels as
+    pygame.draw.circle(screen, colour, (x, y), radius).
+    """
+    if size is None:
+        size = radius * 2 + 2
+    key = (colour, radius, size)
+    disc = _disc_cache.get(key)
+    if disc is None:
+        if len(_disc_cache) >= DISC_CACHE_LIMIT:
+            _disc_cache.clear()
+        # A colour-keyed, RLE-accelerated surface blits faster than per-pixel alpha (or draw.circle).
+        colour_key = (255, 0, 255) if tuple(colour[:3]) != (255, 0, 255) else (0, 255, 0)
+        disc = pygame.Surface((size, size))
+        disc.fill(colour_key)
+        pygame.draw.circle(disc, colour, (radius, radius), radius)
+        disc.set_colorkey(colour_key, pygame.RLEACCEL)
+        _disc_cache[key] = disc
+    return disc
+
+
+class RenderQueue:
+    """
+    Collects the blits for one draw layer (enemies, bullets, pickups) and issues them
+    with a single Surface.blits() call when the layer is flushed, in the order they were pushed.
+    The blitted rects are passed on to `dirty_rects` while dirty-rect rendering is on.
+    """
+    def __init__(self, dirty_rects=None):
+        self.entries = []
+        self.dirty_rects = dirty_rects
+
+    def push(self, surface, pos):
+        self.entries.append((surface, pos))
+
+    def push_blended(self, surface, pos, special_flags):
+        self.entries.append((surface, pos, None, special_flags))
+
+    def push_many(self, entries):
+        """Queue ready-made Surface.blits() entries."""
+        self.entries.extend(entries)
+
+    def flush(self, screen):
+        if self.entries:
+            if self.dirty_rects is not None and self.dirty_rects.enabled:
+                self.dirty_rects.add_many(screen.blits(self.entries))
+            else:
+                screen.blits(self.entries, doreturn=False)
+            self.entries.clear()
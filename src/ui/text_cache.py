@@ -0,0 +1,77 @@
+from collections import OrderedDict
+
+import pygame
+
+import src.engine.constants as constants
+
+_text_cache = OrderedDict()  # (font, text, colour, antialias) -> rendered surface, least recently used first
+_glyph_cache = {}  # (font, colour) -> {character: (glyph surface, advance)}
+
+
+def render_text(font, text, colour, antialias=True):
+    """
+    font.render(text, antialias, colour), from an LRU cache of the last `text_cache_limit` strings.
+    Don't draw on the returned surface: it is shared.
+    """
+    colour = tuple(colour)
+    key = (font, text, colour, antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+    surface = font.render(text, antialias, colour)
+    if pygame.display.get_surface():
+        surface = surface.convert_alpha()
+    _text_cache[key] = surface
+    if len(_text_cache) > constants.text_cache_limit:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def _glyphs(font, colour):
+    colour = tuple(colour)
+    glyphs = _glyph_cache.get((font, colour))
+    if glyphs is None:
+        glyphs = _glyph_cache[(font, colour)] = {}
+    return glyphs
+
+
+def _glyph(glyphs, font, colour, character):
+    glyph = glyphs.get(character)
+    if glyph is None:
+        surface = font.render(character, True, colour)
+        if pygame.display.get_surface():
+            surface = surface.convert_alpha()
+        metrics = font.metrics(character)[0]
+        advance = metrics[4] if metrics else surface.get_width()
+        glyph = glyphs[character] = (surface, advance)
+    return glyph
+
+
+def glyph_text_size(font, text, colour):
+    """Width and height of `text` as draw_glyph_text() lays it out."""
+    glyphs = _glyphs(font, colour)
+    width = 0
+    for character in text:
+        width += _glyph(glyphs, font, colour, character)[1]
+    return width, font.get_height()
+
+
+def draw_glyph_text(screen, font, text, colour, topleft):
+    """
+    Draw `text` one pre-rendered glyph at a time, advancing by each glyph's metrics. Meant for
+    numbers that churn through more distinct values than render_text() can keep (damage
+    numbers): once the handful of glyphs is cached it costs only blits, never a render.
+    Returns the rect drawn over.
+    """
+    colour = tuple(colour)
+    glyphs = _glyphs(font, colour)
+    left = x = int(topleft[0])
+    y = int(topleft[1])
+    blits = []
+    for character in text:
+        surface, advance = _glyph(glyphs, font, colour, character)
+        blits.append((surface, (x, y)))
+        x += advance
+    screen.blits(blits, doreturn=False)
+    return pygame.Rect(left, y, x - left, font.get_height()).clip(screen.get_rect())